@@ -10,11 +10,17 @@ import subprocess
 import platform
 import shutil
 
+# Budget for `import main_flet` (cumulative, -X importtime); override with IMPORT_TIME_BUDGET_MS
+IMPORT_TIME_BUDGET_MS = 1500
+
+# Heavy modules that must only be imported when a document is generated
+DEFERRED_IMPORTS = ('weasyprint', 'markdown')
+
 def install_requirements():
     """Install required packages for building"""
     requirements = [
         'pyinstaller',
-        'flet',
+        'flet>=0.28,<0.29',
         'markdown',
         'weasyprint'
     ]
@@ -27,6 +33,47 @@ def install_requirements():
             return False
     return True
 
+def check_import_time():
+    """Fail if importing the GUI entry point got slower or pulls in deferred modules"""
+    budget_ms = int(os.environ.get('IMPORT_TIME_BUDGET_MS', IMPORT_TIME_BUDGET_MS))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import main_flet'],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(f"❌ Importing main_flet failed:\n{result.stderr[-2000:]}")
+        return False
+    
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    cumulative_us = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        cumulative_us[parts[2].strip()] = int(parts[1])
+    
+    total_ms = cumulative_us.get('main_flet', 0) / 1000
+    deferred = sorted(name for name in cumulative_us if name.split('.')[0] in DEFERRED_IMPORTS)
+    slowest = sorted(
+        ((us, name) for name, us in cumulative_us.items() if '.' not in name and name != 'main_flet'),
+        reverse=True
+    )[:5]
+    
+    print(f"Import time main_flet: {total_ms:.0f} ms (budget {budget_ms} ms)")
+    for us, name in slowest:
+        print(f"  {us / 1000:7.1f} ms  {name}")
+    
+    if deferred:
+        print(f"❌ Imported at startup but should be deferred: {', '.join(deferred)}")
+        return False
+    if total_ms > budget_ms:
+        print("❌ Import time budget exceeded")
+        return False
+    print("✅ Import time within budget")
+    return True
+
 def build_executable():
     """Build executable using PyInstaller"""
     system = platform.system().lower()
@@ -131,6 +178,10 @@ def main():
         print("❌ Failed to install requirements")
         return False
     
+    # Guard startup time of the GUI entry point
+    if not check_import_time():
+        return False
+    
     # Create dist directory if it doesn't exist
     os.makedirs('./dist', exist_ok=True)
     
@@ -143,5 +194,7 @@ def main():
         return False
 
 if __name__ == "__main__":
+    if '--check-imports' in sys.argv:
+        sys.exit(0 if check_import_time() else 1)
     success = main()
     sys.exit(0 if success else 1)
@@ -3,19 +3,2040 @@
 Portfolio Document Program - Flet Version
 Een programma voor het beheren van portfolio items voor het TI S4 verantwoordingsdocument.
 """
+import time
+
+# Startup timestamps, written out with --profile-startup (see write_startup_profile)
+STARTUP_MARKS = [("module_start", time.perf_counter())]
+
+
+def mark_startup(name):
+    """Record the time a startup phase finished; later sessions of a server add nothing"""
+    if any(mark == name for mark, _ in STARTUP_MARKS):
+        return
+    STARTUP_MARKS.append((name, time.perf_counter()))
+
+
 import flet as ft
+mark_startup("import_flet")
 import json
 import os
+import re
+import subprocess
 import sys
+import bisect
+import asyncio
 import datetime
+import functools
+import gc
+import gzip
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import types
+import urllib.parse
+import uuid
+import weakref
 import webbrowser
-import markdown
-import weasyprint
 from typing import Dict, List, Optional
+mark_startup("import_stdlib")
+
+
+def new_item_id():
+    """Create a stable identifier for a portfolio item"""
+    return uuid.uuid4().hex
+
+
+def ensure_item_ids(items):
+    """Give every portfolio item an id, returns True if any id was added"""
+    added = False
+    for item in items:
+        if not item.get("id"):
+            item["id"] = new_item_id()
+            added = True
+    return added
+
+
+def safe_filename(text):
+    """Make user input usable as part of a file name"""
+    return re.sub(r"[^\w\- ]", "_", text).strip() or "Student"
+
+
+# The HTML in the document, rewritten to markdown that Flet's Markdown control can show
+PREVIEW_MARKUP = [
+    (re.compile(r"<!--.*?-->"), ""),
+    (re.compile(r"<h2 class='portfolio-header'>(.*?)</h2>"), r"## \1"),
+    (re.compile(r"<div class='no-portfolio-item'>(.*?)</div>"), r"**\1**"),
+    (re.compile(r"<li>(.*?)</li>"), r"- \1"),
+    (re.compile(r"<strong>(.*?)</strong>(.*)"), r"> **\1**\2"),
+    (re.compile(r"<p>(.*?)</p>"), r">\n> \1\n"),
+    (re.compile(r"<br>"), " · "),
+    (re.compile(r'^</?(ul|div)[^>]*>\n?', re.MULTILINE), ""),
+]
+
+
+def preview_markdown(markdown):
+    """Return a document section as markdown without the HTML the PDF styles"""
+    for pattern, replacement in PREVIEW_MARKUP:
+        markdown = pattern.sub(replacement, markdown)
+    return markdown
+
+
+def json_copy(value):
+    """Deep copy a JSON-compatible value"""
+    return json.loads(json.dumps(value))
+
+
+_MISSING = object()
+
+
+def merge_entries(base, local, remote):
+    """Three-way merge of a list of entries such as feedback.
+    
+    Entries added on either side are kept and entries removed on either side
+    stay removed; an edited entry counts as removed and added.
+    """
+    base = base if isinstance(base, list) else []
+    merged = [entry for entry in remote if entry in local or entry not in base]
+    merged += [entry for entry in local if entry not in remote and entry not in base]
+    return merged
+
+
+def merge_record(base, local, remote):
+    """Three-way merge of a single record, returns (value, conflict)
+    
+    When both sides changed a record they are merged field by field; list fields
+    are merged by entry (see merge_entries). A field both sides changed to a
+    different value is a conflict and keeps the value on disk.
+    """
+    if local == remote:
+        return local, False
+    if local == base:
+        return remote, False
+    if remote == base:
+        return local, False
+    if not (isinstance(local, dict) and isinstance(remote, dict)):
+        # Deleted on one side and changed on the other; keep what is on disk
+        return remote, True
+    base = base if isinstance(base, dict) else {}
+    merged = {}
+    conflict = False
+    for key in list(local) + [key for key in remote if key not in local]:
+        base_value, local_value, remote_value = (base.get(key, _MISSING), local.get(key, _MISSING),
+                                                 remote.get(key, _MISSING))
+        if local_value == remote_value or remote_value == base_value:
+            value = local_value
+        elif local_value == base_value:
+            value = remote_value
+        elif isinstance(local_value, list) and isinstance(remote_value, list):
+            value = merge_entries(base_value, local_value, remote_value)
+        else:
+            value = remote_value
+            conflict = True
+        if value is not _MISSING:
+            merged[key] = value
+    return merged, conflict
+
+
+
+def stamp_item_versions(items, base_by_id):
+    """Increase the version of every item that differs from the last saved version
+    
+    base_by_id maps item ids to the items last written. Changed items are
+    replaced by a stamped copy: the undo history holds the item dicts
+    themselves and must keep them as they were. Returns the copies.
+    """
+    stamped = []
+    for position, item in enumerate(items):
+        base = base_by_id.get(item.get("id"))
+        if base is item:
+            continue
+        base_version = base.get("version", 0) if base else 0
+        if base is None or item != base:
+            items[position] = dict(item, version=base_version + 1)
+            stamped.append(items[position])
+    return stamped
+
+
+class FileLock:
+    """Advisory inter-process lock on a companion .lock file"""
+
+    def __init__(self, path):
+        self.lock_path = f"{path}.lock"
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.lock_path, 'a+')
+        if os.name == 'nt':
+            import msvcrt
+            self._file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after ~10 seconds; keep waiting
+                    continue
+        else:
+            import fcntl
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+        return False
+
+class DataFileWatcher:
+    """Poll the data file and report modifications made by other programs"""
+
+    def __init__(self, path, on_change, interval=1.0):
+        self.path = path
+        self.on_change = on_change
+        self.interval = interval
+        self.last_signature = self.file_signature(path)
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def file_signature(path):
+        """Return a cheap fingerprint of the file, or None if it does not exist"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def has_changed(self):
+        """Check whether the file differs from the last known version"""
+        return self.file_signature(self.path) != self.last_signature
+
+    def acknowledge(self):
+        """Mark the current file contents as known (e.g. after our own save)"""
+        self.last_signature = self.file_signature(self.path)
+
+    def start(self):
+        """Start polling in a background thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="data-file-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop polling"""
+        self._stop_event.set()
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            if self.has_changed():
+                try:
+                    self.on_change()
+                except Exception as e:
+                    print(f"ERROR: Verwerken van externe wijziging mislukt: {str(e)}")
+
+
+
+class DraftStore:
+    """Snapshot in-progress form fields to disk in the background so they survive a crash
+    
+    on_settled(form_key) is called from the snapshot thread when the fields of a
+    form stopped changing at other values than the previous time, so views can
+    follow what is typed without a handler per keystroke.
+    """
+
+    def __init__(self, path, interval=2.0, on_settled=None):
+        self.path = path
+        self.interval = interval
+        self.on_settled = on_settled
+        self.drafts = {}
+        self._forms = {}
+        self._initial = {}
+        self._last_seen = {}
+        self._settled = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.drafts = json.load(f)
+            except Exception as e:
+                print(f"ERROR: Laden van concepten mislukt: {str(e)}")
+
+    def track(self, form_key, fields):
+        """Start watching the controls of a form; only one form is visible at a time"""
+        with self._lock:
+            self._forms = {form_key: fields}
+            self._initial = {form_key: {name: control.value for name, control in fields.items()}}
+            self._last_seen = {}
+            self._settled = dict(self._initial)
+
+    def untrack(self):
+        """Stop watching the current form"""
+        with self._lock:
+            self._forms = {}
+            self._initial = {}
+            self._last_seen = {}
+            self._settled = {}
+
+    def restore(self, form_key, fields):
+        """Put a stored draft back into the form controls, returns True if there was one"""
+        draft = self.drafts.get(form_key)
+        if not draft:
+            return False
+        for name, control in fields.items():
+            if name in draft:
+                control.value = draft[name]
+        return True
+
+    def discard(self, form_key):
+        """Forget the draft of a form after it has been saved for real"""
+        with self._lock:
+            self._forms.pop(form_key, None)
+            if self.drafts.pop(form_key, None) is not None:
+                self._dirty = True
+
+    def start(self):
+        """Start the background snapshot thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="draft-store", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the snapshot thread and write any pending drafts"""
+        self._stop_event.set()
+        self.snapshot(force=True)
+
+    def snapshot(self, force=False):
+        """Store form values that stopped changing since the previous tick"""
+        settled = []
+        with self._lock:
+            for form_key, fields in self._forms.items():
+                values = {name: control.value for name, control in fields.items()}
+                if values != self._last_seen.get(form_key) and not force:
+                    # Still being typed in; wait until the next tick (debounce)
+                    self._last_seen[form_key] = values
+                    continue
+                self._last_seen[form_key] = values
+                if values != self._settled.get(form_key):
+                    self._settled[form_key] = values
+                    settled.append(form_key)
+                if values == self._initial.get(form_key):
+                    if self.drafts.pop(form_key, None) is not None:
+                        self._dirty = True
+                elif self.drafts.get(form_key) != values:
+                    self.drafts[form_key] = values
+                    self._dirty = True
+            drafts = json_copy(self.drafts) if self._dirty else None
+            self._dirty = False
+        if drafts is not None:
+            try:
+                temp_file = f"{self.path}.tmp"
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(drafts, f, ensure_ascii=False)
+                os.replace(temp_file, self.path)
+            except Exception as e:
+                print(f"ERROR: Opslaan van concepten mislukt: {str(e)}")
+        if self.on_settled is not None and not force:
+            for form_key in settled:
+                self.on_settled(form_key)
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.snapshot()
+
+
+
+class SearchIndex:
+    """In-memory inverted index from words to the ids of the items containing them.
+    
+    Items are (re)indexed lazily when they are new or their dict/version changed,
+    so edits only cost the work for the edited item.
+    """
+
+    TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+    def __init__(self):
+        self.postings = {}  # word -> set of item ids
+        self.vocabulary = []  # sorted words, for prefix lookups
+        self._new_words = set()
+        self._documents = {}  # item id -> (item dict, version, words)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def tokenize(cls, text):
+        """Split text into lowercase words"""
+        return cls.TOKEN_PATTERN.findall(text.casefold())
+
+    @classmethod
+    def item_words(cls, item):
+        """Return all words of an item, including its feedback and reviewers"""
+        parts = [item.get('title', ''), item.get('description', ''), item.get('github_link', '')]
+        for feedback in item.get('feedback', []):
+            parts.append(feedback.get('text', ''))
+            parts.append(feedback.get('from', ''))
+        return set(cls.tokenize(" ".join(parts)))
+
+    def index_item(self, item):
+        """Add or replace the postings of a single item"""
+        item_id = item.get('id')
+        words = self.item_words(item)
+        previous = self._documents.get(item_id)
+        old_words = previous[2] if previous else set()
+        for word in old_words - words:
+            self._remove_posting(word, item_id)
+        for word in words - old_words:
+            posting = self.postings.get(word)
+            if posting is None:
+                posting = self.postings[word] = set()
+                self._new_words.add(word)
+            posting.add(item_id)
+        self._documents[item_id] = (item, item.get('version'), words)
+
+    def remove_item(self, item_id):
+        """Remove an item from the index"""
+        previous = self._documents.pop(item_id, None)
+        if previous:
+            for word in previous[2]:
+                self._remove_posting(word, item_id)
+
+    def _remove_posting(self, word, item_id):
+        posting = self.postings.get(word)
+        if posting is None:
+            return
+        posting.discard(item_id)
+        if not posting:
+            del self.postings[word]
+            position = bisect.bisect_left(self.vocabulary, word)
+            if position < len(self.vocabulary) and self.vocabulary[position] == word:
+                del self.vocabulary[position]
+
+    def refresh(self, items):
+        """Reindex items that were added or changed and drop removed ones"""
+        with self._lock:
+            seen = set()
+            for item in items:
+                item_id = item.get('id')
+                seen.add(item_id)
+                document = self._documents.get(item_id)
+                if document is None or document[0] is not item or document[1] != item.get('version'):
+                    self.index_item(item)
+            for item_id in [item_id for item_id in self._documents if item_id not in seen]:
+                self.remove_item(item_id)
+            if len(self._new_words) > 256:
+                # Bulk (initial) indexing: one sort is cheaper than many insertions
+                self.vocabulary = sorted(self.postings)
+            else:
+                for word in self._new_words:
+                    position = bisect.bisect_left(self.vocabulary, word)
+                    if word in self.postings and (position == len(self.vocabulary) or self.vocabulary[position] != word):
+                        self.vocabulary.insert(position, word)
+            self._new_words = set()
+
+    def prefix_matches(self, prefix):
+        """Return the ids of items containing a word that starts with prefix"""
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        matches = set()
+        for word in self.vocabulary[start:]:
+            if not word.startswith(prefix):
+                break
+            matches |= self.postings[word]
+        return matches
+
+    def search(self, query):
+        """Return the ids of items matching all words; the last word may be incomplete"""
+        words = self.tokenize(query)
+        if not words:
+            return None
+        with self._lock:
+            candidate_sets = [self.postings.get(word, set()) for word in words[:-1]]
+            candidate_sets.append(self.prefix_matches(words[-1]))
+            candidate_sets.sort(key=len)
+            return set.intersection(*candidate_sets)
+
+
+
+def parse_item_date(value):
+    """Turn a stored date string into a sortable number (0 when missing or invalid)"""
+    try:
+        return datetime.date.fromisoformat(value[:10]).toordinal()
+    except (TypeError, ValueError):
+        return 0
+
+
+class SortIndex:
+    """Per-column sorted lists of (sort key, item id), maintained incrementally.
+    
+    Sort keys are computed once per item version, and switching the sort column
+    or direction just walks another list instead of sorting again. Like the
+    aggregates, the index is told about every added, changed and deleted item
+    and keeps the items by id, so listing them in order never looks at the
+    items that did not change.
+    """
+
+    def __init__(self, key_functions):
+        self.key_functions = key_functions
+        self.sorted_keys = {name: [] for name in key_functions}
+        self._documents = {}  # item id -> (item dict, version, {column: key})
+        self._lock = threading.Lock()
+
+    def _remove(self, item_id, keys):
+        for name, key in keys.items():
+            entries = self.sorted_keys[name]
+            position = bisect.bisect_left(entries, (key, item_id))
+            if position < len(entries) and entries[position] == (key, item_id):
+                del entries[position]
+
+    def update_item(self, item):
+        """Account for an added or changed item"""
+        item_id = item.get('id')
+        with self._lock:
+            document = self._documents.get(item_id)
+            if document is not None and document[0] is item and document[1] == item.get('version'):
+                return
+            keys = {name: key_function(item) for name, key_function in self.key_functions.items()}
+            changed = keys
+            if document is not None:
+                # Columns whose key stayed the same keep their entry (and the key object)
+                old_keys = document[2]
+                keys = {name: old_keys[name] if old_keys[name] == key else key for name, key in keys.items()}
+                changed = {name: key for name, key in keys.items() if key is not old_keys[name]}
+                self._remove(item_id, {name: old_keys[name] for name in changed})
+            self._documents[item_id] = (item, item.get('version'), keys)
+            for name, key in changed.items():
+                bisect.insort(self.sorted_keys[name], (key, item_id))
+
+    def remove_item(self, item_id):
+        """Account for a deleted item"""
+        with self._lock:
+            document = self._documents.pop(item_id, None)
+            if document is not None:
+                self._remove(item_id, document[2])
+
+    def refresh(self, items):
+        """Bring the sorted lists in line with items after a bulk change (load, import, external edit)"""
+        with self._lock:
+            seen = set()
+            added = []
+            for item in items:
+                item_id = item.get('id')
+                seen.add(item_id)
+                document = self._documents.get(item_id)
+                if document is not None and document[0] is item and document[1] == item.get('version'):
+                    continue
+                keys = {name: key_function(item) for name, key_function in self.key_functions.items()}
+                if document is not None:
+                    if document[2] == keys:
+                        self._documents[item_id] = (item, item.get('version'), keys)
+                        continue
+                    self._remove(item_id, document[2])
+                added.append((item_id, keys))
+                self._documents[item_id] = (item, item.get('version'), keys)
+            for item_id in [item_id for item_id in self._documents if item_id not in seen]:
+                self._remove(item_id, self._documents.pop(item_id)[2])
+            for name, entries in self.sorted_keys.items():
+                if len(added) > 256:
+                    # Bulk (initial) load: one sort is cheaper than many insertions
+                    entries.extend((keys[name], item_id) for item_id, keys in added)
+                    entries.sort()
+                else:
+                    for item_id, keys in added:
+                        bisect.insort(entries, (keys[name], item_id))
+
+    def ordered_ids(self, name, ascending=True):
+        """Return the item ids ordered on a column"""
+        with self._lock:
+            ids = [item_id for _, item_id in self.sorted_keys[name]]
+        if not ascending:
+            ids.reverse()
+        return ids
+
+    def ordered_items(self, name, ascending=True):
+        """Return the items ordered on a column"""
+        with self._lock:
+            items = [self._documents[item_id][0] for _, item_id in self.sorted_keys[name]]
+        if not ascending:
+            items.reverse()
+        return items
+
+    def verify(self, items):
+        """Rebuild the index from scratch; returns the columns whose order differs"""
+        expected = SortIndex(self.key_functions)
+        expected.refresh(items)
+        return [name for name in self.sorted_keys
+                if [id(item) for item in self.ordered_items(name)] != [id(item) for item in expected.ordered_items(name)]]
+
+
+
+class PortfolioAggregates:
+    """Running totals over the portfolio items, kept up to date per mutation.
+    
+    Every item's contribution to the totals is remembered by id, so adding,
+    editing or deleting one item (or adding feedback to it) only subtracts its
+    old contribution and adds the new one, independent of the number of items.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._contributions = {}  # item id -> contribution, see contribution()
+        self.items = 0
+        self.group_items = 0
+        self.without_feedback = 0
+        self.feedback = 0
+        self.items_per_lo = {}
+        self.feedback_per_lo = {}
+
+    @property
+    def personal_items(self):
+        return self.items - self.group_items
+
+    @staticmethod
+    def contribution(item):
+        """What one item adds to the totals"""
+        feedback = item.get('feedback') or []
+        feedback_per_lo = {}
+        for entry in feedback:
+            for lo in entry.get('learning_outcomes', []):
+                feedback_per_lo[lo] = feedback_per_lo.get(lo, 0) + 1
+        return (tuple(sorted(set(item.get('learning_outcomes', [])))), bool(item.get('is_group_work', False)),
+                len(feedback), tuple(sorted(feedback_per_lo.items())))
+
+    def _apply(self, contribution, sign):
+        learning_outcomes, is_group_work, feedback_count, feedback_per_lo = contribution
+        self.items += sign
+        self.group_items += sign if is_group_work else 0
+        self.without_feedback += sign if feedback_count == 0 else 0
+        self.feedback += sign * feedback_count
+        for lo in learning_outcomes:
+            self.items_per_lo[lo] = self.items_per_lo.get(lo, 0) + sign
+        for lo, count in feedback_per_lo:
+            self.feedback_per_lo[lo] = self.feedback_per_lo.get(lo, 0) + sign * count
+
+    def update_item(self, item):
+        """Account for an added or changed item"""
+        contribution = self.contribution(item)
+        with self._lock:
+            previous = self._contributions.get(item.get('id'))
+            if previous == contribution:
+                return
+            if previous is not None:
+                self._apply(previous, -1)
+            self._apply(contribution, 1)
+            self._contributions[item.get('id')] = contribution
+
+    def remove_item(self, item_id):
+        """Account for a deleted item"""
+        with self._lock:
+            previous = self._contributions.pop(item_id, None)
+            if previous is not None:
+                self._apply(previous, -1)
+
+    def refresh(self, items):
+        """Bring the totals in line with items after a bulk change (load, import, external edit)"""
+        seen = set()
+        for item in items:
+            seen.add(item.get('id'))
+            self.update_item(item)
+        for item_id in [item_id for item_id in self._contributions if item_id not in seen]:
+            self.remove_item(item_id)
+
+    def totals(self):
+        """The totals as a dict, for comparisons and the debug check"""
+        return {
+            "items": self.items,
+            "group_items": self.group_items,
+            "without_feedback": self.without_feedback,
+            "feedback": self.feedback,
+            "items_per_lo": {lo: count for lo, count in self.items_per_lo.items() if count},
+            "feedback_per_lo": {lo: count for lo, count in self.feedback_per_lo.items() if count},
+        }
+
+    def verify(self, items):
+        """Recompute the totals from scratch; returns the names of totals that differ"""
+        expected = PortfolioAggregates()
+        expected.refresh(items)
+        actual, wanted = self.totals(), expected.totals()
+        return [name for name in wanted if actual[name] != wanted[name]]
+
+
+def popcount(bits):
+    """Number of set bits (int.bit_count needs Python 3.10)"""
+    return bin(bits).count("1")
+
+
+class CoverageMatrix:
+    """Item x learning outcome bitsets behind the progress dashboard.
+    
+    Every item gets a slot number; for each learning outcome there is one int
+    with a bit per slot for "item belongs to this LO", plus one per indicator
+    for "item looks like it covers this indicator". Group work is one more
+    bitset. Counting is a popcount, and an edit only flips the bits of one slot.
+    The learning outcomes whose numbers changed are collected in dirty, so the
+    dashboard can patch just those cards.
+    """
+
+    def __init__(self, learning_outcomes):
+        self._lock = threading.Lock()
+        self.learning_outcomes = learning_outcomes
+        self._indicator_words = {
+            lo: [self.indicator_words(indicator) for indicator in data.get('indicators', [])]
+            for lo, data in learning_outcomes.items()
+        }
+        self._slots = {}  # item id -> slot
+        self._free_slots = []
+        self._rows = {}  # slot -> row, see row()
+        self.lo_bits = {lo: 0 for lo in learning_outcomes}
+        self.indicator_bits = {lo: [0] * len(words) for lo, words in self._indicator_words.items()}
+        self.group_bits = 0
+        self.dirty = set(learning_outcomes)
+
+    @staticmethod
+    def indicator_words(indicator):
+        """Words that must all occur in an item for it to count towards an indicator"""
+        main_part = re.sub(r"\(.*?\)", " ", indicator).lower()
+        return [word for word in re.findall(r"\w+", main_part) if len(word) >= 4]
+
+    def row(self, item):
+        """The bits of one item: (LO mask, group work, per-LO indicator masks)"""
+        text = f"{item.get('title', '')} {item.get('description', '')}".lower()
+        lo_mask = 0
+        indicator_masks = []
+        for lo in sorted(set(item.get('learning_outcomes', []))):
+            if lo not in self._indicator_words:
+                continue
+            lo_mask |= 1 << lo
+            mask = 0
+            for index, words in enumerate(self._indicator_words[lo]):
+                if words and all(word in text for word in words):
+                    mask |= 1 << index
+            indicator_masks.append((lo, mask))
+        return lo_mask, bool(item.get('is_group_work', False)), tuple(indicator_masks)
+
+    def _set_row(self, slot, row, value):
+        lo_mask, is_group_work, indicator_masks = row
+        bit = 1 << slot
+        for lo, mask in indicator_masks:
+            self.lo_bits[lo] = self.lo_bits[lo] | bit if value else self.lo_bits[lo] & ~bit
+            indicators = self.indicator_bits[lo]
+            for index in range(len(indicators)):
+                if mask >> index & 1:
+                    indicators[index] = indicators[index] | bit if value else indicators[index] & ~bit
+        if is_group_work:
+            self.group_bits = self.group_bits | bit if value else self.group_bits & ~bit
+
+    def update_item(self, item, feedback_changed=False):
+        """Set the bits of an added or changed item"""
+        row = self.row(item)
+        with self._lock:
+            slot = self._slots.get(item.get('id'))
+            if slot is None:
+                slot = self._free_slots.pop() if self._free_slots else len(self._slots)
+                self._slots[item.get('id')] = slot
+            previous = self._rows.get(slot)
+            if previous == row:
+                if feedback_changed:
+                    # Feedback counts come from the aggregates, but the card still shows them
+                    self.dirty.update(lo for lo, _ in row[2])
+                return
+            if previous is not None:
+                self._set_row(slot, previous, False)
+                self.dirty.update(lo for lo, _ in previous[2])
+            self._set_row(slot, row, True)
+            self._rows[slot] = row
+            self.dirty.update(lo for lo, _ in row[2])
+
+    def remove_item(self, item_id):
+        """Clear the bits of a deleted item and free its slot"""
+        with self._lock:
+            slot = self._slots.pop(item_id, None)
+            if slot is None:
+                return
+            previous = self._rows.pop(slot)
+            self._set_row(slot, previous, False)
+            self._free_slots.append(slot)
+            self.dirty.update(lo for lo, _ in previous[2])
+
+    def refresh(self, items):
+        """Bring the bitsets in line with items after a bulk change"""
+        seen = set()
+        for item in items:
+            seen.add(item.get('id'))
+            self.update_item(item, feedback_changed=True)
+        for item_id in [item_id for item_id in self._slots if item_id not in seen]:
+            self.remove_item(item_id)
+
+    def mark_dirty(self, los):
+        """Have the next take_dirty() report these learning outcomes as well"""
+        with self._lock:
+            self.dirty.update(los)
+
+    def take_dirty(self):
+        """Return and forget the learning outcomes that changed since the last call"""
+        with self._lock:
+            dirty, self.dirty = self.dirty, set()
+        return dirty
+
+    def counts(self, lo):
+        """(personal items, group items) for a learning outcome"""
+        bits = self.lo_bits[lo]
+        group = popcount(bits & self.group_bits)
+        return popcount(bits) - group, group
+
+    def covered_indicators(self, lo):
+        """One flag per indicator of the learning outcome"""
+        return [bits != 0 for bits in self.indicator_bits[lo]]
+
+
+def patch_items(items, changes):
+    """Apply the (index, before, after) changes of a command to an item list.
+    
+    Removed and replaced items are matched on id. New items are inserted at their
+    index in the resulting list, so undoing a delete puts the item back in place.
+    Returns the new list and the changes that applied; items that were removed
+    or re-added by another program in the meantime are left alone.
+    """
+    if len(changes) <= 100 and all(
+            index < len(items) and items[index].get('id') == before.get('id')
+            for index, before, after in changes if before is not None):
+        # Usual case: the indexes still match, so only the changed positions are touched
+        result = list(items)
+        removals = []
+        for change in changes:
+            index, before, after = change
+            if before is None:
+                continue
+            if after is None:
+                removals.append(index)
+            else:
+                result[index] = after
+        for index in sorted(removals, reverse=True):
+            del result[index]
+        applied = [change for change in changes if change[1] is not None]
+        inserts = [change for change in changes if change[1] is None]
+        if inserts:
+            present = {item.get('id') for item in result}
+            for change in sorted(inserts, key=lambda change: change[0]):
+                if change[2].get('id') not in present:
+                    result.insert(change[0], change[2])
+                    applied.append(change)
+        return result, applied
+    
+    replaced = {}
+    inserts = []
+    for change in changes:
+        index, before, after = change
+        if before is None:
+            inserts.append(change)
+        else:
+            replaced[before.get('id')] = change
+    
+    result = []
+    applied = []
+    present = set()
+    for item in items:
+        item_id = item.get('id')
+        change = replaced.get(item_id)
+        if change is not None:
+            applied.append(change)
+            item = change[2]
+            if item is None:
+                continue
+        present.add(item_id)
+        result.append(item)
+    inserts = [change for change in inserts if change[2].get('id') not in present]
+    if not inserts:
+        return result, applied
+    
+    merged = []
+    position = 0
+    for change in sorted(inserts, key=lambda change: change[0]):
+        take = max(0, change[0] - len(merged))
+        merged.extend(result[position:position + take])
+        position += take
+        merged.append(change[2])
+    merged.extend(result[position:])
+    return merged, applied + inserts
+
+
+def invert_command(command):
+    """The command that undoes command"""
+    return {
+        "items": [(index, after, before) for index, before, after in reversed(command["items"])],
+        "records": {name: (after, before) for name, (before, after) in command["records"].items()}
+    }
+
+
+class CommandLog:
+    """Undo/redo history of data changes, kept as commands.
+    
+    A command holds only what it changed: (index, before, after) per item and
+    (before, after) per record such as student_info. Stored dicts are never
+    changed in place; a mutation puts a new dict in the list instead, so the
+    history shares them with the live data and grows with the size of the
+    changes, not with the size of the portfolio.
+    """
+
+    def __init__(self, limit=500):
+        self.limit = limit
+        self.undo_stack = []
+        self.redo_stack = []
+
+    def record(self, command):
+        """Remember a command that was just executed; it ends the redo history"""
+        self.undo_stack.append(command)
+        del self.undo_stack[:-self.limit]
+        self.redo_stack.clear()
+
+    def undo(self):
+        """Return the command that reverts the last change, or None"""
+        if not self.undo_stack:
+            return None
+        command = self.undo_stack.pop()
+        self.redo_stack.append(command)
+        return invert_command(command)
+
+    def redo(self):
+        """Return the last undone command, or None"""
+        if not self.redo_stack:
+            return None
+        command = self.redo_stack.pop()
+        self.undo_stack.append(command)
+        return command
+
+
+class ViewCache:
+    """LRU of built views that stay mounted (hidden) in a host column.
+    
+    Flet re-sends a whole subtree when it is added to the page again, so cached
+    views are kept on the page and only their visibility is toggled. The number
+    of controls held this way is bounded; the least recently used views are
+    dropped first.
+    """
+
+    def __init__(self, host, max_controls=15000):
+        self.host = host
+        self.max_controls = max_controls
+        self.views = OrderedDict()  # key -> [view, number of controls]
+        self.transient = None
+        self.total_controls = 0
+
+    @staticmethod
+    def count_controls(control):
+        """Count a control and all of its descendants"""
+        count = 0
+        stack = [control]
+        while stack:
+            current = stack.pop()
+            count += 1
+            stack.extend(current._get_children())
+        return count
+
+    def show(self, key, build):
+        """Make the cached view for key visible, building it first if needed"""
+        entry = self.views.get(key)
+        if entry is None:
+            view = build()
+            entry = self.views[key] = [view, 0]
+            self.host.controls.append(view)
+        else:
+            self.views.move_to_end(key)
+        self._hide_all(except_view=entry[0])
+        # Views can grow after they were built (e.g. expanded feedback), so recount
+        size = self.count_controls(entry[0])
+        self.total_controls += size - entry[1]
+        entry[1] = size
+        self._evict()
+        return entry[0]
+
+    def show_transient(self, view):
+        """Show a view that is not cached, such as a form"""
+        self._hide_all()
+        self.transient = view
+        self.host.controls.append(view)
+
+    def _hide_all(self, except_view=None):
+        if self.transient is not None and self.transient in self.host.controls:
+            self.host.controls.remove(self.transient)
+        self.transient = None
+        for view, _ in self.views.values():
+            view.visible = view is except_view
+
+    def _evict(self):
+        while self.total_controls > self.max_controls and len(self.views) > 1:
+            key, (view, size) = self.views.popitem(last=False)
+            self.total_controls -= size
+            if view in self.host.controls:
+                self.host.controls.remove(view)
+
+
+# guard_events hooks into how this Flet release dispatches event handlers
+SUPPORTED_FLET_VERSION = "0.28."
+
+
+class UpdateScheduler:
+    """Coalesces update requests into one page update per frame.
+    
+    Handlers request updates of the controls they changed (or of the whole page)
+    instead of calling page.update() themselves. The first request starts a
+    frame timer; everything requested until it fires is sent in one batch.
+    With PORTFOLIO_UPDATE_STATS=1 every flush prints how many requests it
+    combined and how many bytes were sent.
+    """
+
+    def __init__(self, page, frame_seconds=1 / 60, stats=False):
+        self.page = page
+        self.frame_seconds = frame_seconds
+        self.stats = {"requests": 0, "flushes": 0, "bytes": 0}
+        self._lock = threading.Lock()
+        # Held while Flet walks the control tree and while anything changes controls:
+        # event handlers through guard_events, other threads (data loading, file watcher,
+        # search timer) themselves, always after the data lock of the app.
+        self.tree_lock = threading.RLock()
+        self._local = threading.local()
+        self._controls = {}  # id -> control, in request order
+        self._whole_page = False
+        self._pending_requests = 0
+        self._timer = None
+        self._print_stats = stats
+        if stats:
+            self._count_sent_bytes()
+
+    def request(self, *controls):
+        """Mark controls (or the whole page if none are given) for the next flush"""
+        with self._lock:
+            self.stats["requests"] += 1
+            self._pending_requests += 1
+            if controls:
+                for control in controls:
+                    self._controls.setdefault(id(control), control)
+            else:
+                self._whole_page = True
+            # A guarded event handler flushes itself when it returns
+            if self._timer is None and not getattr(self._local, "in_event", False):
+                self._timer = threading.Timer(self.frame_seconds, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Send all pending updates now"""
+        with self.tree_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                controls = [control for control in self._controls.values() if control.page is not None]
+                whole_page = self._whole_page
+                requests = self._pending_requests
+                self._controls = {}
+                self._whole_page = False
+                self._pending_requests = 0
+            if not requests:
+                return
+            sent_before = self.stats["bytes"]
+            if whole_page:
+                self.page.update()
+            elif controls:
+                self.page.update(*controls)
+            self.stats["flushes"] += 1
+        if self._print_stats:
+            target = "page" if whole_page else f"{len(controls)} control(s)"
+            print(f"UPDATE: {requests} verzoek(en) -> 1 update van {target}, "
+                  f"{self.stats['bytes'] - sent_before} bytes")
+
+    def guard_events(self, data_lock):
+        """Run the event handlers of the page under the data and tree locks
+        
+        Flet calls synchronous handlers through page.run_thread on a pool thread. The
+        wrapper takes the locks in the same order as the background threads and sends
+        the updates the handler requested on that thread before it returns, so no
+        flush walks the tree while a handler is still changing it.
+        
+        Everything the handler does is serialized with the other threads of the
+        session, so handlers stay short; slow work such as rendering a PDF runs on
+        its own thread and takes the locks only to show its result.
+        """
+        if not ft.version.version.startswith(SUPPORTED_FLET_VERSION):
+            raise RuntimeError(f"Flet {ft.version.version} wordt niet ondersteund, installeer "
+                               f"Flet {SUPPORTED_FLET_VERSION}x (zie requirements.txt)")
+        run_thread = type(self.page).run_thread.__get__(self.page)
+        
+        def guarded(handler, *args, **kwargs):
+            def run(*args, **kwargs):
+                with data_lock, self.tree_lock:
+                    self._local.in_event = True
+                    try:
+                        return handler(*args, **kwargs)
+                    finally:
+                        self._local.in_event = False
+                        self.flush()
+            run_thread(run, *args, **kwargs)
+        
+        self.page.run_thread = guarded
+
+    def detach_events(self):
+        """Hand the event handlers of the page back to Flet (the page gets a new app)"""
+        self.page.__dict__.pop("run_thread", None)
+        counters = getattr(self.page.connection, "portfolio_byte_counters", None)
+        if counters is not None and counters.get(self.page.session_id) is self.stats:
+            del counters[self.page.session_id]
+
+    def _count_sent_bytes(self):
+        """Count the size of every batch sent for this page
+        
+        All sessions of a server share one connection, which is wrapped only once;
+        the wrapper adds the bytes to the stats registered for the target session.
+        """
+        connection = self.page.connection
+        if connection is None:
+            return
+        counters = getattr(connection, "portfolio_byte_counters", None)
+        if counters is None:
+            try:
+                from flet.core.protocol import CommandEncoder
+            except ImportError:
+                CommandEncoder = None
+            send_commands = connection.send_commands
+            counters = connection.portfolio_byte_counters = {}
+            
+            def counting_send_commands(target_session_id, commands):
+                stats = counters.get(target_session_id)
+                if stats is not None:
+                    if CommandEncoder is not None:
+                        payload = json.dumps(commands, cls=CommandEncoder, separators=(",", ":"))
+                    else:
+                        payload = json.dumps(commands, default=lambda o: getattr(o, "__dict__", str(o)))
+                    stats["bytes"] += len(payload.encode("utf-8"))
+                return send_commands(target_session_id, commands)
+            
+            connection.send_commands = counting_send_commands
+        # A woken session registers its new scheduler in place of the old one
+        counters[self.page.session_id] = self.stats
+
+
+def read_json_cache(path, name):
+    """Return the dict stored in a cache file; a missing or damaged file is an empty cache"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"INFO: {name} niet gelezen, wordt opnieuw opgebouwd: {str(e)}")
+        return {}
+
+
+def write_file_atomic(path, text):
+    """Replace a file in one step, so readers never see half of it"""
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+class HttpPool:
+    """Pooled keep-alive HTTP clients on their own event loop thread.
+    
+    Callers on any thread share the connections and the per-host limits: at
+    most per_host requests in flight and per_second requests started per host.
+    Every host gets its own client, as one httpx pool slows down with the
+    number of requests queued in it.
+    Rate limited (429) and failing (5xx) requests and connection errors are
+    retried with exponential backoff, honouring Retry-After.
+    """
+
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, per_host=20, per_second=200.0, retries=2, timeout=10.0, backoff=0.5):
+        self.per_host = per_host
+        self.per_second = per_second
+        self.retries = retries
+        self.timeout = timeout
+        self.backoff = backoff
+        self.stats = {"requests": 0, "retries": 0}
+        self._hosts = {}  # host -> {"client", "slots": Semaphore, "next": loop time of the next allowed start}
+        self._loop = None
+        self._start_lock = threading.Lock()
+
+    def run(self, coroutine):
+        """Run a coroutine on the pool's event loop and wait for its result"""
+        self._start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def _start(self):
+        with self._start_lock:
+            if self._loop is not None:
+                return
+            # Imported here: only needed once something is fetched
+            import httpx
+            self._httpx = httpx
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="http-pool", daemon=True).start()
+            self._loop = loop
+
+    async def request(self, method, url, headers=None, read_body=True):
+        """Send a request within the limits of its host and return the response.
+        
+        With read_body=False the body is discarded unread. Raises the last
+        connection error when every attempt failed.
+        """
+        host = urllib.parse.urlsplit(url).netloc.lower()
+        limit = self._hosts.get(host)
+        if limit is None:
+            limit = self._hosts[host] = {
+                "client": self._httpx.AsyncClient(
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                    limits=self._httpx.Limits(max_connections=self.per_host, max_keepalive_connections=self.per_host),
+                    headers={"User-Agent": "PortfolioDocumentManager"}
+                ),
+                "slots": asyncio.Semaphore(self.per_host),
+                "next": 0.0
+            }
+        client = limit["client"]
+        
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            async with limit["slots"]:
+                now = self._loop.time()
+                start = max(now, limit["next"])
+                limit["next"] = start + 1 / self.per_second
+                if start > now:
+                    await asyncio.sleep(start - now)
+                self.stats["requests"] += 1
+                try:
+                    response = await client.send(client.build_request(method, url, headers=headers), stream=True)
+                    if read_body:
+                        await response.aread()
+                    await response.aclose()
+                except self._httpx.TransportError:
+                    if last_attempt:
+                        raise
+                    delay = self.backoff * 2 ** attempt
+                else:
+                    if response.status_code not in self.RETRY_STATUSES or last_attempt:
+                        return response
+                    delay = self.backoff * 2 ** attempt
+                    retry_after = response.headers.get("retry-after", "")
+                    if retry_after.isdigit():
+                        delay = min(30, int(retry_after))
+            self.stats["retries"] += 1
+            await asyncio.sleep(delay)
+
+
+class LinkChecker:
+    """Check links concurrently and remember the results on disk.
+    
+    A result is reused for ttl seconds. After that the link is requested again
+    with If-None-Match / If-Modified-Since, so an unchanged page costs a 304.
+    Results of links that kept failing (time-outs, 5xx) are not remembered.
+    """
+
+    def __init__(self, cache_path, pool=None, ttl=24 * 3600):
+        self.cache_path = cache_path
+        self.pool = pool or HttpPool()
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._cache = None  # url -> result, loaded on the first check
+
+    def check(self, urls):
+        """Return {url: result} for the links; blocks, so call it from a background thread"""
+        with self._lock:
+            if self._cache is None:
+                self._cache = self._load()
+            results, payload = self.pool.run(self._check_all(sorted(set(urls))))
+            write_file_atomic(self.cache_path, payload)
+        return results
+
+    def _load(self):
+        return read_json_cache(self.cache_path, "Linkcache")
+
+    async def _check_all(self, urls):
+        results = await asyncio.gather(*(self._check(url) for url in urls))
+        # Serialised on the loop thread, where the cache is changed
+        return dict(zip(urls, results)), json.dumps(self._cache, separators=(",", ":"))
+
+    async def _check(self, url):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            return {"ok": False, "status": None, "error": "geen geldige link"}
+        
+        now = time.time()
+        cached = self._cache.get(url)
+        if cached is not None and now - cached["checked"] < self.ttl:
+            return cached
+        headers = {}
+        if cached is not None and cached["ok"]:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        
+        try:
+            response = await self.pool.request("HEAD", url, headers)
+            if response.status_code in (405, 501):
+                # Some servers do not answer HEAD
+                response = await self.pool.request("GET", url, headers, read_body=False)
+        except Exception as e:
+            return {"ok": False, "status": None, "error": str(e) or type(e).__name__, "checked": now}
+        
+        if response.status_code == 304 and cached is not None:
+            result = dict(cached, checked=now)
+        else:
+            result = {
+                "ok": response.status_code < 400,
+                "status": response.status_code,
+                "error": None,
+                "checked": now,
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified")
+            }
+        if response.status_code not in HttpPool.RETRY_STATUSES:
+            self._cache[url] = result
+        return result
+
+
+@functools.lru_cache(maxsize=4096)
+def github_repo(link):
+    """Return "owner/repo" for a link into a GitHub repository, or None"""
+    parts = urllib.parse.urlsplit((link or "").strip())
+    if parts.netloc.lower() not in ("github.com", "www.github.com"):
+        return None
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if len(segments) < 2:
+        return None
+    return f"{segments[0]}/{re.sub(r'[.]git$', '', segments[1])}"
+
+
+class RepoHarvester:
+    """Fetch the last commit date and recent activity of GitHub repositories.
+    
+    A repository costs one API request for its latest 100 commit dates. That
+    answer is reused for ttl seconds and then requested again with
+    If-None-Match / If-Modified-Since: a repository without new commits
+    answers 304, which GitHub does not count against the rate limit. The
+    activity is computed from the stored dates, so it stays right as time
+    passes. When the rate limit runs out, the rest of a harvest uses the
+    cached data until the limit resets. api_url can point to GitHub
+    Enterprise or to a local fake API.
+    """
+
+    COMMITS_PATH = "/repos/{repo}/commits?per_page=100"
+
+    def __init__(self, cache_path, api_url=None, token=None, pool=None, ttl=3600):
+        self.cache_path = cache_path
+        self.api_url = (api_url or os.environ.get("PORTFOLIO_GITHUB_API", "https://api.github.com")).rstrip("/")
+        self.token = token if token is not None else os.environ.get("GITHUB_TOKEN")
+        # GitHub asks clients not to send many requests at the same time
+        self.pool = pool or HttpPool(per_host=8, per_second=20.0)
+        self.ttl = ttl
+        self.stats = {"requests": 0, "not_modified": 0, "rate_limited": 0}
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._cache = None  # repo -> {"dates", "etag", "last_modified", "checked"}
+
+    def harvest(self, repos):
+        """Return {repo: {"last_commit", "commits_4_weeks"}} for "owner/repo" names; blocks"""
+        with self._lock:
+            if self._cache is None:
+                self._cache = read_json_cache(self.cache_path, "GitHub cache")
+            dates, payload = self.pool.run(self._harvest_all(sorted(set(repos))))
+            write_file_atomic(self.cache_path, payload)
+        
+        four_weeks_ago = (datetime.date.today() - datetime.timedelta(weeks=4)).isoformat()
+        return {
+            repo: {
+                "last_commit": repo_dates[0] if repo_dates else None,
+                "commits_4_weeks": sum(1 for date in repo_dates if date >= four_weeks_ago) if repo_dates is not None else None
+            }
+            for repo, repo_dates in dates.items()
+        }
+
+    async def _harvest_all(self, repos):
+        # Requests wait here rather than in the pool, so a rate limit seen by one stops the rest
+        self._slots = asyncio.Semaphore(self.pool.per_host)
+        dates = await asyncio.gather(*(self._commit_dates(repo) for repo in repos))
+        return dict(zip(repos, dates)), json.dumps(self._cache, separators=(",", ":"))
+
+    async def _commit_dates(self, repo):
+        """Return the dates (newest first) of the latest commits, from the cache when fresh or unchanged"""
+        cached = self._cache.get(repo)
+        if cached is not None and time.time() - cached["checked"] < self.ttl:
+            return cached["dates"]
+        
+        async with self._slots:
+            now = time.time()
+            if now < self._blocked_until:
+                return cached["dates"] if cached is not None else None
+            headers = {"Accept": "application/vnd.github+json"}
+            if self.token:
+                headers["Authorization"] = f"Bearer {self.token}"
+            if cached is not None:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+            try:
+                self.stats["requests"] += 1
+                response = await self.pool.request("GET", self.api_url + self.COMMITS_PATH.format(repo=repo), headers)
+            except Exception as e:
+                print(f"INFO: GitHub gegevens van {repo} niet opgehaald: {str(e)}")
+                return cached["dates"] if cached is not None else None
+            self._note_rate_limit(response)
+        
+        if response.status_code == 304 and cached is not None:
+            self.stats["not_modified"] += 1
+            cached["checked"] = now
+            return cached["dates"]
+        if response.status_code in (200, 404, 409):
+            # 404: private or removed, 409: empty repository
+            dates = []
+            if response.status_code == 200:
+                for commit in response.json():
+                    details = commit.get("commit", {})
+                    date = (details.get("committer") or details.get("author") or {}).get("date")
+                    if date:
+                        dates.append(date[:10])
+                dates.sort(reverse=True)
+            self._cache[repo] = {
+                "dates": dates,
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+                "checked": now
+            }
+            return dates
+        # Rate limited or failing: try again on the next harvest
+        return cached["dates"] if cached is not None else None
+
+    def _note_rate_limit(self, response):
+        if response.headers.get("x-ratelimit-remaining") != "0":
+            return
+        self.stats["rate_limited"] += 1
+        reset = response.headers.get("x-ratelimit-reset", "")
+        self._blocked_until = float(reset) if reset.isdigit() else time.time() + 60
+
+
+def format_date_nl(iso_date):
+    """Turn 2025-03-12 into 12-03-2025"""
+    return "-".join(reversed(iso_date[:10].split("-")))
+
+
+class GitEvidenceScanner:
+    """Collect commit statistics of local git repositories.
+    
+    Repositories are scanned at the same time in a worker pool, with one
+    git log call each. Results are kept on disk keyed by the HEAD commit,
+    which is read from the .git directory without starting git, so an
+    unchanged repository is never scanned again.
+    """
+
+    def __init__(self, cache_path, workers=None):
+        self.cache_path = cache_path
+        self.workers = workers or min(8, (os.cpu_count() or 1) + 2)
+        self.stats = {"scanned": 0, "cached": 0}
+        self._lock = threading.Lock()
+        self._cache = None  # path -> {"head", "stats"}
+
+    def scan(self, paths):
+        """Return {path: statistics or {"error": text}}; blocks"""
+        with self._lock:
+            if self._cache is None:
+                self._cache = read_json_cache(self.cache_path, "Git cache")
+            results = {}
+            changed = {}
+            for path in set(paths):
+                head = self.head_commit(path)
+                cached = self._cache.get(path)
+                if head is None:
+                    results[path] = {"error": "geen git repository met commits"}
+                elif cached is not None and cached["head"] == head:
+                    results[path] = cached["stats"]
+                    self.stats["cached"] += 1
+                else:
+                    changed[path] = head
+            if not changed:
+                return results
+            
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="git-scan") as pool:
+                for path, stats in zip(changed, pool.map(self.collect, changed)):
+                    results[path] = stats
+                    if "error" not in stats:
+                        self._cache[path] = {"head": changed[path], "stats": stats}
+            self.stats["scanned"] += len(changed)
+            write_file_atomic(self.cache_path, json.dumps(self._cache, separators=(",", ":")))
+        return results
+
+    @staticmethod
+    def head_commit(path):
+        """Return the SHA of HEAD, or None when path is no repository with commits"""
+        git_dir = os.path.join(path, ".git")
+        try:
+            if os.path.isfile(git_dir):
+                # Worktrees and submodules have a file pointing to the real git directory
+                with open(git_dir, 'r', encoding='utf-8') as f:
+                    git_dir = os.path.join(path, f.read().split(":", 1)[1].strip())
+            with open(os.path.join(git_dir, "HEAD"), 'r', encoding='utf-8') as f:
+                head = f.read().strip()
+            if not head.startswith("ref: "):
+                return head  # detached HEAD
+            ref = head[5:]
+            ref_path = os.path.join(git_dir, *ref.split("/"))
+            if os.path.exists(ref_path):
+                with open(ref_path, 'r', encoding='utf-8') as f:
+                    return f.read().strip()
+            with open(os.path.join(git_dir, "packed-refs"), 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.rstrip("\n").endswith(" " + ref):
+                        return line.split(" ", 1)[0]
+        except (OSError, IndexError):
+            pass
+        # Layouts not handled above (shared worktree refs, reftable): ask git
+        if not os.path.isdir(path):
+            return None
+        try:
+            result = subprocess.run(["git", "-C", path, "rev-parse", "--verify", "--quiet", "HEAD"],
+                                    capture_output=True, text=True, timeout=30,
+                                    creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+        except (OSError, subprocess.SubprocessError):
+            return None
+        return result.stdout.strip() or None
+
+    def collect(self, path):
+        """Run git log in a repository and summarise its history"""
+        try:
+            result = subprocess.run(
+                ["git", "-C", path, "log", "--no-color", "--format=%x00%aN%x09%ad", "--date=short", "--numstat", "HEAD"],
+                capture_output=True, text=True, encoding="utf-8", errors="replace", timeout=300,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+        except FileNotFoundError:
+            return {"error": "git is niet geïnstalleerd"}
+        except (OSError, subprocess.SubprocessError) as e:
+            return {"error": str(e)}
+        if result.returncode != 0:
+            return {"error": result.stderr.strip() or "git log mislukt"}
+        
+        commits_per_author = {}
+        dates = []
+        files = set()
+        insertions = deletions = 0
+        for line in result.stdout.splitlines():
+            if line.startswith("\x00"):
+                author, date = line[1:].split("\t", 1)
+                commits_per_author[author] = commits_per_author.get(author, 0) + 1
+                dates.append(date)
+            elif line:
+                added, removed, name = line.split("\t", 2)
+                files.add(name)
+                if added != "-":  # binary files have no line counts
+                    insertions += int(added)
+                    deletions += int(removed)
+        return {
+            "commits": len(dates),
+            "authors": sorted(commits_per_author, key=lambda author: -commits_per_author[author]),
+            "first_commit": min(dates) if dates else None,
+            "last_commit": max(dates) if dates else None,
+            "files_changed": len(files),
+            "insertions": insertions,
+            "deletions": deletions
+        }
+
+
+# Document generation is CPU and memory heavy; a server runs only this many at once
+GENERATION_SLOTS = threading.BoundedSemaphore(int(os.environ.get("PORTFOLIO_MAX_GENERATIONS", "2")))
+
+
+def freeze(value):
+    """Read-only copy of nested dicts and lists, safe to share between sessions and threads"""
+    if isinstance(value, dict):
+        return types.MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+# Language translations
+TRANSLATIONS = freeze({
+    "nl": {
+        "app_title": "Portfolio Document Manager - TI",
+        "menu_about": "Over",
+        "menu_feedback": "Feedback",
+        "menu_main": "Hoofdmenu",
+        "menu_student_info": "Student gegevens wijzigen",
+        "menu_github": "🚧 GitHub inloggegevens (in ontwikkeling)",
+        "menu_github_tooltip": "Functie nog in ontwikkeling",
+        "menu_export": "Data exporteren",
+        "menu_import": "Data importeren",
+        "btn_learning_outcomes": "Leeruitkomsten Info",
+        "btn_all_feedback": "Alle Feedback",
+        "btn_add_item": "Nieuw Portfolio Item Toevoegen",
+        "btn_add_feedback": "Feedback Toevoegen",
+        "btn_submit_document": "Document Inleveren",
+        "tooltip_theme": "Toggle Dark/Light Mode",
+        "tooltip_language": "Schakel Taal",
+        "table_title": "Titel",
+        "table_learning_outcomes": "Leeruitkomsten",
+        "table_type": "Type",
+        "table_date": "Datum",
+        "table_feedback": "Feedback",
+        "table_actions": "Acties",
+        "table_local_repo": "Lokale repo",
+        "local_repo_label": "Lokale repository (optioneel, map met een git clone)",
+        "git_summary": "{0} commits, {1} auteur(s)",
+        "git_not_found": "⚠️ niet gevonden",
+        "btn_back": "Terug naar Overzicht",
+        "portfolio_items_title": "Portfolio Items",
+        "attention_items_without_feedback_single": "Je hebt nog {} portfolio item zonder feedback!",
+        "attention_items_without_feedback_multiple": "Je hebt nog {} portfolio items zonder feedback!",
+        "attention_all_items_have_feedback": "✅ Alle portfolio items hebben feedback!",
+        "type_personal": "Persoonlijk",
+        "type_group": "Groep",
+        "important": "BELANGRIJK",
+        # Student Info page
+        "student_info_title": "Student Gegevens",
+        "student_info": "Student Informatie",
+        "name_label": "Naam student",
+        "student_number_label": "Studentnummer",
+        "semester_label": "Semester (2-8)",
+        "milestone_label": "Peilmoment (1-4)",
+        "save_btn": "Opslaan",
+        "cancel_btn": "Annuleren",
+        "required_fields_error": "⚠️ Vul alle velden in!",
+        # Portfolio Item page
+        "portfolio_item_add_title": "Portfolio Item Toevoegen",
+        "portfolio_item_edit_title": "Portfolio Item Bewerken",
+        "title_label": "Titel *",
+        "select_learning_outcomes": "Selecteer leeruitkomsten:",
+        "assignment_type": "Type opdracht:",
+        "assignment_personal": "Persoonlijk",
+        "assignment_group": "Groepswerk",
+        "group_members_label": "Groepsleden (één per regel)",
+        "github_link_label": "GitHub link *",
+        "description_label": "Korte uitleg van wat je hebt gedaan *",
+        "select_min_one_lo": "⚠️ Selecteer minimaal één leeruitkomst!",
+        "fill_required_fields": "⚠️ Vul alle verplichte velden (*) in!",
+        # Feedback pages
+        "feedback_add_title": "Feedback Toevoegen",
+        "feedback_add_subtitle": "Voeg feedback toe aan een bestaand portfolio item",
+        "no_portfolio_items_title": "Feedback Toevoegen",
+        "no_portfolio_items_msg": "Er zijn nog geen portfolio items om feedback aan toe te voegen.",
+        "no_portfolio_items_hint": "Voeg eerst een portfolio item toe voordat je feedback kunt geven.",
+        "select_portfolio_item": "Selecteer portfolio item",
+        "select_learning_outcomes_feedback": "Selecteer leeruitkomsten voor deze feedback:",
+        "feedback_from_label": "Feedback van (naam docent/begeleider) *",
+        "feedback_text_label": "Feedback tekst *",
+        "save_feedback_btn": "Feedback Opslaan",
+        "select_portfolio_item_error": "⚠️ Selecteer een portfolio item!",
+        "select_min_one_lo_feedback": "⚠️ Selecteer minimaal één leeruitkomst voor de feedback!",
+        "feedback_saved_success": "✅ Feedback succesvol toegevoegd!",
+        "portfolio_item_label": "Portfolio Item:",
+        "add_feedback_to_item": "Voeg feedback toe aan dit portfolio item",
+        # All Feedback page
+        "all_feedback_title": "Alle Feedback Overzicht",
+        "total_items_with_feedback": "Totaal {} portfolio item(s) met feedback",
+        "no_feedback_found": "Geen Feedback Gevonden",
+        "no_feedback_msg": "Er is nog geen feedback toegevoegd aan portfolio items.",
+        "no_feedback_hint": "Voeg eerst feedback toe via de 'Feedback Toevoegen' knop.",
+        "feedback_from": "Van:",
+        "feedback_date": "Datum:",
+        "unknown": "Onbekend",
+        # Document Submission page
+        "submit_document_title": "Document Inleveren",
+        "reflection_questions": "Reflectie Vragen",
+        "proud_of_label": "Waar ik het meest trots op ben:",
+        "struggled_with_label": "Waar ik de afgelopen periode moeite mee heb gehad en welke actie ik heb ondernomen:",
+        "want_to_learn_label": "Wat ik nog graag wil leren en welke actie ik wil gaan ondernemen:",
+        "confirm_complete": "Ik bevestig dat mijn portfolio compleet is en klaar voor inlevering",
+        "generate_markdown": "Ook markdown (.md) bestand genereren",
+        "generate_document_btn": "Document Genereren",
+        "fill_reflection_error": "⚠️ Vul alle reflectie vragen in!",
+        "confirm_complete_error": "⚠️ Bevestig dat je portfolio compleet is!",
+        "document_generated_success": "✅ Document succesvol gegenereerd!",
+        "document_generation_failed": "❌ Document generatie mislukt:",
+        # Delete confirmation
+        "delete_portfolio_item": "Portfolio Item Verwijderen",
+        "delete_confirmation": "Weet je zeker dat je '{}' wilt verwijderen?",
+        "delete_warning": "Deze actie kan niet ongedaan worden gemaakt.",
+        "delete_btn": "Verwijderen",
+        # First time setup
+        "first_time_setup": "Eerste Installatie",
+        "welcome_msg": "Welkom bij de Portfolio Document Manager!",
+        "fill_basic_info": "Vul eerst je basisgegevens in:",
+        "ok_btn": "OK",
+        # Tooltips
+        "edit_tooltip": "Bewerken",
+        "add_feedback_tooltip": "Feedback Toevoegen",
+        "delete_tooltip": "Verwijderen",
+        # Learning Outcomes page
+        "learning_outcomes_title": "Leeruitkomsten Informatie",
+        "learning_outcomes_subtitle": "Detailinformatie over alle leeruitkomsten",
+        "description_label_lo": "Beschrijving:",
+        "indicators_label": "Indicatoren:",
+        "examples_label": "Voorbeelden van opdrachten:",
+        # About page
+        "about_title": "Over Portfolio Document Manager",
+        "version_label": "Versie: 1.5.6",
+        "about_description": "Een moderne desktop applicatie voor het beheren van portfolio documenten",
+        "developed_by": "Ontwikkeld door:",
+        "copyright": "© 2025 Rick van der Voort - Portfolio Document Manager",
+        # Feedback Info page
+        "feedback_info_title": "Feedback over de App",
+        "improve_app": "Verbeter de Portfolio Document Manager!",
+        "feedback_help": "Jouw feedback helpt ons de app te verbeteren. Deel je ervaringen, suggesties en bug reports.",
+        "how_to_give_feedback": "Hoe kan je feedback geven?",
+        "share_experience": "• Deel je ervaring met de app",
+        "report_bugs": "• Rapporteer bugs of problemen", 
+        "suggest_features": "• Suggereer nieuwe functies",
+        "ux_tips": "• Geef tips voor betere gebruikerservaring",
+        "feedback_categories": "Feedback categorieën:",
+        "bug_report": "🐛 Bug Report - Meld een probleem",
+        "feature_request": "💡 Feature Request - Suggereer een nieuwe functie",
+        "documentation": "📖 Documentatie - Verbeter de handleiding",
+        "ui_ux": "🎨 UI/UX - Design en gebruiksvriendelijkheid",
+        "performance": "⚡ Performance - Snelheid en prestaties",
+        "give_feedback": "Geef feedback:",
+        "feedback_github_link": "📝 Feedback Geven via GitHub Issues",
+        "thanks_msg": "Bedankt voor je bijdrage aan het verbeteren van de app!",
+        # GitHub setup
+        "github_integration": "GitHub Integratie",
+        "feature_development": "Functie in Ontwikkeling",
+        "github_under_development": "GitHub integratie is momenteel nog in ontwikkeling.",
+        "feature_future_version": "Deze functie wordt toegevoegd in een toekomstige versie.",
+        # Additional UI text
+        "no_title": "Geen titel",
+        "no_date": "Geen datum",
+        "no_feedback": "Geen feedback",
+        # Additional error messages and status texts
+        "document_generate_btn": "Document Genereren",
+        "document_generated": "Document gegenereerd",
+        "error_occurred": "Er is een fout opgetreden",
+        "data_exported": "Data geëxporteerd",
+        "data_imported": "Data geïmporteerd",
+        # Additional feedback view texts
+        "feedback_for_item": "Feedback voor item:",
+        "add_feedback_specific": "Voeg feedback toe aan dit item",
+        "feedback_overview": "Feedback overzicht",
+        "items_count": "items",
+        "with_feedback": "met feedback",
+        # Learning Outcome Tab Header
+        "learning_outcome": "Leeruitkomst",
+        # External data changes
+        "data_conflict_title": "Conflicterende Wijzigingen",
+        "data_conflict_msg": "Het databestand is buiten de app gewijzigd terwijl jij dezelfde gegevens aanpaste:",
+        "data_conflict_hint": "De externe versie is nu actief. Kies welke versie je wilt behouden.",
+        "keep_mine_btn": "Mijn versie behouden",
+        "keep_external_btn": "Externe versie gebruiken",
+        # Draft autosave
+        "draft_restored": "💾 Niet opgeslagen invoer is hersteld.",
+        "table_page_info": "{}–{} van {}",
+        "show_feedback": "Toon feedback ({})",
+        "hide_feedback": "Verberg feedback ({})",
+        "search_hint": "Zoek in titels, beschrijvingen, links en feedback...",
+        "filter_all": "Alle",
+        "filter_without_feedback": "Zonder feedback",
+        "loading_data": "Gegevens laden…",
+        "btn_dashboard": "Voortgang",
+        "dashboard_title": "Portfolio Voortgang",
+        "dashboard_subtitle": "Per leeruitkomst: aantal items, feedback en welke indicatoren al gedekt lijken",
+        "dashboard_personal": "Persoonlijk",
+        "dashboard_group": "Groep",
+        "dashboard_feedback": "Feedback",
+        "selection_count": "{} geselecteerd",
+        "bulk_change_los": "Leeruitkomsten wijzigen",
+        "bulk_change_type": "Type wijzigen",
+        "bulk_add_feedback": "Feedback toevoegen",
+        "bulk_clear_selection": "Selectie opheffen",
+        "bulk_delete_confirm": "Weet je zeker dat je {} items wilt verwijderen? Je kunt dit ongedaan maken met Ctrl+Z.",
+        "bulk_feedback_lo": "Leeruitkomst van de feedback",
+        "apply_btn": "Toepassen",
+        "tooltip_undo": "Ongedaan maken (Ctrl+Z)",
+        "tooltip_redo": "Opnieuw (Ctrl+Y)",
+        "session_paused": "Deze sessie is gepauzeerd omdat ze een tijd niet gebruikt is. Klik om verder te gaan.",
+        "preview_title": "Voorbeeld van het document",
+        "preview_hint": "Wordt bijgewerkt terwijl je typt; de PDF wordt pas gemaakt als je het document genereert",
+        "menu_check_links": "🔗 GitHub links controleren",
+        "links_title": "GitHub links",
+        "links_checking": "{0} links worden gecontroleerd...",
+        "links_summary": "{0} links gecontroleerd: {1} werken, {2} werken niet. {3} items hebben geen link.",
+        "links_all_ok": "Alle links werken.",
+        "link_missing": "geen link"
+    },
+    "en": {
+        "app_title": "Portfolio Document Manager - TI",
+        "menu_about": "About",
+        "menu_feedback": "Feedback",
+        "menu_main": "Main Menu",
+        "menu_student_info": "Change student information",
+        "menu_github": "🚧 GitHub credentials (under development)",
+        "menu_github_tooltip": "Feature under development",
+        "menu_export": "Export data",
+        "menu_import": "Import data",
+        "btn_learning_outcomes": "Learning Outcomes Info",
+        "btn_all_feedback": "All Feedback",
+        "btn_add_item": "Add New Portfolio Item",
+        "btn_add_feedback": "Add Feedback",
+        "btn_submit_document": "Submit Document",
+        "tooltip_theme": "Toggle Dark/Light Mode",
+        "tooltip_language": "Switch Language",
+        "table_title": "Title",
+        "table_learning_outcomes": "Learning Outcomes",
+        "table_type": "Type",
+        "table_date": "Date",
+        "table_feedback": "Feedback",
+        "table_actions": "Actions",
+        "table_local_repo": "Local repo",
+        "local_repo_label": "Local repository (optional, folder with a git clone)",
+        "git_summary": "{0} commits, {1} author(s)",
+        "git_not_found": "⚠️ not found",
+        "btn_back": "Back to Overview",
+        "portfolio_items_title": "Portfolio Items",
+        "attention_items_without_feedback_single": "You still have {} portfolio item without feedback!",
+        "attention_items_without_feedback_multiple": "You still have {} portfolio items without feedback!",
+        "attention_all_items_have_feedback": "✅ All portfolio items have feedback!",
+        "type_personal": "Personal",
+        "type_group": "Group",
+        "important": "IMPORTANT",
+        # Student Info page
+        "student_info_title": "Student Information",
+        "student_info": "Student Information",
+        "name_label": "Student name",
+        "student_number_label": "Student number",
+        "semester_label": "Semester (2-8)",
+        "milestone_label": "Milestone (1-4)",
+        "save_btn": "Save",
+        "cancel_btn": "Cancel",
+        "required_fields_error": "⚠️ Please fill in all fields!",
+        # Portfolio Item page
+        "portfolio_item_add_title": "Add Portfolio Item",
+        "portfolio_item_edit_title": "Edit Portfolio Item",
+        "title_label": "Title *",
+        "select_learning_outcomes": "Select learning outcomes:",
+        "assignment_type": "Assignment type:",
+        "assignment_personal": "Personal",
+        "assignment_group": "Group work",
+        "group_members_label": "Group members (one per line)",
+        "github_link_label": "GitHub link *",
+        "description_label": "Brief explanation of what you did *",
+        "select_min_one_lo": "⚠️ Select at least one learning outcome!",
+        "fill_required_fields": "⚠️ Please fill in all required fields (*)!",
+        # Feedback pages
+        "feedback_add_title": "Add Feedback",
+        "feedback_add_subtitle": "Add feedback to an existing portfolio item",
+        "no_portfolio_items_title": "Add Feedback",
+        "no_portfolio_items_msg": "There are no portfolio items yet to add feedback to.",
+        "no_portfolio_items_hint": "Please add a portfolio item first before you can give feedback.",
+        "select_portfolio_item": "Select portfolio item",
+        "select_learning_outcomes_feedback": "Select learning outcomes for this feedback:",
+        "feedback_from_label": "Feedback from (teacher/supervisor name) *",
+        "feedback_text_label": "Feedback text *",
+        "save_feedback_btn": "Save Feedback",
+        "select_portfolio_item_error": "⚠️ Please select a portfolio item!",
+        "select_min_one_lo_feedback": "⚠️ Select at least one learning outcome for the feedback!",
+        "feedback_saved_success": "✅ Feedback successfully added!",
+        "portfolio_item_label": "Portfolio Item:",
+        "add_feedback_to_item": "Add feedback to this portfolio item",
+        # All Feedback page
+        "all_feedback_title": "All Feedback Overview",
+        "total_items_with_feedback": "Total {} portfolio item(s) with feedback",
+        "no_feedback_found": "No Feedback Found",
+        "no_feedback_msg": "No feedback has been added to portfolio items yet.",
+        "no_feedback_hint": "Please add feedback first via the 'Add Feedback' button.",
+        "feedback_from": "From:",
+        "feedback_date": "Date:",
+        "unknown": "Unknown",
+        # Document Submission page
+        "submit_document_title": "Submit Document",
+        "reflection_questions": "Reflection Questions",
+        "proud_of_label": "What I am most proud of:",
+        "struggled_with_label": "What I struggled with during this period and what action I took:",
+        "want_to_learn_label": "What I still want to learn and what action I want to take:",
+        "confirm_complete": "I confirm that my portfolio is complete and ready for submission",
+        "generate_markdown": "Also generate markdown (.md) file",
+        "generate_document_btn": "Generate Document",
+        "fill_reflection_error": "⚠️ Please answer all reflection questions!",
+        "confirm_complete_error": "⚠️ Please confirm that your portfolio is complete!",
+        "document_generated_success": "✅ Document successfully generated!",
+        "document_generation_failed": "❌ Document generation failed:",
+        # Delete confirmation
+        "delete_portfolio_item": "Delete Portfolio Item",
+        "delete_confirmation": "Are you sure you want to delete '{}'?",
+        "delete_warning": "This action cannot be undone.",
+        "delete_btn": "Delete",
+        # First time setup
+        "first_time_setup": "First Time Setup",
+        "welcome_msg": "Welcome to the Portfolio Document Manager!",
+        "fill_basic_info": "Please fill in your basic information first:",
+        "ok_btn": "OK",
+        # Tooltips
+        "edit_tooltip": "Edit",
+        "add_feedback_tooltip": "Add Feedback",
+        "delete_tooltip": "Delete",
+        # Learning Outcomes page
+        "learning_outcomes_title": "Learning Outcomes Information",
+        "learning_outcomes_subtitle": "Detailed information about all learning outcomes",
+        "description_label_lo": "Description:",
+        "indicators_label": "Indicators:",
+        "examples_label": "Examples of assignments:",
+        # About page
+        "about_title": "About Portfolio Document Manager",
+        "version_label": "Version: 1.5.6",
+        "about_description": "A modern desktop application for managing portfolio documents",
+        "developed_by": "Developed by:",
+        "copyright": "© 2025 Rick van der Voort - Portfolio Document Manager",
+        # Feedback Info page
+        "feedback_info_title": "Feedback about the App",
+        "improve_app": "Improve the Portfolio Document Manager!",
+        "feedback_help": "Your feedback helps us improve the app. Share your experiences, suggestions and bug reports.",
+        "how_to_give_feedback": "How can you give feedback?",
+        "share_experience": "• Share your experience with the app",
+        "report_bugs": "• Report bugs or problems",
+        "suggest_features": "• Suggest new features",
+        "ux_tips": "• Give tips for better user experience",
+        "feedback_categories": "Feedback categories:",
+        "bug_report": "🐛 Bug Report - Report a problem",
+        "feature_request": "💡 Feature Request - Suggest a new feature",
+        "documentation": "📖 Documentation - Improve the manual",
+        "ui_ux": "🎨 UI/UX - Design and usability",
+        "performance": "⚡ Performance - Speed and performance",
+        "give_feedback": "Give feedback:",
+        "feedback_github_link": "📝 Give Feedback via GitHub Issues",
+        "thanks_msg": "Thank you for your contribution to improving the app!",
+        # GitHub setup
+        "github_integration": "GitHub Integration",
+        "feature_development": "Feature in Development",
+        "github_under_development": "GitHub integration is currently under development.",
+        "feature_future_version": "This feature will be added in a future version.",
+        # Additional UI text
+        "no_title": "Geen titel",
+        "no_date": "Geen datum",
+        "no_feedback": "Geen feedback",
+        # Additional error messages and status texts
+        "document_generate_btn": "Document Genereren",
+        "document_generated": "Document gegenereerd",
+        "error_occurred": "Er is een fout opgetreden",
+        "data_exported": "Data geëxporteerd",
+        "data_imported": "Data geïmporteerd",
+        # Additional feedback view texts
+        "feedback_for_item": "Feedback voor item:",
+        "add_feedback_specific": "Voeg feedback toe aan dit item",
+        "feedback_overview": "Feedback overzicht",
+        "items_count": "items",
+        "with_feedback": "met feedback",
+        # Learning Outcome Tab Header
+        "learning_outcome": "Leeruitkomst",
+        # External data changes
+        "data_conflict_title": "Conflicting Changes",
+        "data_conflict_msg": "The data file was changed outside the app while you edited the same data:",
+        "data_conflict_hint": "The external version is now active. Choose which version to keep.",
+        "keep_mine_btn": "Keep my version",
+        "keep_external_btn": "Use external version",
+        # Draft autosave
+        "draft_restored": "💾 Unsaved input has been restored.",
+        "table_page_info": "{}–{} of {}",
+        "show_feedback": "Show feedback ({})",
+        "hide_feedback": "Hide feedback ({})",
+        "search_hint": "Search titles, descriptions, links and feedback...",
+        "filter_all": "All",
+        "filter_without_feedback": "Without feedback",
+        "loading_data": "Loading data…",
+        "btn_dashboard": "Progress",
+        "dashboard_title": "Portfolio Progress",
+        "dashboard_subtitle": "Per learning outcome: number of items, feedback and which indicators look covered",
+        "dashboard_personal": "Personal",
+        "dashboard_group": "Group",
+        "dashboard_feedback": "Feedback",
+        "selection_count": "{} selected",
+        "bulk_change_los": "Change learning outcomes",
+        "bulk_change_type": "Change type",
+        "bulk_add_feedback": "Add feedback",
+        "bulk_clear_selection": "Clear selection",
+        "bulk_delete_confirm": "Are you sure you want to delete {} items? You can undo this with Ctrl+Z.",
+        "bulk_feedback_lo": "Learning outcome of the feedback",
+        "apply_btn": "Apply",
+        "tooltip_undo": "Undo (Ctrl+Z)",
+        "tooltip_redo": "Redo (Ctrl+Y)",
+        "session_paused": "This session was paused because it was not used for a while. Click to continue.",
+        "preview_title": "Document preview",
+        "preview_hint": "Updates while you type; the PDF is only created when you generate the document",
+        "menu_check_links": "🔗 Check GitHub links",
+        "links_title": "GitHub links",
+        "links_checking": "Checking {0} links...",
+        "links_summary": "{0} links checked: {1} work, {2} do not. {3} items have no link.",
+        "links_all_ok": "All links work.",
+        "link_missing": "no link"
+    }
+})
+
+
+# Learning outcomes definitions
+LEARNING_OUTCOMES = freeze({
+    1: {
+        "title": "Analyseren",
+        "description": "Student analyseert de vereisten en doelstellingen van de opdrachtgever betreffende een 'Digital Twin' van een bestaand embedded systeem. Op basis hiervan en rekening houdend met de mogelijke gebruikers deduceert de student requirements volgens een voorgeschreven methode.",
+        "indicators": ["Requirements analyse", "Stakeholder analyse", "Testplan", "Ontwikkeldocument (eerste deel)"],
+        "examples": ["Stakeholder interviews", "Use case diagrammen", "Requirements specification document", "Functional requirements lijst"]
+    },
+    2: {
+        "title": "Ontwerpen", 
+        "description": "Student ontwerpt gebaseerd op de requirements en volgens voorgeschreven methoden een 'Digital Twin', inclusief grafische representatie, van een bestaand embedded systeem. Dit ontwerp omvat ook een ontwerp voor teststrategieën.",
+        "indicators": ["Testverslag", "Ontwikkeldocument"],
+        "examples": ["UML diagrammen", "Architectuur ontwerp", "Database design", "UI/UX mockups", "Testplan ontwerp"]
+    },
+    3: {
+        "title": "Adviseren",
+        "description": "Student adviseert de opdrachtgever, na analyse van de vereisten en doelstellingen, over de inzet van een digital twin. Het advies is helder onderbouwd en gepresenteerd, zodat het begrijpelijk is voor alle stakeholders/betrokkenen.",
+        "indicators": ["Adviesrapport", "Advies presentatie"],
+        "examples": ["Technisch adviesrapport", "Kosten-baten analyse", "Risico analyse", "Implementatie roadmap", "Stakeholder presentaties"]
+    },
+    4: {
+        "title": "Realiseren",
+        "description": "Student realiseert vanuit het ontwerp een 'Digital Twin' van een bestaand embedded systeem, inclusief grafische representatie. Hierbij wordt gewerkt volgens een voorgeschreven methode waarin testen centraal staat.",
+        "indicators": ["Broncode simulatie", "Projectcode", "Vision opdrachten", "Algoritmiek opdrachten", "C++ STL opdrachten", "C++<->Python opdrachten", "Creational/Structural design pattern opdrachten"],
+        "examples": ["Working prototype", "Code repositories", "Unit tests", "Integration tests", "Performance benchmarks", "Design patterns implementatie"]
+    },
+    5: {
+        "title": "Beheren",
+        "description": "Student zet een professionele ontwikkelomgeving op voor desktop development. Daarbij houdt hij rekening met de samenwerking tussen verschillende programmeertalen. De desktop debugging wordt op een gestructureerde manier uitgevoerd.",
+        "indicators": ["Ontwikkeldocument", "Opdrachten ontwikkelomgeving", "Opdrachten debugging/tooling", "Testverslag"],
+        "examples": ["Version control (Git)", "CI/CD pipelines", "Code reviews", "Debugging sessies", "Development environment setup", "Tool configuration"]
+    },
+    6: {
+        "title": "Toekomstgericht organiseren",
+        "description": "De student kan een probleem vertalen naar een product door randvoorwaarden en requirements op te stellen in overleg met de opdrachtgever. Het project wordt gestructureerd opgezet, uitgevoerd en opgeleverd.",
+        "indicators": ["Ontwikkeldocument", "Scrum board", "Sprintverslagen"],
+        "examples": ["Sprint planning", "Daily standups", "Sprint reviews", "Retrospectives", "Product backlog management", "Project roadmap"]
+    },
+    7: {
+        "title": "Doelgericht interacteren",
+        "description": "De student onderhoudt actief de relatie met relevante samenwerkingspartners door middel van het geven van weloverwogen presentaties die afgestemd zijn op de doelgroep.",
+        "indicators": ["Onderzoeksverslag(deepdive)", "Adviespresentatie", "Sprintverslagen (review)"],
+        "examples": ["Stakeholder meetings", "Demo presentaties", "Technical documentation", "Team communication", "Client feedback sessions"]
+    },
+    8: {
+        "title": "Persoonlijk leiderschap",
+        "description": "De student bereidt zich voor op studie- en loopbaankeuzes. De student evalueert hierbij persoonlijke ambities en kwaliteiten in relatie tot de gewenste positionering in het werkveld.",
+        "indicators": ["Sollicitatiebrief", "Professionaliseringsdocument"],
+        "examples": ["Personal development plan", "Career vision document", "Self-reflection reports", "Professional network building", "Skills assessment"]
+    },
+    9: {
+        "title": "Onderzoek probleem oplossen",
+        "description": "De student kan een praktijkgericht probleem identificeren en de juiste oplossingsrichting kiezen door wensen van de opdrachtgever centraal te stellen. Gedurende het proces handelt de student onderzoekend.",
+        "indicators": ["Onderzoeksverslag (deepdive)", "Ontwikkeldocument"],
+        "examples": ["Literature review", "Proof of concept", "Experimental setup", "Data analysis", "Research methodology", "Problem statement definition"]
+    }
+})
 
 
 class PortfolioManager:
-    def __init__(self, page: ft.Page):
+    def __init__(self, page: ft.Page, data_dir="", download_url=None, link_checker=None, repo_harvester=None,
+                 local_repos=True, download_dir=None):
+        mark_startup("init_start")
         self.page = page
         self.page.title = "Portfolio Document Manager - TI"
         self.page.theme_mode = ft.ThemeMode.LIGHT
@@ -30,480 +2051,293 @@ class PortfolioManager:
         self.page.window_maximizable = True
         self.page.window_minimizable = True
         
-        # Data storage
-        self.data_file = "portfolio_data.json"
+        # Data storage; in server mode every user has an own data_dir
+        self.data_dir = data_dir
+        # Generated documents go to download_dir; a server serves only that directory, at download_url
+        self.download_dir = download_dir or data_dir
+        self.download_url = download_url
+        # A server passes one checker, so all sessions share its connections and cache
+        self.link_checker = link_checker or LinkChecker(os.path.join(data_dir, "link_cache.json"))
+        self.repo_harvester = repo_harvester or RepoHarvester(os.path.join(data_dir, "github_cache.json"))
+        self.repo_activity = {}  # "owner/repo" -> last commit and activity, for the evidence table
+        # A server must not run git on paths its users type in, so it has no scanner
+        self.git_scanner = GitEvidenceScanner(os.path.join(data_dir, "git_cache.json")) if local_repos else None
+        self.git_evidence = {}  # local repository path -> commit statistics
+        self._git_scan_thread = None
+        self._harvest_thread = None
+        self.data_file = os.path.join(data_dir, "portfolio_data.json")
         self.student_info = {}
         self.portfolio_items = []
         self.reflection_data = {}
         self.current_language = "nl"  # Default to Dutch
+        self._translation_bindings = weakref.WeakKeyDictionary()  # control -> {attribute: key}
         
-        # Language translations
-        self.translations = {
-            "nl": {
-                "app_title": "Portfolio Document Manager - TI",
-                "menu_about": "Over",
-                "menu_feedback": "Feedback",
-                "menu_main": "Hoofdmenu",
-                "menu_student_info": "Student gegevens wijzigen",
-                "menu_github": "🚧 GitHub inloggegevens (in ontwikkeling)",
-                "menu_github_tooltip": "Functie nog in ontwikkeling",
-                "menu_export": "Data exporteren",
-                "menu_import": "Data importeren",
-                "btn_learning_outcomes": "Leeruitkomsten Info",
-                "btn_all_feedback": "Alle Feedback",
-                "btn_add_item": "Nieuw Portfolio Item Toevoegen",
-                "btn_add_feedback": "Feedback Toevoegen",
-                "btn_submit_document": "Document Inleveren",
-                "tooltip_theme": "Toggle Dark/Light Mode",
-                "tooltip_language": "Schakel Taal",
-                "table_title": "Titel",
-                "table_learning_outcomes": "Leeruitkomsten",
-                "table_type": "Type",
-                "table_date": "Datum",
-                "table_feedback": "Feedback",
-                "table_actions": "Acties",
-                "btn_back": "Terug naar Overzicht",
-                "portfolio_items_title": "Portfolio Items",
-                "attention_items_without_feedback_single": "Je hebt nog {} portfolio item zonder feedback!",
-                "attention_items_without_feedback_multiple": "Je hebt nog {} portfolio items zonder feedback!",
-                "attention_all_items_have_feedback": "✅ Alle portfolio items hebben feedback!",
-                "type_personal": "Persoonlijk",
-                "type_group": "Groep",
-                "important": "BELANGRIJK",
-                # Student Info page
-                "student_info_title": "Student Gegevens",
-                "student_info": "Student Informatie",
-                "name_label": "Naam student",
-                "student_number_label": "Studentnummer",
-                "semester_label": "Semester (2-8)",
-                "milestone_label": "Peilmoment (1-4)",
-                "save_btn": "Opslaan",
-                "cancel_btn": "Annuleren",
-                "required_fields_error": "⚠️ Vul alle velden in!",
-                # Portfolio Item page
-                "portfolio_item_add_title": "Portfolio Item Toevoegen",
-                "portfolio_item_edit_title": "Portfolio Item Bewerken",
-                "title_label": "Titel *",
-                "select_learning_outcomes": "Selecteer leeruitkomsten:",
-                "assignment_type": "Type opdracht:",
-                "assignment_personal": "Persoonlijk",
-                "assignment_group": "Groepswerk",
-                "group_members_label": "Groepsleden (één per regel)",
-                "github_link_label": "GitHub link *",
-                "description_label": "Korte uitleg van wat je hebt gedaan *",
-                "select_min_one_lo": "⚠️ Selecteer minimaal één leeruitkomst!",
-                "fill_required_fields": "⚠️ Vul alle verplichte velden (*) in!",
-                # Feedback pages
-                "feedback_add_title": "Feedback Toevoegen",
-                "feedback_add_subtitle": "Voeg feedback toe aan een bestaand portfolio item",
-                "no_portfolio_items_title": "Feedback Toevoegen",
-                "no_portfolio_items_msg": "Er zijn nog geen portfolio items om feedback aan toe te voegen.",
-                "no_portfolio_items_hint": "Voeg eerst een portfolio item toe voordat je feedback kunt geven.",
-                "select_portfolio_item": "Selecteer portfolio item",
-                "select_learning_outcomes_feedback": "Selecteer leeruitkomsten voor deze feedback:",
-                "feedback_from_label": "Feedback van (naam docent/begeleider) *",
-                "feedback_text_label": "Feedback tekst *",
-                "save_feedback_btn": "Feedback Opslaan",
-                "select_portfolio_item_error": "⚠️ Selecteer een portfolio item!",
-                "select_min_one_lo_feedback": "⚠️ Selecteer minimaal één leeruitkomst voor de feedback!",
-                "feedback_saved_success": "✅ Feedback succesvol toegevoegd!",
-                "portfolio_item_label": "Portfolio Item:",
-                "add_feedback_to_item": "Voeg feedback toe aan dit portfolio item",
-                # All Feedback page
-                "all_feedback_title": "Alle Feedback Overzicht",
-                "total_items_with_feedback": "Totaal {} portfolio item(s) met feedback",
-                "no_feedback_found": "Geen Feedback Gevonden",
-                "no_feedback_msg": "Er is nog geen feedback toegevoegd aan portfolio items.",
-                "no_feedback_hint": "Voeg eerst feedback toe via de 'Feedback Toevoegen' knop.",
-                "feedback_from": "Van:",
-                "feedback_date": "Datum:",
-                "unknown": "Onbekend",
-                # Document Submission page
-                "submit_document_title": "Document Inleveren",
-                "reflection_questions": "Reflectie Vragen",
-                "proud_of_label": "Waar ik het meest trots op ben:",
-                "struggled_with_label": "Waar ik de afgelopen periode moeite mee heb gehad en welke actie ik heb ondernomen:",
-                "want_to_learn_label": "Wat ik nog graag wil leren en welke actie ik wil gaan ondernemen:",
-                "confirm_complete": "Ik bevestig dat mijn portfolio compleet is en klaar voor inlevering",
-                "generate_markdown": "Ook markdown (.md) bestand genereren",
-                "generate_document_btn": "Document Genereren",
-                "fill_reflection_error": "⚠️ Vul alle reflectie vragen in!",
-                "confirm_complete_error": "⚠️ Bevestig dat je portfolio compleet is!",
-                "document_generated_success": "✅ Document succesvol gegenereerd!",
-                "document_generation_failed": "❌ Document generatie mislukt:",
-                # Delete confirmation
-                "delete_portfolio_item": "Portfolio Item Verwijderen",
-                "delete_confirmation": "Weet je zeker dat je '{}' wilt verwijderen?",
-                "delete_warning": "Deze actie kan niet ongedaan worden gemaakt.",
-                "delete_btn": "Verwijderen",
-                # First time setup
-                "first_time_setup": "Eerste Installatie",
-                "welcome_msg": "Welkom bij de Portfolio Document Manager!",
-                "fill_basic_info": "Vul eerst je basisgegevens in:",
-                "ok_btn": "OK",
-                # Tooltips
-                "edit_tooltip": "Bewerken",
-                "add_feedback_tooltip": "Feedback Toevoegen",
-                "delete_tooltip": "Verwijderen",
-                # Learning Outcomes page
-                "learning_outcomes_title": "Leeruitkomsten Informatie",
-                "learning_outcomes_subtitle": "Detailinformatie over alle leeruitkomsten",
-                "description_label_lo": "Beschrijving:",
-                "indicators_label": "Indicatoren:",
-                "examples_label": "Voorbeelden van opdrachten:",
-                # About page
-                "about_title": "Over Portfolio Document Manager",
-                "version_label": "Versie: 1.5.6",
-                "about_description": "Een moderne desktop applicatie voor het beheren van portfolio documenten",
-                "developed_by": "Ontwikkeld door:",
-                "copyright": "© 2025 Rick van der Voort - Portfolio Document Manager",
-                # Feedback Info page
-                "feedback_info_title": "Feedback over de App",
-                "improve_app": "Verbeter de Portfolio Document Manager!",
-                "feedback_help": "Jouw feedback helpt ons de app te verbeteren. Deel je ervaringen, suggesties en bug reports.",
-                "how_to_give_feedback": "Hoe kan je feedback geven?",
-                "share_experience": "• Deel je ervaring met de app",
-                "report_bugs": "• Rapporteer bugs of problemen", 
-                "suggest_features": "• Suggereer nieuwe functies",
-                "ux_tips": "• Geef tips voor betere gebruikerservaring",
-                "feedback_categories": "Feedback categorieën:",
-                "bug_report": "🐛 Bug Report - Meld een probleem",
-                "feature_request": "💡 Feature Request - Suggereer een nieuwe functie",
-                "documentation": "📖 Documentatie - Verbeter de handleiding",
-                "ui_ux": "🎨 UI/UX - Design en gebruiksvriendelijkheid",
-                "performance": "⚡ Performance - Snelheid en prestaties",
-                "give_feedback": "Geef feedback:",
-                "feedback_github_link": "📝 Feedback Geven via GitHub Issues",
-                "thanks_msg": "Bedankt voor je bijdrage aan het verbeteren van de app!",
-                # GitHub setup
-                "github_integration": "GitHub Integratie",
-                "feature_development": "Functie in Ontwikkeling",
-                "github_under_development": "GitHub integratie is momenteel nog in ontwikkeling.",
-                "feature_future_version": "Deze functie wordt toegevoegd in een toekomstige versie.",
-                # Additional UI text
-                "no_title": "Geen titel",
-                "no_date": "Geen datum",
-                "no_feedback": "Geen feedback",
-                # Additional error messages and status texts
-                "document_generate_btn": "Document Genereren",
-                "document_generated": "Document gegenereerd",
-                "error_occurred": "Er is een fout opgetreden",
-                "data_exported": "Data geëxporteerd",
-                "data_imported": "Data geïmporteerd",
-                # Additional feedback view texts
-                "feedback_for_item": "Feedback voor item:",
-                "add_feedback_specific": "Voeg feedback toe aan dit item",
-                "feedback_overview": "Feedback overzicht",
-                "items_count": "items",
-                "with_feedback": "met feedback",
-                # Learning Outcome Tab Header
-                "learning_outcome": "Leeruitkomst"
-            },
-            "en": {
-                "app_title": "Portfolio Document Manager - TI",
-                "menu_about": "About",
-                "menu_feedback": "Feedback",
-                "menu_main": "Main Menu",
-                "menu_student_info": "Change student information",
-                "menu_github": "🚧 GitHub credentials (under development)",
-                "menu_github_tooltip": "Feature under development",
-                "menu_export": "Export data",
-                "menu_import": "Import data",
-                "btn_learning_outcomes": "Learning Outcomes Info",
-                "btn_all_feedback": "All Feedback",
-                "btn_add_item": "Add New Portfolio Item",
-                "btn_add_feedback": "Add Feedback",
-                "btn_submit_document": "Submit Document",
-                "tooltip_theme": "Toggle Dark/Light Mode",
-                "tooltip_language": "Switch Language",
-                "table_title": "Title",
-                "table_learning_outcomes": "Learning Outcomes",
-                "table_type": "Type",
-                "table_date": "Date",
-                "table_feedback": "Feedback",
-                "table_actions": "Actions",
-                "btn_back": "Back to Overview",
-                "portfolio_items_title": "Portfolio Items",
-                "attention_items_without_feedback_single": "You still have {} portfolio item without feedback!",
-                "attention_items_without_feedback_multiple": "You still have {} portfolio items without feedback!",
-                "attention_all_items_have_feedback": "✅ All portfolio items have feedback!",
-                "type_personal": "Personal",
-                "type_group": "Group",
-                "important": "IMPORTANT",
-                # Student Info page
-                "student_info_title": "Student Information",
-                "student_info": "Student Information",
-                "name_label": "Student name",
-                "student_number_label": "Student number",
-                "semester_label": "Semester (2-8)",
-                "milestone_label": "Milestone (1-4)",
-                "save_btn": "Save",
-                "cancel_btn": "Cancel",
-                "required_fields_error": "⚠️ Please fill in all fields!",
-                # Portfolio Item page
-                "portfolio_item_add_title": "Add Portfolio Item",
-                "portfolio_item_edit_title": "Edit Portfolio Item",
-                "title_label": "Title *",
-                "select_learning_outcomes": "Select learning outcomes:",
-                "assignment_type": "Assignment type:",
-                "assignment_personal": "Personal",
-                "assignment_group": "Group work",
-                "group_members_label": "Group members (one per line)",
-                "github_link_label": "GitHub link *",
-                "description_label": "Brief explanation of what you did *",
-                "select_min_one_lo": "⚠️ Select at least one learning outcome!",
-                "fill_required_fields": "⚠️ Please fill in all required fields (*)!",
-                # Feedback pages
-                "feedback_add_title": "Add Feedback",
-                "feedback_add_subtitle": "Add feedback to an existing portfolio item",
-                "no_portfolio_items_title": "Add Feedback",
-                "no_portfolio_items_msg": "There are no portfolio items yet to add feedback to.",
-                "no_portfolio_items_hint": "Please add a portfolio item first before you can give feedback.",
-                "select_portfolio_item": "Select portfolio item",
-                "select_learning_outcomes_feedback": "Select learning outcomes for this feedback:",
-                "feedback_from_label": "Feedback from (teacher/supervisor name) *",
-                "feedback_text_label": "Feedback text *",
-                "save_feedback_btn": "Save Feedback",
-                "select_portfolio_item_error": "⚠️ Please select a portfolio item!",
-                "select_min_one_lo_feedback": "⚠️ Select at least one learning outcome for the feedback!",
-                "feedback_saved_success": "✅ Feedback successfully added!",
-                "portfolio_item_label": "Portfolio Item:",
-                "add_feedback_to_item": "Add feedback to this portfolio item",
-                # All Feedback page
-                "all_feedback_title": "All Feedback Overview",
-                "total_items_with_feedback": "Total {} portfolio item(s) with feedback",
-                "no_feedback_found": "No Feedback Found",
-                "no_feedback_msg": "No feedback has been added to portfolio items yet.",
-                "no_feedback_hint": "Please add feedback first via the 'Add Feedback' button.",
-                "feedback_from": "From:",
-                "feedback_date": "Date:",
-                "unknown": "Unknown",
-                # Document Submission page
-                "submit_document_title": "Submit Document",
-                "reflection_questions": "Reflection Questions",
-                "proud_of_label": "What I am most proud of:",
-                "struggled_with_label": "What I struggled with during this period and what action I took:",
-                "want_to_learn_label": "What I still want to learn and what action I want to take:",
-                "confirm_complete": "I confirm that my portfolio is complete and ready for submission",
-                "generate_markdown": "Also generate markdown (.md) file",
-                "generate_document_btn": "Generate Document",
-                "fill_reflection_error": "⚠️ Please answer all reflection questions!",
-                "confirm_complete_error": "⚠️ Please confirm that your portfolio is complete!",
-                "document_generated_success": "✅ Document successfully generated!",
-                "document_generation_failed": "❌ Document generation failed:",
-                # Delete confirmation
-                "delete_portfolio_item": "Delete Portfolio Item",
-                "delete_confirmation": "Are you sure you want to delete '{}'?",
-                "delete_warning": "This action cannot be undone.",
-                "delete_btn": "Delete",
-                # First time setup
-                "first_time_setup": "First Time Setup",
-                "welcome_msg": "Welcome to the Portfolio Document Manager!",
-                "fill_basic_info": "Please fill in your basic information first:",
-                "ok_btn": "OK",
-                # Tooltips
-                "edit_tooltip": "Edit",
-                "add_feedback_tooltip": "Add Feedback",
-                "delete_tooltip": "Delete",
-                # Learning Outcomes page
-                "learning_outcomes_title": "Learning Outcomes Information",
-                "learning_outcomes_subtitle": "Detailed information about all learning outcomes",
-                "description_label_lo": "Description:",
-                "indicators_label": "Indicators:",
-                "examples_label": "Examples of assignments:",
-                # About page
-                "about_title": "About Portfolio Document Manager",
-                "version_label": "Version: 1.5.6",
-                "about_description": "A modern desktop application for managing portfolio documents",
-                "developed_by": "Developed by:",
-                "copyright": "© 2025 Rick van der Voort - Portfolio Document Manager",
-                # Feedback Info page
-                "feedback_info_title": "Feedback about the App",
-                "improve_app": "Improve the Portfolio Document Manager!",
-                "feedback_help": "Your feedback helps us improve the app. Share your experiences, suggestions and bug reports.",
-                "how_to_give_feedback": "How can you give feedback?",
-                "share_experience": "• Share your experience with the app",
-                "report_bugs": "• Report bugs or problems",
-                "suggest_features": "• Suggest new features",
-                "ux_tips": "• Give tips for better user experience",
-                "feedback_categories": "Feedback categories:",
-                "bug_report": "🐛 Bug Report - Report a problem",
-                "feature_request": "💡 Feature Request - Suggest a new feature",
-                "documentation": "📖 Documentation - Improve the manual",
-                "ui_ux": "🎨 UI/UX - Design and usability",
-                "performance": "⚡ Performance - Speed and performance",
-                "give_feedback": "Give feedback:",
-                "feedback_github_link": "📝 Give Feedback via GitHub Issues",
-                "thanks_msg": "Thank you for your contribution to improving the app!",
-                # GitHub setup
-                "github_integration": "GitHub Integration",
-                "feature_development": "Feature in Development",
-                "github_under_development": "GitHub integration is currently under development.",
-                "feature_future_version": "This feature will be added in a future version.",
-                # Additional UI text
-                "no_title": "Geen titel",
-                "no_date": "Geen datum",
-                "no_feedback": "Geen feedback",
-                # Additional error messages and status texts
-                "document_generate_btn": "Document Genereren",
-                "document_generated": "Document gegenereerd",
-                "error_occurred": "Er is een fout opgetreden",
-                "data_exported": "Data geëxporteerd",
-                "data_imported": "Data geïmporteerd",
-                # Additional feedback view texts
-                "feedback_for_item": "Feedback voor item:",
-                "add_feedback_specific": "Voeg feedback toe aan dit item",
-                "feedback_overview": "Feedback overzicht",
-                "items_count": "items",
-                "with_feedback": "met feedback",
-                # Learning Outcome Tab Header
-                "learning_outcome": "Leeruitkomst"
-            }
-        }
+        # Last known contents of the data file, used as merge base for external changes
+        self._data_lock = threading.RLock()
+        self._disk_state = {"student_info": {}, "portfolio_items": {}, "reflection_data": {}}
+        self._disk_signature = None  # DataFileWatcher.file_signature of the file we last read or wrote
+        self.data_conflicts = []
+        self.data_watcher = DataFileWatcher(self.data_file, self.sync_external_changes)
         
-        # Learning outcomes definitions
-        self.learning_outcomes = {
-            1: {
-                "title": "Analyseren",
-                "description": "Student analyseert de vereisten en doelstellingen van de opdrachtgever betreffende een 'Digital Twin' van een bestaand embedded systeem. Op basis hiervan en rekening houdend met de mogelijke gebruikers deduceert de student requirements volgens een voorgeschreven methode.",
-                "indicators": ["Requirements analyse", "Stakeholder analyse", "Testplan", "Ontwikkeldocument (eerste deel)"],
-                "examples": ["Stakeholder interviews", "Use case diagrammen", "Requirements specification document", "Functional requirements lijst"]
-            },
-            2: {
-                "title": "Ontwerpen", 
-                "description": "Student ontwerpt gebaseerd op de requirements en volgens voorgeschreven methoden een 'Digital Twin', inclusief grafische representatie, van een bestaand embedded systeem. Dit ontwerp omvat ook een ontwerp voor teststrategieën.",
-                "indicators": ["Testverslag", "Ontwikkeldocument"],
-                "examples": ["UML diagrammen", "Architectuur ontwerp", "Database design", "UI/UX mockups", "Testplan ontwerp"]
-            },
-            3: {
-                "title": "Adviseren",
-                "description": "Student adviseert de opdrachtgever, na analyse van de vereisten en doelstellingen, over de inzet van een digital twin. Het advies is helder onderbouwd en gepresenteerd, zodat het begrijpelijk is voor alle stakeholders/betrokkenen.",
-                "indicators": ["Adviesrapport", "Advies presentatie"],
-                "examples": ["Technisch adviesrapport", "Kosten-baten analyse", "Risico analyse", "Implementatie roadmap", "Stakeholder presentaties"]
-            },
-            4: {
-                "title": "Realiseren",
-                "description": "Student realiseert vanuit het ontwerp een 'Digital Twin' van een bestaand embedded systeem, inclusief grafische representatie. Hierbij wordt gewerkt volgens een voorgeschreven methode waarin testen centraal staat.",
-                "indicators": ["Broncode simulatie", "Projectcode", "Vision opdrachten", "Algoritmiek opdrachten", "C++ STL opdrachten", "C++<->Python opdrachten", "Creational/Structural design pattern opdrachten"],
-                "examples": ["Working prototype", "Code repositories", "Unit tests", "Integration tests", "Performance benchmarks", "Design patterns implementatie"]
-            },
-            5: {
-                "title": "Beheren",
-                "description": "Student zet een professionele ontwikkelomgeving op voor desktop development. Daarbij houdt hij rekening met de samenwerking tussen verschillende programmeertalen. De desktop debugging wordt op een gestructureerde manier uitgevoerd.",
-                "indicators": ["Ontwikkeldocument", "Opdrachten ontwikkelomgeving", "Opdrachten debugging/tooling", "Testverslag"],
-                "examples": ["Version control (Git)", "CI/CD pipelines", "Code reviews", "Debugging sessies", "Development environment setup", "Tool configuration"]
-            },
-            6: {
-                "title": "Toekomstgericht organiseren",
-                "description": "De student kan een probleem vertalen naar een product door randvoorwaarden en requirements op te stellen in overleg met de opdrachtgever. Het project wordt gestructureerd opgezet, uitgevoerd en opgeleverd.",
-                "indicators": ["Ontwikkeldocument", "Scrum board", "Sprintverslagen"],
-                "examples": ["Sprint planning", "Daily standups", "Sprint reviews", "Retrospectives", "Product backlog management", "Project roadmap"]
-            },
-            7: {
-                "title": "Doelgericht interacteren",
-                "description": "De student onderhoudt actief de relatie met relevante samenwerkingspartners door middel van het geven van weloverwogen presentaties die afgestemd zijn op de doelgroep.",
-                "indicators": ["Onderzoeksverslag(deepdive)", "Adviespresentatie", "Sprintverslagen (review)"],
-                "examples": ["Stakeholder meetings", "Demo presentaties", "Technical documentation", "Team communication", "Client feedback sessions"]
-            },
-            8: {
-                "title": "Persoonlijk leiderschap",
-                "description": "De student bereidt zich voor op studie- en loopbaankeuzes. De student evalueert hierbij persoonlijke ambities en kwaliteiten in relatie tot de gewenste positionering in het werkveld.",
-                "indicators": ["Sollicitatiebrief", "Professionaliseringsdocument"],
-                "examples": ["Personal development plan", "Career vision document", "Self-reflection reports", "Professional network building", "Skills assessment"]
-            },
-            9: {
-                "title": "Onderzoek probleem oplossen",
-                "description": "De student kan een praktijkgericht probleem identificeren en de juiste oplossingsrichting kiezen door wensen van de opdrachtgever centraal te stellen. Gedurende het proces handelt de student onderzoekend.",
-                "indicators": ["Onderzoeksverslag (deepdive)", "Ontwikkeldocument"],
-                "examples": ["Literature review", "Proof of concept", "Experimental setup", "Data analysis", "Research methodology", "Problem statement definition"]
-            }
-        }
+        # Totals over the items, updated per mutation instead of recounted per redraw
+        self.aggregates = PortfolioAggregates()
+        self.debug = os.environ.get("PORTFOLIO_DEBUG") == "1"
+        
+        # markdown/WeasyPrint are only imported when a document is about to be generated
+        self._document_libraries_prewarmed = False
+        
+        # Unsaved form input, snapshotted in the background
+        self.drafts = DraftStore(os.path.join(data_dir, "portfolio_drafts.json"), on_settled=self.draft_settled)
+        
+        # Shared, read-only tables; every session uses the same objects
+        self.translations = TRANSLATIONS
+        mark_startup("init_translations")
+        self.learning_outcomes = LEARNING_OUTCOMES
+        mark_startup("init_learning_outcomes")
+        
+        # Item x learning outcome bitsets for the progress dashboard
+        self.coverage = CoverageMatrix(self.learning_outcomes)
+        
+        # Undo/redo of every change to the data
+        self.history = CommandLog()
         
         # UI Components
         self.info_text = ft.Text("", size=14)
         self.attention_card = ft.Card(visible=False, expand=False)
+        self._attention_message = None  # what the card shows, so an unchanged message is not rebuilt
+        # Sorting and filtering of the table
+        self.sort_columns = ["title", "learning_outcomes", "type", "date", "feedback"]
+        self.sort_column = None  # None keeps insertion order
+        self.sort_ascending = True
+        self.sort_index = SortIndex({
+            "title": lambda item: item.get('title', '').casefold(),
+            "learning_outcomes": lambda item: tuple(sorted(item.get('learning_outcomes', []))),
+            "type": lambda item: 1 if item.get('is_group_work', False) else 0,
+            "date": lambda item: parse_item_date(item.get('date_added')),
+            "feedback": lambda item: len(item.get('feedback', []))
+        })
+        self.filter_type = ft.Dropdown(
+            width=180,
+            dense=True,
+            value="all",
+            on_change=lambda e: self.apply_table_filters()
+        )
+        self.filter_learning_outcome = ft.Dropdown(
+            width=180,
+            dense=True,
+            value="all",
+            on_change=lambda e: self.apply_table_filters()
+        )
+        self.filter_without_feedback = ft.Checkbox(
+            value=False,
+            on_change=lambda e: self.apply_table_filters()
+        )
+        self.refresh_filter_labels()
+        
         self.portfolio_data_table = ft.DataTable(
-            columns=[
-                ft.DataColumn(ft.Text(self.get_text("table_title"))),
-                ft.DataColumn(ft.Text(self.get_text("table_learning_outcomes"))),
-                ft.DataColumn(ft.Text(self.get_text("table_type"))),
-                ft.DataColumn(ft.Text(self.get_text("table_date"))),
-                ft.DataColumn(ft.Text(self.get_text("table_feedback"))),
-                ft.DataColumn(ft.Text(self.get_text("table_actions"))),
-            ],
-            rows=[]
+            columns=self.build_table_columns(),
+            rows=[],
+            show_checkbox_column=True,
+            on_select_all=self.on_select_all_rows
         )
+        self._row_cache = {}  # item id -> (DataRow, cell texts), visible page only
+        self._feedback_cards = {}  # item id -> (item, version, card), visible page only
+        self.feedback_page_index = 0
+        
+        # Only one page of rows is materialised at a time
+        self.table_page = 0
+        self.table_page_size = 25
+        self.table_page_text = ft.Text("", size=12, color=ft.Colors.GREY_600)
+        self.table_prev_button = ft.IconButton(
+            icon=ft.Icons.CHEVRON_LEFT,
+            on_click=lambda e: self.change_table_page(-1)
+        )
+        self.table_next_button = ft.IconButton(
+            icon=ft.Icons.CHEVRON_RIGHT,
+            on_click=lambda e: self.change_table_page(1)
+        )
+        self.feedback_page_size = 20
+        
+        # Rows ticked in the table; the bulk actions work on these
+        self.selected_item_ids = set()
+        self.selection_text = self.bind(ft.Text(weight=ft.FontWeight.BOLD),
+                                        value=lambda: self.get_text("selection_count").format(len(self.selected_item_ids)))
+        self.bulk_actions = ft.Row([
+            self.selection_text,
+            self.bind(ft.TextButton(icon=ft.Icons.SCHOOL, on_click=self.bulk_change_learning_outcomes),
+                      text="bulk_change_los"),
+            self.bind(ft.TextButton(icon=ft.Icons.GROUP, on_click=self.bulk_change_type),
+                      text="bulk_change_type"),
+            self.bind(ft.TextButton(icon=ft.Icons.FEEDBACK, on_click=self.bulk_add_feedback),
+                      text="bulk_add_feedback"),
+            self.bind(ft.TextButton(icon=ft.Icons.DELETE, icon_color=ft.Colors.RED, on_click=self.bulk_delete),
+                      text="delete_tooltip"),
+            self.bind(ft.TextButton(icon=ft.Icons.CLEAR, on_click=lambda e: self.clear_selection()),
+                      text="bulk_clear_selection")
+        ], alignment=ft.MainAxisAlignment.CENTER, wrap=True, visible=False)
+        
+        # Search over titles, descriptions, links and feedback, shared by the main and feedback views
+        self.search_index = SearchIndex()
+        self.search_results = None  # set of item ids, or None when not searching
+        self._search_timer = None
+        
+        # Live preview on the submit view; sections are cached by their inputs
+        self._preview_timer = None
+        self.preview = None
+        self.preview_cache = {}
+        self.search_field = self.bind(ft.TextField(
+            prefix_icon=ft.Icons.SEARCH,
+            width=600,
+            dense=True,
+            on_change=self.on_search_change
+        ), hint_text="search_hint")
+        
+        # Every handled event ends in request_update; idle sessions can be hibernated
+        self.last_activity = time.monotonic()
+        
+        # Updates requested while handling an event are sent together
+        self.ui = UpdateScheduler(self.page, stats=os.environ.get("PORTFOLIO_UPDATE_STATS") == "1")
+        self.ui.guard_events(self._data_lock)
         
         # View management
         self.current_view = "main"
-        self.main_content = ft.Column()
+        self.view_host = ft.Column(expand=True, spacing=0, horizontal_alignment=ft.CrossAxisAlignment.STRETCH)
+        self.views = ViewCache(self.view_host)
         self.content_container = ft.Container(expand=True)
         
-        # Load existing data
-        self.load_data()
+        # Shown until the data file has been read
+        self.loading = True
+        self.data_loaded = threading.Event()
+        self.main_actions = None
+        self.loading_indicator = ft.Row([
+            ft.ProgressRing(width=16, height=16, stroke_width=2),
+            self.bound_text("loading_data", size=14, color=ft.Colors.GREY_600)
+        ], alignment=ft.MainAxisAlignment.CENTER)
+        mark_startup("init_components")
         
-        # Initialize GUI
+        # Initialize GUI; the empty shell is painted before any data is read
         self.setup_gui()
+        mark_startup("setup_gui")
+        self.drafts.start()
+        
+        # Load existing data without holding up the window
+        threading.Thread(target=self.load_data_in_background, name="load-data", daemon=True).start()
+
+    def load_data_in_background(self):
+        """Read the data file and fill in the views that were painted without it"""
+        with self._data_lock:
+            self.load_data()
+        mark_startup("load_data")
+        
+        with self._data_lock, self.ui.tree_lock:
+            # The shell was built in the default language
+            self.apply_language()
+            self.set_loading(False)
+        self.data_loaded.set()
+        
+        # Pick up edits made by other programs (shared drives, scripts)
+        self.data_watcher.start()
+        
+        # Build the search index in the background so the first search is fast
+        threading.Thread(target=self.search_index.refresh, args=(list(self.portfolio_items),),
+                         name="search-index", daemon=True).start()
+        self.scan_git_evidence()
         
         # Check if first time setup is needed
-        if not self.student_info:
-            self.first_time_setup()
+        with self._data_lock, self.ui.tree_lock:
+            if not self.student_info:
+                self.show_student_info_view()
+                self.first_time_setup()
+            elif self.current_view == "learning_outcomes":
+                # Its back button was disabled while no student info was known
+                self.show_learning_outcomes_info(None)
+
+    def set_loading(self, loading):
+        """Block the actions that need the data while it is being loaded"""
+        self.loading = loading
+        self.loading_indicator.visible = loading
+        self.menu_button.disabled = loading
+        self.language_button.disabled = loading
+        if self.main_actions is not None:
+            self.main_actions.disabled = loading
+        self.request_update()
 
     def setup_gui(self):
         """Setup the main GUI interface"""
+        # Menus that change data stay disabled until it has been loaded
+        self.menu_button = ft.PopupMenuButton(
+            items=[
+                self.bind(ft.PopupMenuItem(on_click=lambda e: self.show_main_view()), text="menu_main"),
+                ft.PopupMenuItem(),  # Separator
+                self.bind(ft.PopupMenuItem(on_click=self.show_about), text="menu_about"),
+                self.bind(ft.PopupMenuItem(on_click=self.show_feedback_info), text="menu_feedback"),
+                ft.PopupMenuItem(),  # Separator
+                self.bind(ft.PopupMenuItem(on_click=self.show_student_info_view), text="menu_student_info"),
+                self.bind(ft.PopupMenuItem(on_click=self.setup_github), text="menu_github"),
+                self.bind(ft.PopupMenuItem(on_click=self.check_links), text="menu_check_links"),
+                ft.PopupMenuItem(),  # Separator
+                self.bind(ft.PopupMenuItem(on_click=self.export_data), text="menu_export"),
+                self.bind(ft.PopupMenuItem(on_click=self.import_data), text="menu_import"),
+            ],
+            icon=ft.Icons.MENU,
+            disabled=self.loading
+        )
+        self.language_button = self.bind(ft.PopupMenuButton(
+            items=[
+                ft.PopupMenuItem(
+                    text="🇳🇱 Nederlands",
+                    on_click=lambda e: self.change_language("nl")
+                ),
+                ft.PopupMenuItem(
+                    text="🇬🇧 English", 
+                    on_click=lambda e: self.change_language("en")
+                ),
+            ],
+            icon=ft.Icons.LANGUAGE,
+            icon_color=ft.Colors.WHITE,
+            disabled=self.loading
+        ), tooltip="tooltip_language")
+        
+        self.undo_button = self.bind(ft.IconButton(
+            icon=ft.Icons.UNDO,
+            icon_color=ft.Colors.WHITE,
+            on_click=self.undo,
+            disabled=True
+        ), tooltip="tooltip_undo")
+        self.redo_button = self.bind(ft.IconButton(
+            icon=ft.Icons.REDO,
+            icon_color=ft.Colors.WHITE,
+            on_click=self.redo,
+            disabled=True
+        ), tooltip="tooltip_redo")
+        self.theme_button = self.bind(ft.IconButton(
+            icon=ft.Icons.LIGHT_MODE if self.page.theme_mode == ft.ThemeMode.DARK else ft.Icons.DARK_MODE,
+            on_click=self.toggle_theme_mode,
+            icon_color=ft.Colors.WHITE
+        ), tooltip="tooltip_theme")
+        self.page.on_keyboard_event = self.on_keyboard
+        
         # App bar with menu on the left and info buttons on the right
         self.page.appbar = ft.AppBar(
-            title=ft.Text(self.get_text("app_title")),
+            title=self.bound_text("app_title"),
             bgcolor=ft.Colors.BLUE_700,
             color=ft.Colors.WHITE,
-            leading=ft.PopupMenuButton(
-                items=[
-                    ft.PopupMenuItem(text=self.get_text("menu_main"), on_click=lambda e: self.show_main_view()),
-                    ft.PopupMenuItem(),  # Separator
-                    ft.PopupMenuItem(text=self.get_text("menu_about"), on_click=self.show_about),
-                    ft.PopupMenuItem(text=self.get_text("menu_feedback"), on_click=self.show_feedback_info),
-                    ft.PopupMenuItem(),  # Separator
-                    ft.PopupMenuItem(text=self.get_text("menu_student_info"), on_click=self.show_student_info_view),
-                    ft.PopupMenuItem(text=self.get_text("menu_github"), on_click=self.setup_github),
-                    ft.PopupMenuItem(),  # Separator
-                    ft.PopupMenuItem(text=self.get_text("menu_export"), on_click=self.export_data),
-                    ft.PopupMenuItem(text=self.get_text("menu_import"), on_click=self.import_data),
-                ],
-                icon=ft.Icons.MENU
-            ),
+            leading=self.menu_button,
             actions=[
-                ft.TextButton(
-                    text=self.get_text("btn_learning_outcomes"),
+                self.undo_button,
+                self.redo_button,
+                self.bind(ft.TextButton(
                     on_click=self.show_learning_outcomes_info,
                     style=ft.ButtonStyle(color=ft.Colors.WHITE)
-                ),
-                ft.PopupMenuButton(
-                    items=[
-                        ft.PopupMenuItem(
-                            text="🇳🇱 Nederlands",
-                            on_click=lambda e: self.change_language("nl")
-                        ),
-                        ft.PopupMenuItem(
-                            text="🇬🇧 English", 
-                            on_click=lambda e: self.change_language("en")
-                        ),
-                    ],
-                    icon=ft.Icons.LANGUAGE,
-                    icon_color=ft.Colors.WHITE,
-                    tooltip=self.get_text("tooltip_language")
-                ),
-                ft.IconButton(
-                    icon=ft.Icons.LIGHT_MODE if self.page.theme_mode == ft.ThemeMode.DARK else ft.Icons.DARK_MODE,
-                    tooltip=self.get_text("tooltip_theme"),
-                    on_click=self.toggle_theme_mode,
-                    icon_color=ft.Colors.WHITE
-                )
+                ), text="btn_learning_outcomes"),
+                self.language_button,
+                self.theme_button
             ]
         )
         
         # Initialize main content container
         self.content_container = ft.Container(
-            content=self.main_content,
+            content=self.view_host,
             padding=20,
             expand=True
         )
@@ -513,14 +2347,63 @@ class PortfolioManager:
         
         # Show initial view
         self.show_main_view()
-        
-        # Check if first time setup is needed
-        if not self.student_info:
-            self.show_student_info_view()
 
     def show_main_view(self):
         """Show the main portfolio overview"""
         self.current_view = "main"
+        self.drafts.untrack()
+        
+        view = self.views.show("main", self.build_main_view)
+        self.place_search_field(view.data["search_holder"])
+        self.update_display()
+
+    def build_main_view(self):
+        """Build the main overview; it stays cached and is patched by update_display"""
+        search_holder = ft.Container(alignment=ft.alignment.center)
+        
+        # Action buttons; disabled while the data is still loading
+        self.main_actions = ft.Row([
+            self.bind(ft.ElevatedButton(
+                icon=ft.Icons.ADD,
+                on_click=self.show_add_portfolio_item_view,
+                style=ft.ButtonStyle(
+                    bgcolor=ft.Colors.GREEN_600,
+                    color=ft.Colors.WHITE
+                )
+            ), text="btn_add_item"),
+            self.bind(ft.ElevatedButton(
+                icon=ft.Icons.FEEDBACK,
+                on_click=self.show_add_feedback_view,
+                style=ft.ButtonStyle(
+                    bgcolor=ft.Colors.BLUE_600,
+                    color=ft.Colors.WHITE
+                )
+            ), text="btn_add_feedback"),
+            self.bind(ft.ElevatedButton(
+                icon=ft.Icons.LIST_ALT,
+                on_click=self.show_all_feedback_view,
+                style=ft.ButtonStyle(
+                    bgcolor=ft.Colors.PURPLE_600,
+                    color=ft.Colors.WHITE
+                )
+            ), text="btn_all_feedback"),
+            self.bind(ft.ElevatedButton(
+                icon=ft.Icons.INSIGHTS,
+                on_click=self.show_dashboard_view,
+                style=ft.ButtonStyle(
+                    bgcolor=ft.Colors.TEAL_600,
+                    color=ft.Colors.WHITE
+                )
+            ), text="btn_dashboard"),
+            self.bind(ft.ElevatedButton(
+                icon=ft.Icons.UPLOAD_FILE,
+                on_click=self.show_submit_document_view,
+                style=ft.ButtonStyle(
+                    bgcolor=ft.Colors.ORANGE_600,
+                    color=ft.Colors.WHITE
+                )
+            ), text="btn_submit_document"),
+        ], spacing=10, alignment=ft.MainAxisAlignment.CENTER, disabled=self.loading)
         
         # Main content
         main_content = ft.Column([
@@ -529,7 +2412,7 @@ class PortfolioManager:
                 content=ft.Card(
                     content=ft.Container(
                         content=ft.Column([
-                            ft.Text(self.get_text("student_info"), size=16, weight=ft.FontWeight.BOLD),
+                            self.bound_text("student_info", size=16, weight=ft.FontWeight.BOLD),
                             self.info_text
                         ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
                         padding=20
@@ -548,63 +2431,40 @@ class PortfolioManager:
             
             # Action buttons - centered
             ft.Container(
-                content=ft.Row([
-                    ft.ElevatedButton(
-                        text=self.get_text("btn_add_item"),
-                        icon=ft.Icons.ADD,
-                        on_click=self.show_add_portfolio_item_view,
-                        style=ft.ButtonStyle(
-                            bgcolor=ft.Colors.GREEN_600,
-                            color=ft.Colors.WHITE
-                        )
-                    ),
-                    ft.ElevatedButton(
-                        text=self.get_text("btn_add_feedback"),
-                        icon=ft.Icons.FEEDBACK,
-                        on_click=self.show_add_feedback_view,
-                        style=ft.ButtonStyle(
-                            bgcolor=ft.Colors.BLUE_600,
-                            color=ft.Colors.WHITE
-                        )
-                    ),
-                    ft.ElevatedButton(
-                        text=self.get_text("btn_all_feedback"),
-                        icon=ft.Icons.LIST_ALT,
-                        on_click=self.show_all_feedback_view,
-                        style=ft.ButtonStyle(
-                            bgcolor=ft.Colors.PURPLE_600,
-                            color=ft.Colors.WHITE
-                        )
-                    ),
-                    ft.ElevatedButton(
-                        text=self.get_text("btn_submit_document"),
-                        icon=ft.Icons.UPLOAD_FILE,
-                        on_click=self.show_submit_document_view,
-                        style=ft.ButtonStyle(
-                            bgcolor=ft.Colors.ORANGE_600,
-                            color=ft.Colors.WHITE
-                        )
-                    ),
-                ], spacing=10, alignment=ft.MainAxisAlignment.CENTER),
+                content=self.main_actions,
                 alignment=ft.alignment.center,
                 padding=ft.padding.symmetric(vertical=10)
             ),
             
+            self.loading_indicator,
+            
             # Portfolio items list - centered
             ft.Container(
                 content=ft.Card(
                     content=ft.Container(
                         content=ft.Column([
                             ft.Container(
-                                content=ft.Text(self.get_text("portfolio_items_title"), size=16, weight=ft.FontWeight.BOLD),
+                                content=self.bound_text("portfolio_items_title", size=16, weight=ft.FontWeight.BOLD),
                                 alignment=ft.alignment.center,
                                 padding=ft.padding.only(bottom=10)
                             ),
+                            search_holder,
+                            ft.Row([
+                                self.filter_type,
+                                self.filter_learning_outcome,
+                                self.filter_without_feedback
+                            ], alignment=ft.MainAxisAlignment.CENTER, spacing=10),
+                            self.bulk_actions,
                             ft.Container(
-                                content=self.portfolio_data_table,
+                                content=ft.Column([self.portfolio_data_table], scroll=ft.ScrollMode.AUTO),
                                 height=400,
                                 alignment=ft.alignment.top_center
-                            )
+                            ),
+                            ft.Row([
+                                self.table_prev_button,
+                                self.table_page_text,
+                                self.table_next_button
+                            ], alignment=ft.MainAxisAlignment.CENTER)
                         ]),
                         padding=20
                     ),
@@ -615,14 +2475,21 @@ class PortfolioManager:
         ], scroll=ft.ScrollMode.AUTO, horizontal_alignment=ft.CrossAxisAlignment.CENTER)
         
         # Wrap main content in centered container for better layout
-        centered_content = ft.Container(
+        return ft.Container(
             content=main_content,
             alignment=ft.alignment.top_center,
-            expand=True
+            expand=True,
+            data={"search_holder": search_holder}
         )
-        
-        self.content_container.content = centered_content
-        self.update_display()
+
+    def place_search_field(self, holder):
+        """Move the shared search field into holder; a control can only have one parent"""
+        previous = getattr(self, "_search_holder", None)
+        if previous is not None and previous is not holder:
+            previous.content = None
+        if holder is not None:
+            holder.content = self.search_field
+        self._search_holder = holder
 
     def show_back_button(self):
         """Create a back button"""
@@ -631,16 +2498,27 @@ class PortfolioManager:
                                    self.student_info.get("name") and 
                                    self.student_info.get("student_number"))
         
-        return ft.ElevatedButton(
-            text=f"← {self.get_text('btn_back')}",
+        return self.bind(ft.ElevatedButton(
             icon=ft.Icons.ARROW_BACK,
-            on_click=lambda e: self.show_main_view() if student_info_complete else None,
+            on_click=lambda e: self.show_main_view() if not e.control.disabled else None,
             disabled=not student_info_complete,
             style=ft.ButtonStyle(
                 bgcolor=ft.Colors.GREY_600 if student_info_complete else ft.Colors.GREY_300,
                 color=ft.Colors.WHITE if student_info_complete else ft.Colors.GREY_500
             )
-        )
+        ), text=lambda: f"← {self.get_text('btn_back')}")
+
+    def refresh_back_button(self, button):
+        """Bring the back button of a cached view in line with the current student info"""
+        current = self.show_back_button()
+        if button.disabled != current.disabled:
+            button.disabled = current.disabled
+            button.style = current.style
+
+    def request_update(self, *controls):
+        """Schedule an update of controls, or of the whole page if none are given"""
+        self.last_activity = time.monotonic()
+        self.ui.request(*controls)
 
     def center_content(self, content):
         """Helper function to center any content consistently"""
@@ -654,48 +2532,54 @@ class PortfolioManager:
         )
         return centered_content
 
+    def draft_settled(self, form_key):
+        """Called by the draft store when typing in a form paused"""
+        if form_key == "reflection":
+            self.schedule_preview(delay=0)
+
+    def track_draft(self, form_key, fields):
+        """Restore a saved draft into the form fields and keep snapshotting them"""
+        self.drafts.track(form_key, fields)
+        restored = self.drafts.restore(form_key, fields)
+        return self.bound_text("draft_restored", color=ft.Colors.BLUE_600, visible=restored)
+
     def show_student_info_view(self, e=None):
         """Show student info editing view"""
         self.current_view = "student_info"
         
-        name_field = ft.TextField(
-            label=self.get_text("name_label"), 
+        name_field = self.bind(ft.TextField(
             value=self.student_info.get("name", ""), 
             width=400
-        )
-        number_field = ft.TextField(
-            label=self.get_text("student_number_label"), 
+        ), label="name_label")
+        number_field = self.bind(ft.TextField(
             value=self.student_info.get("student_number", ""), 
             width=400
-        )
-        semester_dropdown = ft.Dropdown(
-            label=self.get_text("semester_label"),
+        ), label="student_number_label")
+        semester_dropdown = self.bind(ft.Dropdown(
             options=[ft.dropdown.Option(str(i)) for i in range(2, 9)],
             value=self.student_info.get("semester", "2"),
             width=400
-        )
-        milestone_dropdown = ft.Dropdown(
-            label=self.get_text("milestone_label"),
+        ), label="semester_label")
+        milestone_dropdown = self.bind(ft.Dropdown(
             options=[ft.dropdown.Option(str(i)) for i in range(1, 5)],
             value=self.student_info.get("milestone", "1"),
             width=400
-        )
+        ), label="milestone_label")
         
         def save_student_info(e):
             if not name_field.value or not number_field.value:
                 # Simple error handling without dialog
                 error_text.value = self.get_text("required_fields_error")
                 error_text.visible = True
-                self.page.update()
+                self.request_update(error_text)
                 return
             
-            self.student_info = {
+            self.execute_command(records={"student_info": {
                 "name": name_field.value.strip(),
                 "student_number": number_field.value.strip(),
                 "semester": semester_dropdown.value,
                 "milestone": milestone_dropdown.value
-            }
-            self.save_data()
+            }})
             self.show_main_view()
         
         error_text = ft.Text("", color=ft.Colors.RED, visible=False)
@@ -705,40 +2589,38 @@ class PortfolioManager:
             ft.Card(
                 content=ft.Container(
                     content=ft.Column([
-                        ft.Text(self.get_text("student_info_title"), size=20, weight=ft.FontWeight.BOLD),
+                        self.bound_text("student_info_title", size=20, weight=ft.FontWeight.BOLD),
                         error_text,
                         name_field,
                         number_field,
                         semester_dropdown,
                         milestone_dropdown,
-                        ft.ElevatedButton(
-                            text=self.get_text("save_btn"),
+                        self.bind(ft.ElevatedButton(
                             icon=ft.Icons.SAVE,
                             on_click=save_student_info,
                             style=ft.ButtonStyle(
                                 bgcolor=ft.Colors.GREEN_600,
                                 color=ft.Colors.WHITE
                             )
-                        )
+                        ), text="save_btn")
                     ], spacing=15),
                     padding=20
                 )
             )
         ], scroll=ft.ScrollMode.AUTO)
         
-        self.content_container.content = self.center_content(content)
-        self.page.update()
+        self.views.show_transient(self.center_content(content))
+        self.request_update()
 
     def show_add_portfolio_item_view(self, e=None, existing_item=None, index=None):
         """Show add/edit portfolio item view"""
         self.current_view = "add_portfolio_item"
         
         # Title field
-        title_field = ft.TextField(
-            label="Titel *",
+        title_field = self.bind(ft.TextField(
             value=existing_item.get('title', '') if existing_item else '',
             width=600
-        )
+        ), label="title_label")
         
         # Learning outcomes checkboxes with tooltips
         lo_checkboxes = {}
@@ -759,46 +2641,62 @@ class PortfolioManager:
         # Assignment type
         assignment_type = ft.RadioGroup(
             content=ft.Column([
-                ft.Radio(value="personal", label=self.get_text("assignment_personal")),
-                ft.Radio(value="group", label=self.get_text("assignment_group"))
+                self.bind(ft.Radio(value="personal"), label="assignment_personal"),
+                self.bind(ft.Radio(value="group"), label="assignment_group")
             ]),
             value="group" if existing_item and existing_item.get('is_group_work', False) else "personal"
         )
         
         # Group members (conditionally shown)
-        group_members_field = ft.TextField(
-            label=self.get_text("group_members_label"),
+        group_members_field = self.bind(ft.TextField(
             multiline=True,
             min_lines=3,
             max_lines=5,
             value="\n".join(existing_item.get('group_members', [])) if existing_item and existing_item.get('group_members') else '',
             width=600,
             visible=existing_item.get('is_group_work', False) if existing_item else False
-        )
+        ), label="group_members_label")
         
         # GitHub link
-        github_field = ft.TextField(
-            label=self.get_text("github_link_label"),
+        github_field = self.bind(ft.TextField(
             value=existing_item.get('github_link', '') if existing_item else '',
             width=600
-        )
+        ), label="github_link_label")
+        
+        local_repo_field = self.bind(ft.TextField(
+            value=existing_item.get('local_repo', '') if existing_item else '',
+            width=600,
+            visible=self.git_scanner is not None
+        ), label="local_repo_label")
         
         # Description
-        description_field = ft.TextField(
-            label=self.get_text("description_label"),
+        description_field = self.bind(ft.TextField(
             multiline=True,
             min_lines=4,
             max_lines=6,
             value=existing_item.get('description', '') if existing_item else '',
             width=600
-        )
+        ), label="description_label")
         
         def toggle_group_options(e):
             group_members_field.visible = assignment_type.value == "group"
-            self.page.update()
+            self.request_update(group_members_field)
         
         assignment_type.on_change = toggle_group_options
         
+        draft_key = f"portfolio_item:{existing_item.get('id') if existing_item else 'new'}"
+        draft_fields = {
+            "title": title_field,
+            "assignment_type": assignment_type,
+            "group_members": group_members_field,
+            "github_link": github_field,
+            "local_repo": local_repo_field,
+            "description": description_field
+        }
+        draft_fields.update({f"lo_{lo_num}": checkbox for lo_num, checkbox in lo_checkboxes.items()})
+        draft_text = self.track_draft(draft_key, draft_fields)
+        group_members_field.visible = assignment_type.value == "group"
+        
         error_text = ft.Text("", color=ft.Colors.RED, visible=False)
         
         def save_item(e):
@@ -807,16 +2705,17 @@ class PortfolioManager:
             if not selected_los:
                 error_text.value = self.get_text("select_min_one_lo")
                 error_text.visible = True
-                self.page.update()
+                self.request_update(error_text)
                 return
             
             if not title_field.value or not github_field.value or not description_field.value:
                 error_text.value = self.get_text("fill_required_fields")
                 error_text.visible = True
-                self.page.update()
+                self.request_update(error_text)
                 return
             
             item_data = {
+                "id": (existing_item.get('id') or new_item_id()) if existing_item else new_item_id(),
                 "title": title_field.value.strip(),
                 "learning_outcomes": selected_los,
                 "is_group_work": assignment_type.value == "group",
@@ -828,16 +2727,27 @@ class PortfolioManager:
             if assignment_type.value == "group" and group_members_field.value:
                 item_data["group_members"] = [member.strip() for member in group_members_field.value.split("\n") if member.strip()]
             
-            if index is not None:
+            if (local_repo_field.value or "").strip():
+                item_data["local_repo"] = local_repo_field.value.strip()
+            
+            if existing_item:
                 # Edit existing item - preserve the original date
                 item_data['date_added'] = existing_item.get('date_added', datetime.datetime.now().strftime("%Y-%m-%d"))
-                self.portfolio_items[index] = item_data
             else:
                 # Add new item - set current date
                 item_data['date_added'] = datetime.datetime.now().strftime("%Y-%m-%d")
-                self.portfolio_items.append(item_data)
             
-            self.save_data()
+            with self._data_lock:
+                # Look the item up again, external changes may have moved it
+                item_index = self.find_item_index(item_data["id"])
+                if item_index is not None:
+                    change = (item_index, self.portfolio_items[item_index], item_data)
+                else:
+                    change = (len(self.portfolio_items), None, item_data)
+                self.execute_command([change])
+            self.drafts.discard(draft_key)
+            if "local_repo" in item_data:
+                self.scan_git_evidence()
             self.show_main_view()
         
         # Create content
@@ -846,27 +2756,28 @@ class PortfolioManager:
             ft.Card(
                 content=ft.Container(
                     content=ft.Column([
-                        ft.Text(self.get_text("portfolio_item_edit_title" if existing_item else "portfolio_item_add_title"), 
+                        self.bound_text("portfolio_item_edit_title" if existing_item else "portfolio_item_add_title", 
                                size=20, weight=ft.FontWeight.BOLD),
+                        draft_text,
                         error_text,
                         title_field,
-                        ft.Text(self.get_text("select_learning_outcomes"), weight=ft.FontWeight.BOLD),
+                        self.bound_text("select_learning_outcomes", weight=ft.FontWeight.BOLD),
                         ft.Column(lo_controls, spacing=5),
-                        ft.Text(self.get_text("assignment_type"), weight=ft.FontWeight.BOLD),
+                        self.bound_text("assignment_type", weight=ft.FontWeight.BOLD),
                         assignment_type,
                         group_members_field,
                         github_field,
+                        local_repo_field,
                         description_field,
                         ft.Row([
-                            ft.ElevatedButton(
-                                text=self.get_text("save_btn"),
+                            self.bind(ft.ElevatedButton(
                                 icon=ft.Icons.SAVE,
                                 on_click=save_item,
                                 style=ft.ButtonStyle(
                                     bgcolor=ft.Colors.GREEN_600,
                                     color=ft.Colors.WHITE
                                 )
-                            )
+                            ), text="save_btn")
                         ])
                     ], spacing=15),
                     padding=20
@@ -874,8 +2785,8 @@ class PortfolioManager:
             )
         ], scroll=ft.ScrollMode.AUTO)
         
-        self.content_container.content = self.center_content(content)
-        self.page.update()
+        self.views.show_transient(self.center_content(content))
+        self.request_update()
 
     def show_add_feedback_view(self, e=None):
         """Show add feedback view"""
@@ -888,11 +2799,11 @@ class PortfolioManager:
                 ft.Card(
                     content=ft.Container(
                         content=ft.Column([
-                            ft.Text(self.get_text("feedback_add_title"), size=20, weight=ft.FontWeight.BOLD),
+                            self.bound_text("feedback_add_title", size=20, weight=ft.FontWeight.BOLD),
                             ft.Icon(ft.Icons.INFO, color=ft.Colors.BLUE, size=48),
-                            ft.Text(self.get_text("no_portfolio_items_msg"), 
+                            self.bound_text("no_portfolio_items_msg", 
                                    size=16, text_align=ft.TextAlign.CENTER),
-                            ft.Text(self.get_text("no_portfolio_items_hint"), 
+                            self.bound_text("no_portfolio_items_hint", 
                                    color=ft.Colors.GREY_600, text_align=ft.TextAlign.CENTER),
                         ], spacing=20, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
                         padding=40
@@ -900,37 +2811,36 @@ class PortfolioManager:
                 )
             ])
             
-            self.content_container.content = self.center_content(content)
-            self.page.update()
+            self.views.show_transient(self.center_content(content))
+            self.request_update()
             return
         
         # Create dropdown options for portfolio items
         portfolio_options = []
-        for i, item in enumerate(self.portfolio_items):
+        for item in self.portfolio_items:
             portfolio_options.append(
                 ft.dropdown.Option(
-                    key=str(i),
+                    key=item.get('id'),
                     text=f"{item.get('title', self.get_text('no_title'))} (LU: {', '.join([str(lo) for lo in item.get('learning_outcomes', [])])})"
                 )
             )
         
-        portfolio_dropdown = ft.Dropdown(
-            label=self.get_text("select_portfolio_item"),
+        portfolio_dropdown = self.bind(ft.Dropdown(
             options=portfolio_options,
             width=600
-        )
+        ), label="select_portfolio_item")
         
         # Learning outcomes radio group for the selected item  
         lo_radio_group = ft.RadioGroup(content=ft.Column([], spacing=5))
         
         def update_learning_outcomes(e):
             """Update learning outcomes based on selected portfolio item"""
-            if not portfolio_dropdown.value:
+            selected_index = self.find_item_index(portfolio_dropdown.value)
+            if selected_index is None:
                 lo_radio_group.content.controls.clear()
-                self.page.update()
+                self.request_update(lo_radio_group)
                 return
             
-            selected_index = int(portfolio_dropdown.value)
             selected_item = self.portfolio_items[selected_index]
             available_los = selected_item.get('learning_outcomes', [])
             
@@ -948,23 +2858,24 @@ class PortfolioManager:
                 )
                 lo_radio_group.content.controls.append(radio)
             
-            self.page.update()
+            self.request_update(lo_radio_group)
         
         portfolio_dropdown.on_change = update_learning_outcomes
         
         # Feedback fields
-        feedback_from_field = ft.TextField(
-            label=self.get_text("feedback_from_label"),
+        feedback_from_field = self.bind(ft.TextField(
             width=600
-        )
+        ), label="feedback_from_label")
         
-        feedback_text_field = ft.TextField(
-            label=self.get_text("feedback_text_label"),
+        feedback_text_field = self.bind(ft.TextField(
             multiline=True,
             min_lines=4,
             max_lines=8,
             width=600
-        )
+        ), label="feedback_text_label")
+        
+        draft_fields = {"from": feedback_from_field, "text": feedback_text_field}
+        draft_text = self.track_draft("feedback:any", draft_fields)
         
         error_text = ft.Text("", color=ft.Colors.RED, visible=False)
         success_text = ft.Text("", color=ft.Colors.GREEN, visible=False)
@@ -974,7 +2885,7 @@ class PortfolioManager:
                 error_text.value = self.get_text("select_portfolio_item_error")
                 error_text.visible = True
                 success_text.visible = False
-                self.page.update()
+                self.request_update(error_text, success_text)
                 return
             
             selected_lo = lo_radio_group.value
@@ -982,19 +2893,16 @@ class PortfolioManager:
                 error_text.value = "⚠️ Selecteer een leeruitkomst voor de feedback!"
                 error_text.visible = True
                 success_text.visible = False
-                self.page.update()  
+                self.request_update(error_text, success_text)
                 return
             
             if not feedback_from_field.value or not feedback_text_field.value:
                 error_text.value = "⚠️ Vul alle verplichte velden (*) in!"
                 error_text.visible = True
                 success_text.visible = False
-                self.page.update()
+                self.request_update(error_text, success_text)
                 return
             
-            # Add feedback to the selected portfolio item
-            selected_index = int(portfolio_dropdown.value)
-            
             feedback_entry = {
                 "from": feedback_from_field.value.strip(),
                 "text": feedback_text_field.value.strip(),
@@ -1002,13 +2910,11 @@ class PortfolioManager:
                 "date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
             }
             
-            # Initialize feedback list if it doesn't exist
-            if 'feedback' not in self.portfolio_items[selected_index]:
-                self.portfolio_items[selected_index]['feedback'] = []
-            
-            self.portfolio_items[selected_index]['feedback'].append(feedback_entry)
-            
-            self.save_data()
+            # Add feedback to the selected portfolio item
+            with self._data_lock:
+                selected_index = self.find_item_index(portfolio_dropdown.value)
+                if selected_index is not None:
+                    self.execute_command([self.feedback_change(selected_index, feedback_entry)])
             
             error_text.visible = False
             success_text.value = "✅ Feedback succesvol toegevoegd!"
@@ -1020,17 +2926,21 @@ class PortfolioManager:
             portfolio_dropdown.value = None
             lo_radio_group.content.controls.clear()
             lo_radio_group.value = None
+            draft_text.visible = False
+            self.drafts.discard("feedback:any")
+            self.drafts.track("feedback:any", draft_fields)
             
-            self.page.update()
+            self.request_update()
         
         content = ft.Column([
             self.show_back_button(),
             ft.Card(
                 content=ft.Container(
                     content=ft.Column([
-                        ft.Text(self.get_text("feedback_add_title"), size=20, weight=ft.FontWeight.BOLD),
-                        ft.Text(self.get_text("feedback_add_subtitle"), 
+                        self.bound_text("feedback_add_title", size=20, weight=ft.FontWeight.BOLD),
+                        self.bound_text("feedback_add_subtitle", 
                                size=14, color=ft.Colors.GREY_600),
+                        draft_text,
                         error_text,
                         success_text,
                         portfolio_dropdown,
@@ -1061,8 +2971,8 @@ class PortfolioManager:
             )
         ], scroll=ft.ScrollMode.AUTO)
         
-        self.content_container.content = self.center_content(content)
-        self.page.update()
+        self.views.show_transient(self.center_content(content))
+        self.request_update()
 
     def show_add_feedback_for_item_view(self, item_index):
         """Show add feedback view for a specific portfolio item"""
@@ -1090,18 +3000,20 @@ class PortfolioManager:
         )
         
         # Feedback fields
-        feedback_from_field = ft.TextField(
-            label=self.get_text("feedback_from_label"),
+        feedback_from_field = self.bind(ft.TextField(
             width=600
-        )
+        ), label="feedback_from_label")
         
-        feedback_text_field = ft.TextField(
-            label=self.get_text("feedback_text_label"),
+        feedback_text_field = self.bind(ft.TextField(
             multiline=True,
             min_lines=4,
             max_lines=8,
             width=600
-        )
+        ), label="feedback_text_label")
+        
+        draft_key = f"feedback:{selected_item.get('id')}"
+        draft_fields = {"learning_outcome": lo_radio_group, "from": feedback_from_field, "text": feedback_text_field}
+        draft_text = self.track_draft(draft_key, draft_fields)
         
         error_text = ft.Text("", color=ft.Colors.RED, visible=False)
         success_text = ft.Text("", color=ft.Colors.GREEN, visible=False)
@@ -1112,14 +3024,14 @@ class PortfolioManager:
                 error_text.value = "⚠️ Selecteer een leeruitkomst voor de feedback!"
                 error_text.visible = True
                 success_text.visible = False
-                self.page.update()
+                self.request_update(error_text, success_text)
                 return
             
             if not feedback_from_field.value or not feedback_text_field.value:
                 error_text.value = "⚠️ Vul alle verplichte velden (*) in!"
                 error_text.visible = True
                 success_text.visible = False
-                self.page.update()
+                self.request_update(error_text, success_text)
                 return
             
             # Add feedback to the selected portfolio item
@@ -1130,13 +3042,10 @@ class PortfolioManager:
                 "date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
             }
             
-            # Initialize feedback list if it doesn't exist
-            if 'feedback' not in self.portfolio_items[item_index]:
-                self.portfolio_items[item_index]['feedback'] = []
-            
-            self.portfolio_items[item_index]['feedback'].append(feedback_entry)
-            
-            self.save_data()
+            with self._data_lock:
+                current_index = self.find_item_index(selected_item.get('id'))
+                if current_index is not None:
+                    self.execute_command([self.feedback_change(current_index, feedback_entry)])
             
             error_text.visible = False
             success_text.value = "✅ Feedback succesvol toegevoegd!"
@@ -1146,8 +3055,11 @@ class PortfolioManager:
             feedback_from_field.value = ""
             feedback_text_field.value = ""
             lo_radio_group.value = None
+            draft_text.visible = False
+            self.drafts.discard(draft_key)
+            self.drafts.track(draft_key, draft_fields)
             
-            self.page.update()
+            self.request_update()
         
         content = ft.Column([
             self.show_back_button(),
@@ -1155,10 +3067,11 @@ class PortfolioManager:
                 content=ft.Container(
                     content=ft.Column([
                         ft.Text("Feedback Toevoegen", size=20, weight=ft.FontWeight.BOLD),
-                        ft.Text(f"{self.get_text('portfolio_item_label')} {selected_item.get('title', self.get_text('no_title'))}", 
-                               size=16, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
-                        ft.Text(self.get_text("add_feedback_to_item"), 
+                        self.bind(ft.Text(size=16, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
+                                  value=lambda: f"{self.get_text('portfolio_item_label')} {selected_item.get('title', self.get_text('no_title'))}"),
+                        self.bound_text("add_feedback_to_item", 
                                size=14, color=ft.Colors.GREY_600),
+                        draft_text,
                         error_text,
                         success_text,
                         ft.Text("Selecteer een leeruitkomst voor deze feedback:", weight=ft.FontWeight.BOLD),
@@ -1182,137 +3095,313 @@ class PortfolioManager:
             )
         ], scroll=ft.ScrollMode.AUTO)
         
-        self.content_container.content = self.center_content(content)
-        self.page.update()
+        self.views.show_transient(self.center_content(content))
+        self.request_update()
 
-    def show_all_feedback_view(self, e=None):
+    def show_all_feedback_view(self, e=None, page_index=0):
         """Show all feedback from all portfolio items in an overview"""
         self.current_view = "all_feedback"
         
-        feedback_cards = []
+        view = self.views.show("all_feedback", self.build_all_feedback_view)
+        parts = view.data
+        self.refresh_back_button(parts["back_button"])
         
-        # Collect all feedback from all portfolio items
-        for item_idx, item in enumerate(self.portfolio_items):
-            feedback_list = item.get('feedback', [])
-            if feedback_list:
-                # Create card for this portfolio item's feedback
-                item_feedback_card = ft.Card(
-                    content=ft.Container(
-                        content=ft.Column([
-                            ft.Text(f"Portfolio Item: {item['title']}", 
-                                   size=18, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
-                            ft.Text(f"Datum: {item.get('date', 'Onbekend')}", 
-                                   size=12, color=ft.Colors.GREY_600),
-                            ft.Divider(),
-                            
-                            # Show all feedback for this item
-                            ft.Column([
-                                ft.Container(
-                                    content=ft.Column([
-                                        ft.Row([
-                                            ft.Text(f"Van: {feedback.get('from', 'Onbekend')}", 
-                                                   weight=ft.FontWeight.BOLD, color=ft.Colors.GREEN_700),
-                                            ft.Text(f"Datum: {feedback.get('date', 'Onbekend')}", 
-                                                   color=ft.Colors.GREY_600, size=12)
-                                        ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-                                        ft.Row([
-                                            ft.Text(f"LU: {', '.join([f'{lo}' for lo in feedback.get('learning_outcomes', [])])}", 
-                                                   color=ft.Colors.BLUE_600, size=12)
-                                        ]),
-                                        ft.Text(feedback.get('text', ''), 
-                                               size=14, color=ft.Colors.BLACK87)
-                                    ], spacing=5),
-                                    bgcolor=ft.Colors.GREY_50,
-                                    padding=10,
-                                    border_radius=5,
-                                    margin=ft.margin.only(bottom=10)
-                                ) for feedback in feedback_list
-                            ], spacing=5)
-                        ], spacing=10),
-                        padding=20
-                    ),
-                    margin=ft.margin.only(bottom=15)
-                )
-                feedback_cards.append(item_feedback_card)
+        # Counting needs no controls; cards are only built for the visible page
+        items_with_feedback = self.feedback_view_items()
+        page_size = self.feedback_page_size
+        last_page = max(0, (len(items_with_feedback) - 1) // page_size)
+        page_index = max(0, min(page_index, last_page))
+        start = page_index * page_size
+        end = min(start + page_size, len(items_with_feedback))
+        self.feedback_page_index = page_index
         
-        if not feedback_cards:
-            # No feedback found
-            content = ft.Column([
-                self.show_back_button(),
-                ft.Card(
-                    content=ft.Container(
-                        content=ft.Column([
-                            ft.Icon(ft.Icons.FEEDBACK_OUTLINED, size=64, color=ft.Colors.GREY_400),
-                            ft.Text(self.get_text("no_feedback_found"), size=20, weight=ft.FontWeight.BOLD),
-                            ft.Text(self.get_text("no_feedback_msg"), 
-                                   size=14, color=ft.Colors.GREY_600, text_align=ft.TextAlign.CENTER),
-                            ft.Text(self.get_text("no_feedback_hint"), 
-                                   size=14, color=ft.Colors.GREY_600, text_align=ft.TextAlign.CENTER)
-                        ], spacing=15, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                        padding=40
-                    )
-                )
-            ], scroll=ft.ScrollMode.AUTO)
+        # Cards of unchanged items are reused so Flet only sends what changed
+        page_items = items_with_feedback[start:end]
+        parts["cards"].controls = [self.feedback_item_card(item) for item in page_items]
+        shown_ids = {item.get('id') for item in page_items}
+        for item_id in [item_id for item_id in self._feedback_cards if item_id not in shown_ids]:
+            del self._feedback_cards[item_id]
+        has_cards = bool(parts["cards"].controls)
+        parts["empty"].visible = not has_cards
+        parts["list"].visible = has_cards
+        parts["total"].value = f"Totaal {len(items_with_feedback)} portfolio item(s) met feedback"
+        parts["page_text"].value = self.get_text("table_page_info").format(start + 1, end, len(items_with_feedback))
+        parts["prev_button"].disabled = page_index == 0
+        parts["next_button"].disabled = page_index >= last_page
+        
+        if has_cards:
+            self.place_search_field(parts["search_holder"])
         else:
-            # Show all feedback
-            content = ft.Column([
-                self.show_back_button(),
-                ft.Card(
-                    content=ft.Container(
-                        content=ft.Column([
-                            ft.Text(self.get_text("all_feedback_title"), size=24, weight=ft.FontWeight.BOLD),
-                            ft.Text(f"Totaal {len(feedback_cards)} portfolio item(s) met feedback", 
-                                   size=14, color=ft.Colors.GREY_600),
-                            ft.Divider()
-                        ], spacing=10),
-                        padding=20
-                    ),
-                    margin=ft.margin.only(bottom=10)
+            # Keep the search box reachable when a search removed all results
+            self.place_search_field(parts["empty_search_holder"] if self.search_results is not None else None)
+        
+        self.request_update()
+
+    def build_all_feedback_view(self):
+        """Build the feedback overview once; show_all_feedback_view fills in the visible page"""
+        parts = {
+            "back_button": self.show_back_button(),
+            "search_holder": ft.Container(),
+            "empty_search_holder": ft.Container(),
+            "total": ft.Text(size=14, color=ft.Colors.GREY_600),
+            "cards": ft.Column([], spacing=0),
+            "page_text": ft.Text(size=12, color=ft.Colors.GREY_600),
+            "prev_button": ft.IconButton(
+                icon=ft.Icons.CHEVRON_LEFT,
+                on_click=lambda e: self.show_all_feedback_view(page_index=self.feedback_page_index - 1)
+            ),
+            "next_button": ft.IconButton(
+                icon=ft.Icons.CHEVRON_RIGHT,
+                on_click=lambda e: self.show_all_feedback_view(page_index=self.feedback_page_index + 1)
+            )
+        }
+        
+        # No feedback found
+        parts["empty"] = ft.Card(
+            content=ft.Container(
+                content=ft.Column([
+                    ft.Icon(ft.Icons.FEEDBACK_OUTLINED, size=64, color=ft.Colors.GREY_400),
+                    self.bound_text("no_feedback_found", size=20, weight=ft.FontWeight.BOLD),
+                    self.bound_text("no_feedback_msg", 
+                           size=14, color=ft.Colors.GREY_600, text_align=ft.TextAlign.CENTER),
+                    self.bound_text("no_feedback_hint", 
+                           size=14, color=ft.Colors.GREY_600, text_align=ft.TextAlign.CENTER),
+                    parts["empty_search_holder"]
+                ], spacing=15, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+                padding=40
+            )
+        )
+        
+        # Show all feedback
+        parts["list"] = ft.Column([
+            ft.Card(
+                content=ft.Container(
+                    content=ft.Column([
+                        self.bound_text("all_feedback_title", size=24, weight=ft.FontWeight.BOLD),
+                        parts["total"],
+                        parts["search_holder"],
+                        ft.Divider()
+                    ], spacing=10),
+                    padding=20
                 ),
-                ft.Column(feedback_cards, spacing=0)
-            ], scroll=ft.ScrollMode.AUTO)
+                margin=ft.margin.only(bottom=10)
+            ),
+            parts["cards"],
+            ft.Row([
+                parts["prev_button"],
+                parts["page_text"],
+                parts["next_button"]
+            ], alignment=ft.MainAxisAlignment.CENTER)
+        ])
+        
+        view = self.center_content(ft.Column([
+            parts["back_button"],
+            parts["empty"],
+            parts["list"]
+        ], scroll=ft.ScrollMode.AUTO))
+        view.data = parts
+        return view
+
+    def feedback_item_card(self, item):
+        """Return the cached card of an item, rebuilding it only when the item changed"""
+        key = item.get('id')
+        cached = self._feedback_cards.get(key)
+        if cached is not None and cached[0] is item and cached[1] == item.get('version'):
+            return cached[2]
+        card = self.build_feedback_item_card(item)
+        self._feedback_cards[key] = (item, item.get('version'), card)
+        return card
+
+    def feedback_view_items(self):
+        """Return the items listed in the feedback overview"""
+        return [item for item in self.portfolio_items if item.get('feedback') and
+                (self.search_results is None or item.get('id') in self.search_results)]
+
+    def build_feedback_item_card(self, item):
+        """Build the card of one item in the feedback overview; its feedback is built when expanded"""
+        feedback_list = item.get('feedback', [])
+        entries = ft.Column([], spacing=5, visible=False)
+        toggle_button = self.bind(
+            ft.TextButton(icon=ft.Icons.EXPAND_MORE),
+            text=lambda: self.get_text("hide_feedback" if entries.visible else "show_feedback").format(len(feedback_list))
+        )
+        
+        def toggle_feedback(e):
+            if not entries.controls:
+                entries.controls = [self.build_feedback_entry(feedback) for feedback in feedback_list]
+            entries.visible = not entries.visible
+            self.apply_translation(toggle_button)
+            toggle_button.icon = ft.Icons.EXPAND_LESS if entries.visible else ft.Icons.EXPAND_MORE
+            self.request_update(toggle_button, entries)
+        
+        toggle_button.on_click = toggle_feedback
+        
+        return ft.Card(
+            content=ft.Container(
+                content=ft.Column([
+                    ft.Text(f"Portfolio Item: {item['title']}", 
+                           size=18, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
+                    ft.Text(f"Datum: {item.get('date', 'Onbekend')}", 
+                           size=12, color=ft.Colors.GREY_600),
+                    ft.Divider(),
+                    toggle_button,
+                    entries
+                ], spacing=10),
+                padding=20
+            ),
+            margin=ft.margin.only(bottom=15)
+        )
+
+    def build_feedback_entry(self, feedback):
+        """Build the control for a single feedback entry"""
+        return ft.Container(
+            content=ft.Column([
+                ft.Row([
+                    ft.Text(f"Van: {feedback.get('from', 'Onbekend')}", 
+                           weight=ft.FontWeight.BOLD, color=ft.Colors.GREEN_700),
+                    ft.Text(f"Datum: {feedback.get('date', 'Onbekend')}", 
+                           color=ft.Colors.GREY_600, size=12)
+                ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                ft.Row([
+                    ft.Text(f"LU: {', '.join([f'{lo}' for lo in feedback.get('learning_outcomes', [])])}", 
+                           color=ft.Colors.BLUE_600, size=12)
+                ]),
+                ft.Text(feedback.get('text', ''), 
+                       size=14, color=ft.Colors.BLACK87)
+            ], spacing=5),
+            bgcolor=ft.Colors.GREY_50,
+            padding=10,
+            border_radius=5,
+            margin=ft.margin.only(bottom=10)
+        )
+
+    def show_dashboard_view(self, e=None):
+        """Show per learning outcome how far the portfolio is"""
+        self.current_view = "dashboard"
         
-        self.content_container.content = self.center_content(content)
-        self.page.update()
+        view = self.views.show("dashboard", self.build_dashboard_view)
+        self.refresh_back_button(view.data["back_button"])
+        
+        # Only the cards of learning outcomes whose numbers changed are patched
+        changed = []
+        for lo in self.coverage.take_dirty():
+            cells = view.data["cells"].get(lo)
+            if cells is None:
+                continue
+            for control in cells["stats"]:
+                self.apply_translation(control)
+            for icon, covered in zip(cells["indicators"], self.coverage.covered_indicators(lo)):
+                icon.name = ft.Icons.CHECK_CIRCLE if covered else ft.Icons.RADIO_BUTTON_UNCHECKED
+                icon.color = ft.Colors.GREEN_600 if covered else ft.Colors.GREY_400
+            changed.extend(cells["stats"] + cells["indicators"])
+        self.request_update(self.view_host, *changed)
+
+    def build_dashboard_view(self):
+        """Build one card per learning outcome; show_dashboard_view fills in the numbers"""
+        back_button = self.show_back_button()
+        cells = {}
+        cards = []
+        for lo_num, lo_data in self.learning_outcomes.items():
+            personal = lambda lo=lo_num: self.coverage.counts(lo)[0]
+            group = lambda lo=lo_num: self.coverage.counts(lo)[1]
+            feedback = lambda lo=lo_num: self.aggregates.feedback_per_lo.get(lo, 0)
+            stats = [
+                self.bind(ft.Text(size=14), value=lambda count=personal: f"{self.get_text('dashboard_personal')}: {count()}"),
+                self.bind(ft.Text(size=14), value=lambda count=group: f"{self.get_text('dashboard_group')}: {count()}"),
+                self.bind(ft.Text(size=14), value=lambda count=feedback: f"{self.get_text('dashboard_feedback')}: {count()}"),
+            ]
+            indicators = [ft.Icon(ft.Icons.RADIO_BUTTON_UNCHECKED, size=16, color=ft.Colors.GREY_400)
+                          for _ in lo_data['indicators']]
+            cells[lo_num] = {"stats": stats, "indicators": indicators}
+            cards.append(ft.Card(
+                content=ft.Container(
+                    content=ft.Column([
+                        ft.Text(f"LU{lo_num}: {lo_data['title']}", size=16, weight=ft.FontWeight.BOLD),
+                        ft.Row(stats, spacing=15),
+                        ft.Divider(),
+                        self.bound_text("indicators_label", size=14, weight=ft.FontWeight.BOLD),
+                        ft.Column([
+                            ft.Row([icon, ft.Text(indicator, size=13)], spacing=5)
+                            for icon, indicator in zip(indicators, lo_data['indicators'])
+                        ], spacing=2)
+                    ], spacing=8),
+                    padding=15,
+                    width=380
+                )
+            ))
+        
+        # Everything is filled in on the first show
+        self.coverage.mark_dirty(self.learning_outcomes)
+        
+        view = self.center_content(ft.Column([
+            back_button,
+            ft.Card(
+                content=ft.Container(
+                    content=ft.Column([
+                        self.bound_text("dashboard_title", size=24, weight=ft.FontWeight.BOLD),
+                        self.bound_text("dashboard_subtitle", size=14, color=ft.Colors.GREY_600)
+                    ], spacing=10),
+                    padding=20
+                ),
+                margin=ft.margin.only(bottom=10)
+            ),
+            ft.Row(cards, wrap=True, spacing=10, run_spacing=10, alignment=ft.MainAxisAlignment.CENTER)
+        ], scroll=ft.ScrollMode.AUTO))
+        view.data = {"back_button": back_button, "cells": cells}
+        return view
 
     def show_submit_document_view(self, e=None):
         """Show document submission view"""
         self.current_view = "submit_document"
         
-        proud_field = ft.TextField(
-            label=self.get_text("proud_of_label"),
+        # Generating is likely now; load the PDF libraries while the reflection is typed
+        self.prewarm_document_libraries()
+        self.harvest_repo_activity()
+        self.scan_git_evidence()
+        
+        proud_field = self.bind(ft.TextField(
             multiline=True,
             min_lines=4,
             value=self.reflection_data.get('proud_of', ''),
             width=600
-        )
+        ), label="proud_of_label")
         
-        struggled_field = ft.TextField(
-            label=self.get_text("struggled_with_label"),
+        struggled_field = self.bind(ft.TextField(
             multiline=True,
             min_lines=4,
             value=self.reflection_data.get('struggled_with', ''),
             width=600
-        )
+        ), label="struggled_with_label")
         
-        learn_field = ft.TextField(
-            label=self.get_text("want_to_learn_label"),
+        learn_field = self.bind(ft.TextField(
             multiline=True,
             min_lines=4,
             value=self.reflection_data.get('want_to_learn', ''),
             width=600
-        )
+        ), label="want_to_learn_label")
         
         # Always start unchecked for security
-        complete_checkbox = ft.Checkbox(
-            label=self.get_text("confirm_complete"),
+        complete_checkbox = self.bind(ft.Checkbox(
             value=False
-        )
+        ), label="confirm_complete")
         
-        generate_md_checkbox = ft.Checkbox(
-            label=self.get_text("generate_markdown"),
+        generate_md_checkbox = self.bind(ft.Checkbox(
             value=False
-        )
+        ), label="generate_markdown")
+        
+        reflection_fields = {
+            "proud_of": proud_field,
+            "struggled_with": struggled_field,
+            "want_to_learn": learn_field
+        }
+        draft_text = self.track_draft("reflection", reflection_fields)
+        # The preview follows the text from the draft snapshot tick and when a field loses focus,
+        # not from a handler per keystroke
+        for field in reflection_fields.values():
+            field.on_blur = lambda e: self.schedule_preview(delay=0)
+        
+        preview_column = ft.Column([ft.ProgressRing(width=24, height=24)], spacing=0)
+        self.preview = {"fields": reflection_fields, "column": preview_column, "sections": {}}
         
         error_text = ft.Text("", color=ft.Colors.RED, visible=False)
         success_text = ft.Text("", color=ft.Colors.GREEN, visible=False)
@@ -1342,57 +3431,65 @@ class PortfolioManager:
                     bgcolor=ft.Colors.GREY_400,
                     color=ft.Colors.WHITE
                 )
-            self.page.update()
+            self.request_update(generate_button)
         
         def generate_document(e):
             if not proud_field.value or not struggled_field.value or not learn_field.value:
                 error_text.value = "⚠️ Vul alle reflectie vragen in!"
                 error_text.visible = True
                 success_text.visible = False
-                self.page.update()
+                self.request_update(error_text, success_text)
                 return
             
             if not complete_checkbox.value:
                 error_text.value = "⚠️ Bevestig dat je portfolio compleet is!"
                 error_text.visible = True
                 success_text.visible = False
-                self.page.update()
+                self.request_update(error_text, success_text)
                 return
             
-            self.reflection_data = {
+            self.execute_command(records={"reflection_data": {
                 "proud_of": proud_field.value.strip(),
                 "struggled_with": struggled_field.value.strip(),
                 "want_to_learn": learn_field.value.strip(),
                 "is_complete": True,
                 "generate_markdown": generate_md_checkbox.value,
                 "submission_date": datetime.datetime.now().isoformat()
-            }
-            self.save_data()
+            }})
+            self.drafts.discard("reflection")
+            
+            def finished(succeeded):
+                error_text.visible = not succeeded
+                error_text.value = "❌ Document generatie mislukt, zie de melding in de console"
+                success_text.value = "✅ Document succesvol gegenereerd!"
+                success_text.visible = succeeded
+                self.request_update(error_text, success_text)
             
             # Generate documents
             try:
-                self.generate_documents()
+                self.generate_documents(on_finished=finished)
                 error_text.visible = False
-                success_text.value = "✅ Document succesvol gegenereerd!"
+                success_text.value = "⏳ Document wordt gegenereerd..."
                 success_text.visible = True
-                self.page.update()
+                self.request_update(error_text, success_text)
             except Exception as ex:
                 error_text.value = f"❌ Document generatie mislukt: {str(ex)}"
                 error_text.visible = True
                 success_text.visible = False
-                self.page.update()
+                self.request_update(error_text, success_text)
         
         # Set the checkbox change handler and button click handler
         complete_checkbox.on_change = update_button_state
         generate_button.on_click = generate_document
         
-        content = ft.Column([
+        form = ft.Column([
             self.show_back_button(),
             ft.Card(
                 content=ft.Container(
                     content=ft.Column([
                         ft.Text("Document Inleveren", size=20, weight=ft.FontWeight.BOLD),
                         ft.Text("Reflectie Vragen", size=16, weight=ft.FontWeight.BOLD),
+                        draft_text,
                         error_text,
                         success_text,
                         proud_field,
@@ -1405,14 +3502,134 @@ class PortfolioManager:
                     padding=20
                 )
             )
-        ], scroll=ft.ScrollMode.AUTO)
+        ], scroll=ft.ScrollMode.AUTO, width=680)
+        
+        preview_pane = ft.Container(
+            content=ft.Column([
+                self.bound_text("preview_title", size=16, weight=ft.FontWeight.BOLD),
+                self.bound_text("preview_hint", size=12, color=ft.Colors.GREY_600),
+                ft.Divider(),
+                preview_column
+            ], scroll=ft.ScrollMode.AUTO, expand=True),
+            padding=20,
+            border=ft.border.all(1, ft.Colors.GREY_300),
+            border_radius=8,
+            expand=True
+        )
+        
+        content = ft.Row([form, preview_pane], vertical_alignment=ft.CrossAxisAlignment.START, spacing=20, expand=True)
+        self.views.show_transient(self.center_content(content))
+        self.request_update()
+        self.schedule_preview(delay=0)
+
+    def harvest_repo_activity(self):
+        """Fetch the GitHub activity of the linked repositories in the background"""
+        if self._harvest_thread is not None and self._harvest_thread.is_alive():
+            return
+        repos = {github_repo(item.get('github_link')) for item in self.portfolio_items} - {None}
+        if not repos:
+            return
+        
+        def harvest():
+            try:
+                activity = self.repo_harvester.harvest(repos)
+            except Exception as e:
+                print(f"ERROR: GitHub activiteit ophalen mislukt: {str(e)}")
+                return
+            with self._data_lock:
+                self.repo_activity = dict(self.repo_activity, **activity)
+            self.schedule_preview(delay=0)
+        
+        self._harvest_thread = threading.Thread(target=harvest, name="github-harvest", daemon=True)
+        self._harvest_thread.start()
+
+    def scan_git_evidence(self):
+        """Scan the local repositories of the items in the background; unchanged ones come from the cache"""
+        if self.git_scanner is None:
+            return
+        paths = {item.get('local_repo') for item in self.portfolio_items} - {None, ""}
+        if not paths:
+            return
+        
+        def scan():
+            try:
+                evidence = self.git_scanner.scan(paths)
+            except Exception as e:
+                print(f"ERROR: Lokale repositories scannen mislukt: {str(e)}")
+                return
+            with self._data_lock, self.ui.tree_lock:
+                if all(self.git_evidence.get(path) == stats for path, stats in evidence.items()):
+                    return
+                self.git_evidence = dict(self.git_evidence, **evidence)
+                self.apply_item_changes()
+        
+        self._git_scan_thread = threading.Thread(target=scan, name="git-scan", daemon=True)
+        self._git_scan_thread.start()
+
+    def schedule_preview(self, delay=0.3):
+        """Restart the debounce timer; the preview is rendered once typing pauses"""
+        if self._preview_timer is not None:
+            self._preview_timer.cancel()
+        self._preview_timer = threading.Timer(delay, self.render_preview)
+        self._preview_timer.daemon = True
+        self._preview_timer.start()
+
+    def render_preview(self):
+        """Render the document preview, sending only the sections that changed"""
+        preview = self.preview
+        if preview is None or self.current_view != "submit_document":
+            return
+        reflection = {key: (field.value or "").strip() for key, field in preview["fields"].items()}
+        with self._data_lock:
+            sections = self.document_sections(reflection, cache=self.preview_cache)
         
-        self.content_container.content = self.center_content(content)
-        self.page.update()
+        with self._data_lock, self.ui.tree_lock:
+            if preview is not self.preview or self.current_view != "submit_document":
+                return
+            column = preview["column"]
+            changed = []
+            if not preview["sections"]:
+                column.controls.clear()
+                changed.append(column)
+            for key, markdown in sections:
+                control = preview["sections"].get(key)
+                if control is None:
+                    control = preview["sections"][key] = ft.Markdown(
+                        selectable=True,
+                        extension_set=ft.MarkdownExtensionSet.GITHUB_WEB
+                    )
+                    column.controls.append(control)
+                    if column not in changed:
+                        changed.append(column)
+                elif control.data == markdown:
+                    continue
+                control.data = markdown
+                control.value = preview_markdown(markdown)
+                changed.append(control)
+            if changed:
+                self.request_update(*changed)
 
     def update_display(self):
         """Update the display with current data"""
-        # Update student info
+        if self.debug:
+            self.check_aggregates()
+        self.update_display_info()
+        
+        # Only update portfolio data if we're in main view
+        if self.current_view != "main":
+            self.request_update()
+            return
+        
+        self.update_attention_card()
+        self.refresh_filter_counts()
+        
+        # Update portfolio items table
+        self.reconcile_portfolio_rows()
+        
+        self.request_update()
+
+    def update_display_info(self):
+        """Update the student info text and window title"""
         if self.student_info:
             semester = self.student_info.get('semester', '')
             info_text = f"Naam: {self.student_info.get('name', '')} | " \
@@ -1424,84 +3641,394 @@ class PortfolioManager:
             # Update window title
             if semester:
                 self.page.title = f"Portfolio Document Manager - TI S{semester}"
-        
-        # Only update portfolio data if we're in main view
-        if self.current_view != "main":
-            self.page.update()
-            return
-        
-        # Update attention message for feedback
+
+    def update_attention_card(self):
+        """Update attention message for feedback; the card is only rebuilt when its message changes"""
         items_without_feedback = self.count_items_without_feedback()
         if items_without_feedback > 0:
             if items_without_feedback == 1:
                 attention_text = self.get_text("attention_items_without_feedback_single").format(items_without_feedback)
             else:
                 attention_text = self.get_text("attention_items_without_feedback_multiple").format(items_without_feedback)
-            
+            message = ("warning", self.get_text("important"), attention_text)
+        elif self.portfolio_items:  # Only show if there are items
+            message = ("done", self.get_text("attention_all_items_have_feedback"))
+        else:
+            message = None
+        if message == self._attention_message:
+            return
+        self._attention_message = message
+        
+        if message is None:
+            self.attention_card.visible = False
+        elif message[0] == "warning":
             self.attention_card.content = ft.Container(
                 content=ft.Row([
                     ft.Icon(ft.Icons.WARNING, color=ft.Colors.RED),
-                    ft.Text(self.get_text("important"), weight=ft.FontWeight.BOLD, color=ft.Colors.RED),
-                    ft.Text(attention_text, color=ft.Colors.RED)
+                    ft.Text(message[1], weight=ft.FontWeight.BOLD, color=ft.Colors.RED),
+                    ft.Text(message[2], color=ft.Colors.RED)
                 ], wrap=True),
                 padding=20,
                 bgcolor=ft.Colors.RED_50
             )
             self.attention_card.visible = True
         else:
-            if self.portfolio_items:  # Only show if there are items
-                self.attention_card.content = ft.Container(
-                    content=ft.Row([
-                        ft.Icon(ft.Icons.CHECK_CIRCLE, color=ft.Colors.GREEN),
-                        ft.Text(self.get_text("attention_all_items_have_feedback"), color=ft.Colors.GREEN)
-                    ], wrap=True),
-                    padding=20,
-                    bgcolor=ft.Colors.GREEN_50
+            self.attention_card.content = ft.Container(
+                content=ft.Row([
+                    ft.Icon(ft.Icons.CHECK_CIRCLE, color=ft.Colors.GREEN),
+                    ft.Text(message[1], color=ft.Colors.GREEN)
+                ], wrap=True),
+                padding=20,
+                bgcolor=ft.Colors.GREEN_50
+            )
+            self.attention_card.visible = True
+
+    def portfolio_row_values(self, item):
+        """Return the texts shown in the table cells for an item"""
+        learning_outcomes_text = ", ".join([f"LU{lo}" for lo in item.get('learning_outcomes', [])])
+        item_type = self.get_text("type_group") if item.get('is_group_work', False) else self.get_text("type_personal")
+        feedback_count = len(item.get('feedback', []))
+        values = (
+            item.get('title', 'Geen titel'),
+            learning_outcomes_text,
+            item_type,
+            item.get('date_added', ''),
+            f"({feedback_count})"
+        )
+        if self.git_scanner is None:
+            return values
+        git_text = ""
+        git_stats = self.git_evidence.get(item.get('local_repo'))
+        if git_stats is not None:
+            git_text = self.get_text("git_not_found") if "error" in git_stats else \
+                self.get_text("git_summary").format(git_stats["commits"], len(git_stats["authors"]))
+        return values + (git_text,)
+
+    def build_portfolio_row(self, item_id, values):
+        """Build the table row for a single portfolio item"""
+        return ft.DataRow(
+            on_select_changed=lambda e: self.toggle_item_selection(item_id, e.data == "true"),
+            cells=[ft.DataCell(ft.Text(value)) for value in values] + [
+                ft.DataCell(
+                    # One button per row; the actual actions are built when it is pressed
+                    self.bind(ft.IconButton(
+                        icon=ft.Icons.MORE_VERT,
+                        on_click=lambda e: self.show_item_actions(item_id)
+                    ), tooltip="table_actions")
                 )
-                self.attention_card.visible = True
+            ]
+        )
+
+    def visible_portfolio_items(self):
+        """Return the items the table should list, in display order"""
+        items = self.portfolio_items
+        if self.sort_column is not None:
+            # The index follows every change through track_item_change and friends
+            items = self.sort_index.ordered_items(self.sort_column, self.sort_ascending)
+        
+        filter_type = self.filter_type.value
+        filter_lo = self.filter_learning_outcome.value
+        without_feedback = self.filter_without_feedback.value
+        if self.search_results is None and filter_type == "all" and filter_lo == "all" and not without_feedback:
+            return items
+        
+        def matches(item):
+            if self.search_results is not None and item.get('id') not in self.search_results:
+                return False
+            if filter_type != "all" and item.get('is_group_work', False) != (filter_type == "group"):
+                return False
+            if filter_lo != "all" and int(filter_lo) not in item.get('learning_outcomes', []):
+                return False
+            if without_feedback and item.get('feedback'):
+                return False
+            return True
+        
+        return [item for item in items if matches(item)]
+
+    def sort_table(self, e):
+        """Sort the table on the clicked column"""
+        self.sort_column = self.sort_columns[e.column_index]
+        self.sort_ascending = e.ascending
+        self.portfolio_data_table.sort_column_index = e.column_index
+        self.portfolio_data_table.sort_ascending = e.ascending
+        self.table_page = 0
+        self.reconcile_portfolio_rows()
+        self.request_update(*self.table_controls())
+
+    def apply_table_filters(self):
+        """Show the first page of the table with the current filters"""
+        self.table_page = 0
+        self.reconcile_portfolio_rows()
+        self.request_update(*self.table_controls())
+
+    def on_search_change(self, e):
+        """Restart the debounce timer; the search runs once typing pauses"""
+        if self._search_timer is not None:
+            self._search_timer.cancel()
+        self._search_timer = threading.Timer(0.15, self.run_search)
+        self._search_timer.daemon = True
+        self._search_timer.start()
+
+    def run_search(self):
+        """Filter the main table and the feedback overview on the search query"""
+        with self._data_lock:
+            self.search_index.refresh(self.portfolio_items)
+            self.search_results = self.search_index.search(self.search_field.value or "")
+        with self._data_lock, self.ui.tree_lock:
+            if self.current_view == "main":
+                self.table_page = 0
+                self.reconcile_portfolio_rows()
+                self.request_update(*self.table_controls())
+            elif self.current_view == "all_feedback":
+                self.show_all_feedback_view()
+
+    def reconcile_portfolio_rows(self):
+        """Bring the table rows of the current page in line with the items, keyed by item id.
+        
+        Rows of unchanged items are reused as-is and changed items only get their
+        cell texts patched, so Flet sends just the differences on the next update.
+        """
+        items = self.visible_portfolio_items()
+        total = len(items)
+        last_page = max(0, (total - 1) // self.table_page_size)
+        self.table_page = max(0, min(self.table_page, last_page))
+        start = self.table_page * self.table_page_size
+        end = min(start + self.table_page_size, total)
+        
+        rows = []
+        row_cache = {}
+        for item in items[start:end]:
+            item_id = item.get('id')
+            values = self.portfolio_row_values(item)
+            cached = self._row_cache.get(item_id)
+            if cached is None:
+                row = self.build_portfolio_row(item_id, values)
             else:
-                self.attention_card.visible = False
+                row, previous_values = cached
+                if previous_values != values:
+                    for cell, value in zip(row.cells, values):
+                        cell.content.value = value
+            row.selected = item_id in self.selected_item_ids
+            row_cache[item_id] = (row, values)
+            rows.append(row)
+        self._row_cache = row_cache
+        self.portfolio_data_table.rows = rows
         
-        # Update portfolio items table
-        self.portfolio_data_table.rows.clear()
+        self.table_page_text.value = self.get_text("table_page_info").format(start + 1 if total else 0, end, total)
+        self.table_prev_button.disabled = self.table_page == 0
+        self.table_next_button.disabled = self.table_page >= last_page
+
+    def table_controls(self):
+        """Controls changed by reconcile_portfolio_rows"""
+        return self.portfolio_data_table, self.table_page_text, self.table_prev_button, self.table_next_button
+
+    def change_table_page(self, delta):
+        """Show the previous or next page of the portfolio table"""
+        self.table_page += delta
+        self.reconcile_portfolio_rows()
+        self.request_update(*self.table_controls())
+
+    def toggle_item_selection(self, item_id, selected):
+        """Tick or untick a single table row"""
+        if selected:
+            self.selected_item_ids.add(item_id)
+        else:
+            self.selected_item_ids.discard(item_id)
+        cached = self._row_cache.get(item_id)
+        if cached is not None:
+            cached[0].selected = selected
+            self.request_update(cached[0])
+        self.refresh_bulk_actions()
+
+    def on_select_all_rows(self, e):
+        """The header checkbox selects every item that passes the filters, not just this page"""
+        if e.data == "true":
+            self.selected_item_ids = {item.get('id') for item in self.visible_portfolio_items()}
+        else:
+            self.selected_item_ids = set()
+        self.reconcile_portfolio_rows()
+        self.request_update(*self.table_controls())
+        self.refresh_bulk_actions()
+
+    def clear_selection(self):
+        """Untick all rows"""
+        self.selected_item_ids = set()
+        self.reconcile_portfolio_rows()
+        self.request_update(*self.table_controls())
+        self.refresh_bulk_actions()
+
+    def refresh_bulk_actions(self):
+        """Show the bulk actions while rows are selected"""
+        self.apply_translation(self.selection_text)
+        self.bulk_actions.visible = bool(self.selected_item_ids)
+        self.request_update(self.bulk_actions)
+
+    def run_bulk_action(self, change):
+        """Apply change to every selected item as one transaction with one save and one UI update.
         
-        for i, item in enumerate(self.portfolio_items):
-            learning_outcomes_text = ", ".join([f"LU{lo}" for lo in item.get('learning_outcomes', [])])
-            item_type = self.get_text("type_group") if item.get('is_group_work', False) else self.get_text("type_personal")
-            feedback_count = len(item.get('feedback', []))
-            
-            self.portfolio_data_table.rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(item.get('title', 'Geen titel'))),
-                        ft.DataCell(ft.Text(learning_outcomes_text)),
-                        ft.DataCell(ft.Text(item_type)),
-                        ft.DataCell(ft.Text(item.get('date_added', ''))),
-                        ft.DataCell(ft.Text(f"({feedback_count})")),
-                        ft.DataCell(
-                            ft.Row([
-                                ft.IconButton(
-                                    icon=ft.Icons.EDIT,
-                                    tooltip="Bewerken",
-                                    on_click=lambda e, idx=i: self.edit_portfolio_item(idx)
-                                ),
-                                ft.IconButton(
-                                    icon=ft.Icons.FEEDBACK,
-                                    tooltip="Feedback Toevoegen",
-                                    on_click=lambda e, idx=i: self.show_add_feedback_for_item_view(idx)
-                                ),
-                                ft.IconButton(
-                                    icon=ft.Icons.DELETE,
-                                    tooltip="Verwijderen",
-                                    on_click=lambda e, idx=i: self.delete_portfolio_item(idx)
-                                )
-                            ], tight=True)
-                        )
-                    ]
+        change gets a copy of an item and returns the new item, or None to delete it.
+        Nothing is stored until all items went through, so a failure changes nothing.
+        """
+        with self._data_lock:
+            selected = self.selected_item_ids
+            changes = []
+            for index, item in enumerate(self.portfolio_items):
+                if item.get('id') not in selected:
+                    continue
+                new_item = change(json_copy(item))
+                if new_item != item:
+                    changes.append((index, item, new_item))
+            self.execute_command(changes)
+        
+        self.selected_item_ids = set()
+        self.refresh_bulk_actions()
+        self.apply_item_changes()
+
+    def open_bulk_dialog(self, title, controls, apply):
+        """Ask for the input of a bulk action; apply returns an error text or None when done"""
+        error_text = ft.Text("", color=ft.Colors.RED, visible=False)
+        
+        def confirm(e):
+            error = apply()
+            if error:
+                error_text.value = error
+                error_text.visible = True
+                self.request_update(error_text)
+                return
+            self.close_dialog(dialog)
+        
+        dialog = ft.AlertDialog(
+            title=ft.Text(f"{title} ({self.get_text('selection_count').format(len(self.selected_item_ids))})"),
+            content=ft.Column([error_text] + controls, tight=True, scroll=ft.ScrollMode.AUTO),
+            actions=[
+                ft.TextButton(self.get_text("cancel_btn"), on_click=lambda e: self.close_dialog(dialog)),
+                ft.ElevatedButton(self.get_text("apply_btn"), on_click=confirm)
+            ]
+        )
+        
+        self.page.dialog = dialog
+        dialog.open = True
+        self.request_update()
+
+    def bulk_delete(self, e=None):
+        """Delete all selected items"""
+        def apply():
+            self.run_bulk_action(lambda item: None)
+        
+        message = self.get_text("bulk_delete_confirm").format(len(self.selected_item_ids))
+        self.open_bulk_dialog(self.get_text("delete_tooltip"), [ft.Text(message, color=ft.Colors.RED)], apply)
+
+    def bulk_change_learning_outcomes(self, e=None):
+        """Replace the learning outcomes of all selected items"""
+        checkboxes = {lo_num: ft.Checkbox(label=f"LU{lo_num}: {lo_data['title']}")
+                      for lo_num, lo_data in self.learning_outcomes.items()}
+        
+        def apply():
+            selected_los = [lo_num for lo_num, checkbox in checkboxes.items() if checkbox.value]
+            if not selected_los:
+                return self.get_text("select_min_one_lo")
+            
+            def change(item):
+                item['learning_outcomes'] = selected_los
+                return item
+            self.run_bulk_action(change)
+        
+        self.open_bulk_dialog(self.get_text("bulk_change_los"), list(checkboxes.values()), apply)
+
+    def bulk_change_type(self, e=None):
+        """Mark all selected items as personal or group work"""
+        assignment_type = ft.RadioGroup(
+            content=ft.Column([
+                ft.Radio(value="personal", label=self.get_text("type_personal")),
+                ft.Radio(value="group", label=self.get_text("type_group"))
+            ]),
+            value="personal"
+        )
+        
+        def apply():
+            is_group_work = assignment_type.value == "group"
+            
+            def change(item):
+                item['is_group_work'] = is_group_work
+                if not is_group_work:
+                    item.pop('group_members', None)
+                return item
+            self.run_bulk_action(change)
+        
+        self.open_bulk_dialog(self.get_text("bulk_change_type"), [assignment_type], apply)
+
+    def bulk_add_feedback(self, e=None):
+        """Attach the same feedback to all selected items"""
+        lo_dropdown = ft.Dropdown(
+            label=self.get_text("bulk_feedback_lo"),
+            options=[ft.dropdown.Option(str(lo_num), f"LU{lo_num}: {lo_data['title']}")
+                     for lo_num, lo_data in self.learning_outcomes.items()],
+            width=450
+        )
+        feedback_from_field = ft.TextField(label=self.get_text("feedback_from_label"), width=450)
+        feedback_text_field = ft.TextField(label=self.get_text("feedback_text_label"),
+                                           multiline=True, min_lines=3, max_lines=6, width=450)
+        
+        def apply():
+            if not lo_dropdown.value or not feedback_from_field.value or not feedback_text_field.value:
+                return self.get_text("fill_required_fields")
+            feedback_entry = {
+                "from": feedback_from_field.value.strip(),
+                "text": feedback_text_field.value.strip(),
+                "learning_outcomes": [int(lo_dropdown.value)],
+                "date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+            }
+            
+            def change(item):
+                item.setdefault('feedback', []).append(dict(feedback_entry))
+                return item
+            self.run_bulk_action(change)
+        
+        self.open_bulk_dialog(self.get_text("bulk_add_feedback"),
+                              [lo_dropdown, feedback_from_field, feedback_text_field], apply)
+
+    def show_item_actions(self, item_id):
+        """Show the actions for a single table row"""
+        index = self.find_item_index(item_id)
+        if index is None:
+            return
+        
+        def run(action):
+            dialog.open = False
+            index = self.find_item_index(item_id)
+            if index is None:
+                # Removed (by undo or another program) while the dialog was open
+                self.request_update()
+                return
+            action(index)
+        
+        dialog = ft.AlertDialog(
+            title=ft.Text(self.portfolio_items[index].get('title', self.get_text('no_title'))),
+            content=ft.Column([
+                ft.ListTile(
+                    leading=ft.Icon(ft.Icons.EDIT),
+                    title=ft.Text(self.get_text("edit_tooltip")),
+                    on_click=lambda e: run(self.edit_portfolio_item)
+                ),
+                ft.ListTile(
+                    leading=ft.Icon(ft.Icons.FEEDBACK),
+                    title=ft.Text(self.get_text("add_feedback_tooltip")),
+                    on_click=lambda e: run(self.show_add_feedback_for_item_view)
+                ),
+                ft.ListTile(
+                    leading=ft.Icon(ft.Icons.DELETE, color=ft.Colors.RED),
+                    title=ft.Text(self.get_text("delete_tooltip")),
+                    on_click=lambda e: run(self.delete_portfolio_item)
                 )
-            )
+            ], tight=True),
+            actions=[
+                ft.TextButton(self.get_text("cancel_btn"), on_click=lambda e: self.close_dialog(dialog))
+            ]
+        )
         
-        self.page.update()
+        self.page.dialog = dialog
+        dialog.open = True
+        self.request_update()
 
     def first_time_setup(self):
         """First time setup dialog"""
@@ -1525,16 +4052,15 @@ class PortfolioManager:
                 self.show_error_dialog("Fout", "Vul alle velden in!")
                 return
             
-            self.student_info = {
+            self.execute_command(records={"student_info": {
                 "name": name_field.value.strip(),
                 "student_number": number_field.value.strip(),
                 "semester": semester_dropdown.value,
                 "milestone": milestone_dropdown.value
-            }
-            self.save_data()
+            }})
             self.update_display()
             self.close_dialog(dialog)
-            self.page.update()
+            self.request_update()
         
         dialog = ft.AlertDialog(
             modal=True,
@@ -1560,7 +4086,7 @@ class PortfolioManager:
         
         self.page.dialog = dialog
         dialog.open = True
-        self.page.update()
+        self.request_update()
 
     def edit_student_info(self, e):
         """Edit student information"""
@@ -1580,16 +4106,15 @@ class PortfolioManager:
         )
         
         def save_and_close(e):
-            self.student_info = {
+            self.execute_command(records={"student_info": {
                 "name": name_field.value.strip(),
                 "student_number": number_field.value.strip(),
                 "semester": semester_dropdown.value,
                 "milestone": milestone_dropdown.value
-            }
-            self.save_data()
+            }})
             self.update_display()
             self.close_dialog(dialog)
-            self.page.update()
+            self.request_update()
         
         dialog = ft.AlertDialog(
             modal=True,
@@ -1612,7 +4137,14 @@ class PortfolioManager:
         
         self.page.dialog = dialog
         dialog.open = True
-        self.page.update()
+        self.request_update()
+
+    def find_item_index(self, item_id):
+        """Return the current position of the item with the given id, or None"""
+        for i, item in enumerate(self.portfolio_items):
+            if item.get('id') == item_id:
+                return i
+        return None
 
     def add_portfolio_item(self, e):
         """Add a new portfolio item"""
@@ -1629,8 +4161,10 @@ class PortfolioManager:
         item = self.portfolio_items[index]
         
         def confirm_delete(e):
-            del self.portfolio_items[index]
-            self.save_data()
+            with self._data_lock:
+                current_index = self.find_item_index(item.get('id'))
+                if current_index is not None:
+                    self.execute_command([(current_index, self.portfolio_items[current_index], None)])
             self.show_main_view()
         
         def cancel_delete(e):
@@ -1645,8 +4179,8 @@ class PortfolioManager:
                         ft.Icon(ft.Icons.WARNING, color=ft.Colors.RED, size=48),
                         ft.Text(f"Weet je zeker dat je '{item.get('title', 'dit item')}' wilt verwijderen?", 
                                size=16, text_align=ft.TextAlign.CENTER),
-                        ft.Text("Deze actie kan niet ongedaan worden gemaakt.", 
-                               color=ft.Colors.RED, text_align=ft.TextAlign.CENTER),
+                        ft.Text("Je kunt dit ongedaan maken met de knop Ongedaan maken (Ctrl+Z).", 
+                               color=ft.Colors.GREY_600, text_align=ft.TextAlign.CENTER),
                         ft.Row([
                             ft.ElevatedButton(
                                 text="Annuleren",
@@ -1673,13 +4207,13 @@ class PortfolioManager:
             )
         ])
         
-        self.content_container.content = self.center_content(content)
-        self.page.update()
+        self.views.show_transient(self.center_content(content))
+        self.request_update()
 
     def close_dialog(self, dialog):
         """Close dialog and update page"""
         dialog.open = False
-        self.page.update()
+        self.request_update()
 
     def manage_portfolio_items(self, e):
         """Open portfolio items management (simplified as edit is now inline)"""
@@ -1737,38 +4271,44 @@ class PortfolioManager:
                 error_text.value = "⚠️ Vul alle reflectie vragen in!"
                 error_text.visible = True
                 success_text.visible = False
-                self.page.update()
+                self.request_update(error_text, success_text)
                 return
             
             if not complete_checkbox.value:
                 error_text.value = "⚠️ Bevestig dat je portfolio compleet is!"
                 error_text.visible = True
                 success_text.visible = False
-                self.page.update()
+                self.request_update(error_text, success_text)
                 return
             
-            self.reflection_data = {
+            self.execute_command(records={"reflection_data": {
                 "proud_of": proud_field.value.strip(),
                 "struggled_with": struggled_field.value.strip(),
                 "want_to_learn": learn_field.value.strip(),
                 "is_complete": True,
                 "generate_markdown": generate_md_checkbox.value,
                 "submission_date": datetime.datetime.now().isoformat()
-            }
-            self.save_data()
+            }})
+            
+            def finished(succeeded):
+                error_text.visible = not succeeded
+                error_text.value = "❌ Document generatie mislukt, zie de melding in de console"
+                success_text.value = "✅ Document succesvol gegenereerd!"
+                success_text.visible = succeeded
+                self.request_update(error_text, success_text)
             
             # Generate documents
             try:
-                self.generate_documents()
+                self.generate_documents(on_finished=finished)
                 error_text.visible = False
-                success_text.value = "✅ Document succesvol gegenereerd!"
+                success_text.value = "⏳ Document wordt gegenereerd..."
                 success_text.visible = True
-                self.page.update()
+                self.request_update(error_text, success_text)
             except Exception as ex:
                 error_text.value = f"❌ Document generatie mislukt: {str(ex)}"
                 error_text.visible = True
                 success_text.visible = False
-                self.page.update()
+                self.request_update(error_text, success_text)
         
         content = ft.Column([
             self.show_back_button(),
@@ -1799,18 +4339,71 @@ class PortfolioManager:
             )
         ], scroll=ft.ScrollMode.AUTO)
         
-        self.content_container.content = self.center_content(content)
-        self.page.update()
+        self.views.show_transient(self.center_content(content))
+        self.request_update()
+
+    def prewarm_document_libraries(self):
+        """Import markdown and WeasyPrint in the background, once"""
+        if self._document_libraries_prewarmed:
+            return
+        self._document_libraries_prewarmed = True
+        
+        def prewarm():
+            try:
+                import markdown  # noqa: F401
+                import weasyprint  # noqa: F401
+            except Exception as e:
+                # generate_pdf imports them again and reports the error to the user
+                print(f"INFO: Vooraf laden van PDF-bibliotheken mislukt: {str(e)}")
+        
+        threading.Thread(target=prewarm, name="prewarm-pdf", daemon=True).start()
+
+    def generate_documents(self, on_finished=None):
+        """Generate markdown and PDF documents in the background, unless too many sessions are already doing so
+        
+        The document text is put together right away, under the locks of the event
+        that asked for it; rendering the PDF takes seconds and runs on its own thread
+        without them. on_finished(succeeded) is then called under the locks.
+        """
+        # Waiting would hold one of the threads that handle the events of all sessions
+        if not GENERATION_SLOTS.acquire(blocking=False):
+            raise RuntimeError("De server is druk met andere documenten, probeer het zo opnieuw")
+        try:
+            markdown_content = self.document_markdown()
+        except Exception:
+            GENERATION_SLOTS.release()
+            raise
+        
+        def run():
+            try:
+                succeeded = self.write_documents(markdown_content)
+            finally:
+                GENERATION_SLOTS.release()
+            if on_finished is not None:
+                with self._data_lock, self.ui.tree_lock:
+                    on_finished(succeeded)
+        
+        threading.Thread(target=run, name="generate-documents", daemon=True).start()
+
+    def document_markdown(self):
+        """The markdown of the document as it would be generated now"""
+        with self._data_lock:
+            # The evidence table shows the repository statistics that are ready; waiting for
+            # the background threads would hold a generation slot and an event thread
+            if any(thread is not None and thread.is_alive() for thread in (self._harvest_thread, self._git_scan_thread)):
+                print("INFO: Repository statistieken worden nog opgehaald, document gebruikt de huidige gegevens")
+            return self.generate_markdown_document(cache=self.preview_cache)
 
-    def generate_documents(self):
-        """Generate markdown and PDF documents"""
+    def write_documents(self, markdown_content=None):
+        """Write the markdown and PDF documents into the download directory; returns whether that succeeded"""
         try:
-            # Generate markdown content
-            markdown_content = self.generate_markdown_document()
+            if markdown_content is None:
+                markdown_content = self.document_markdown()
             
             # Save markdown file temporarily for PDF generation
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            temp_markdown_filename = f"temp_verantwoordingsdocument_{timestamp}.md"
+            temp_markdown_filename = os.path.join(self.data_dir, f"temp_verantwoordingsdocument_{timestamp}.md")
+            student_name = safe_filename(self.student_info.get('name', 'Student'))
             
             with open(temp_markdown_filename, 'w', encoding='utf-8') as f:
                 f.write(markdown_content)
@@ -1821,7 +4414,7 @@ class PortfolioManager:
             try:
                 self.generate_pdf(temp_markdown_filename)
                 pdf_filename = temp_markdown_filename.replace('.md', '.pdf')
-                final_pdf_filename = f"Verantwoordingsdocument_{self.student_info.get('name', 'Student')}_{timestamp}.pdf"
+                final_pdf_filename = os.path.join(self.download_dir, f"Verantwoordingsdocument_{student_name}_{timestamp}.pdf")
                 os.rename(pdf_filename, final_pdf_filename)
                 generated_files.append(f"PDF: {final_pdf_filename}")
             except Exception as e:
@@ -1829,11 +4422,11 @@ class PortfolioManager:
                 # Clean up temp file
                 if os.path.exists(temp_markdown_filename):
                     os.remove(temp_markdown_filename)
-                return
+                return False
             
             # Generate markdown file if requested
             if self.reflection_data.get('generate_markdown', False):
-                final_markdown_filename = f"Verantwoordingsdocument_{self.student_info.get('name', 'Student')}_{timestamp}.md"
+                final_markdown_filename = os.path.join(self.download_dir, f"Verantwoordingsdocument_{student_name}_{timestamp}.md")
                 os.rename(temp_markdown_filename, final_markdown_filename)
                 generated_files.append(f"Markdown: {final_markdown_filename}")
             else:
@@ -1841,20 +4434,70 @@ class PortfolioManager:
                 if os.path.exists(temp_markdown_filename):
                     os.remove(temp_markdown_filename)
             
+            # In a browser the files are on the server; open the PDF from there
+            if self.download_url:
+                with self._data_lock, self.ui.tree_lock:
+                    self.page.launch_url(self.download_url + urllib.parse.quote(os.path.basename(final_pdf_filename)))
+            
             # Show success message
             files_text = "\\n".join(generated_files)
             self.show_info_dialog("Succes", f"Document succesvol gegenereerd!\\n\\n{files_text}")
+            return True
             
         except Exception as e:
             self.show_error_dialog("Fout", f"Document generatie mislukt: {str(e)}")
+            return False
 
-    def generate_markdown_document(self):
+    def generate_markdown_document(self, reflection=None, cache=None):
         """Generate the complete markdown document (restored to main.py style)"""
+        return "\n".join(markdown for _, markdown in self.document_sections(reflection, cache))
+
+    def document_sections(self, reflection=None, cache=None):
+        """Return the document as (key, markdown) sections: header, reflection and one per learning outcome.
+        
+        With a cache dict a section is only rebuilt when its inputs changed. Items
+        are replaced rather than modified, so comparing the tuples of item dicts
+        is an identity check for unchanged items.
+        """
+        if reflection is None:
+            reflection = self.reflection_data
+        items_per_lo = {lo_num: [] for lo_num in range(1, 10)}
+        for item in self.portfolio_items:
+            for lo_num in set(item.get('learning_outcomes', [])):
+                if lo_num in items_per_lo:
+                    items_per_lo[lo_num].append(item)
+        
+        def section(key, inputs, build):
+            if cache is None:
+                return key, build(*inputs)
+            cached = cache.get(key)
+            if cached is None or cached[0] != inputs:
+                cached = cache[key] = (inputs, build(*inputs))
+            return key, cached[1]
+        
+        header = (self.student_info.get('semester', '4'), self.student_info.get('milestone', ''),
+                  self.student_info.get('name', ''), self.student_info.get('student_number', ''),
+                  datetime.datetime.now().strftime('%d-%m-%Y'))
+        general = (reflection.get('proud_of', '--'), reflection.get('struggled_with', '--'),
+                   reflection.get('want_to_learn', '--'))
+        sections = [section("header", header, self.document_header_markdown),
+                    section("general", general, self.document_general_markdown)]
+        for lo_num in range(1, 10):
+            items = tuple(items_per_lo[lo_num])
+            evidence = None
+            if self.repo_activity or self.git_evidence:
+                evidence = tuple((self.repo_activity.get(github_repo(item.get('github_link'))),
+                                  self.git_evidence.get(item.get('local_repo')))
+                                 for item in items)
+            sections.append(section(f"lo{lo_num}", (lo_num, items, evidence),
+                                    self.document_learning_outcome_markdown))
+        return sections
+
+    def document_header_markdown(self, semester, milestone, name, student_number, date):
+        """Title, table of contents and student details of the document"""
         content = []
-        # Header
         content.append("![logo](https://www.hu.nl/-/media/hu/afbeeldingen/algemeen/hu-logo.ashx) [](logo-id)\n")
         content.append("# Verantwoordingsdocument[](title-id) <!-- omit in toc -->\n")
-        semester = self.student_info.get('semester', '4')
         content.append("### Inhoud[](toc-id)\n")
         content.append(f"- [Portfolio Technische Informatica (TI) semester {semester} (S{semester})](#portfolio-technische-informatica-ti-semester-{semester}-s{semester})")
         content.append("- [Algemeen](#algemeen)")
@@ -1865,89 +4508,97 @@ class PortfolioManager:
         content.append("---\n")
         content.append("**v1.0.5 [](version-id)** Gegenereerd door Portfolio Document Manager[](author-id).\n")
         content.append("---\n")
-        semester = self.student_info.get('semester', '4')
         content.append(f"<h2 class='portfolio-header'>Portfolio Technische Informatica (TI) semester {semester} (S{semester})</h2>\n")
         content.append("Onderwerp | Graag invullen | Opmerking")
         content.append("--- | --- | ---")
-        content.append(f"*Peilmoment* | `peilmoment {self.student_info.get('milestone', '')}` | ")
-        content.append(f"*Naam student* | `{self.student_info.get('name', '')}` | ")
-        content.append(f"*Studentnummer* | `{self.student_info.get('student_number', '')}` | ")
+        content.append(f"*Peilmoment* | `peilmoment {milestone}` | ")
+        content.append(f"*Naam student* | `{name}` | ")
+        content.append(f"*Studentnummer* | `{student_number}` | ")
         content.append(f"*Semester* | `semester {semester}` | ")
-        content.append(f"*Datum* | `{datetime.datetime.now().strftime('%d-%m-%Y')}` | dd-mm-jjjj\n")
+        content.append(f"*Datum* | `{date}` | dd-mm-jjjj\n")
+        return "\n".join(content)
+
+    def document_general_markdown(self, proud_of, struggled_with, want_to_learn):
+        """The reflection questions of the document"""
+        content = []
         content.append("## Algemeen\n")
         content.append(f"*Waar ik het meest trots op ben:*\n")
-        content.append(f"    {self.reflection_data.get('proud_of', '--')}\n")
+        content.append(f"    {proud_of}\n")
         content.append(f"*Waar ik de afgelopen periode moeite mee heb gehad en welke actie ik heb ondernomen:*\n")
-        content.append(f"    {self.reflection_data.get('struggled_with', '--')}\n")
+        content.append(f"    {struggled_with}\n")
         content.append(f"*Wat ik nog graag wil leren en welke actie ik wil gaan ondernemen:*\n")
-        content.append(f"    {self.reflection_data.get('want_to_learn', '--')}\n")
+        content.append(f"    {want_to_learn}\n")
+        content.append("---\n")
+        return "\n".join(content)
+
+    def document_learning_outcome_markdown(self, lo_num, items, evidence=None):
+        """The section of one learning outcome with its items and their feedback.
+        
+        evidence holds (GitHub activity, local git statistics) per item, either may be None.
+        """
+        evidence_notes = {}
+        for item, (repo_activity, git_stats) in zip(items, evidence or ()):
+            note = ""
+            if repo_activity and repo_activity.get("last_commit"):
+                note += (f"<br>laatste commit {format_date_nl(repo_activity['last_commit'])}, "
+                         f"{repo_activity.get('commits_4_weeks') or 0} commits in de laatste 4 weken")
+            if git_stats and git_stats.get("commits"):
+                note += (f"<br>{git_stats['commits']} commits door {', '.join(git_stats['authors'])} "
+                         f"({format_date_nl(git_stats['first_commit'])} t/m {format_date_nl(git_stats['last_commit'])}), "
+                         f"{git_stats['files_changed']} bestanden, +{git_stats['insertions']}/-{git_stats['deletions']} regels")
+            if note:
+                evidence_notes[id(item)] = note
+        content = []
+        if lo_num == 1:
+            content.append("## Leeruitkomsten\n")
+        lo = self.learning_outcomes[lo_num]
+        content.append(f"### Leeruitkomst {lo_num} {lo['title']}\n")
+        content.append(f"*{lo['description']}*\n")
+        content.append("")
+        content.append("**Indicatoren:**")
+        content.append("")
+        content.append('<ul class="indicators-list">')
+        for indicator in lo['indicators']:
+            content.append(f"<li>{indicator}</li>")
+        content.append("</ul>")
+        content.append("")
+        content.append("---\n")
+        personal_items = [item for item in items if not item.get('is_group_work', False)]
+        group_items = [item for item in items if item.get('is_group_work', False)]
+        if personal_items or group_items:
+            for heading, kind_items in (("Persoonlijke opdrachten", personal_items), ("Groepsopdrachten", group_items)):
+                if not kind_items:
+                    continue
+                content.append(f"**Leeruitkomst {lo_num} {heading}:**\n")
+                content.append("| Portfolio-item     | Beschrijving                                           | Bewijslast               |")
+                content.append("|--------------------|--------------------------------------------------------|--------------------------|")
+                for item in kind_items:
+                    content.append(f"| {item.get('title', 'Portfolio-item')} | {item.get('description', 'Beschrijving niet beschikbaar')} | [link naar {item.get('github_link', 'repository')}]({item.get('github_link', 'http://')}){evidence_notes.get(id(item), '')} |")
+                content.append("")
+                for item in kind_items:
+                    relevant_feedback = [feedback for feedback in item.get('feedback', []) 
+                                       if lo_num in feedback.get('learning_outcomes', [])]
+                    if relevant_feedback:
+                        content.append(f"**Feedback op {item.get('title')} voor Leeruitkomst {lo_num}:**")
+                        content.append('<div class="feedback-section">')
+                        for feedback in relevant_feedback:
+                            content.append(f'<div class="feedback-item">')
+                            content.append(f'<strong>{feedback.get("from", "Onbekend")}</strong> ({feedback.get("date", "Geen datum")}):')
+                            content.append(f'<p>{feedback.get("text", "")}</p>')
+                            content.append(f'</div>')
+                        content.append('</div>')
+                        content.append("")
+        else:
+            content.append("<div class='no-portfolio-item'>Student heeft nog geen portfolio item ingeleverd voor deze leeruitkomst.</div>\n")
         content.append("---\n")
-        content.append("## Leeruitkomsten\n")
-        for lo_num in range(1, 10):
-            lo = self.learning_outcomes[lo_num]
-            content.append(f"### Leeruitkomst {lo_num} {lo['title']}\n")
-            content.append(f"*{lo['description']}*\n")
-            content.append("")
-            content.append("**Indicatoren:**")
-            content.append("")
-            content.append('<ul class="indicators-list">')
-            for indicator in lo['indicators']:
-                content.append(f"<li>{indicator}</li>")
-            content.append("</ul>")
-            content.append("")
-            content.append("---\n")
-            personal_items = [item for item in self.portfolio_items 
-                            if lo_num in item.get('learning_outcomes', []) and not item.get('is_group_work', False)]
-            group_items = [item for item in self.portfolio_items 
-                         if lo_num in item.get('learning_outcomes', []) and item.get('is_group_work', False)]
-            if personal_items or group_items:
-                if personal_items:
-                    content.append(f"**Leeruitkomst {lo_num} Persoonlijke opdrachten:**\n")
-                    content.append("| Portfolio-item     | Beschrijving                                           | Bewijslast               |")
-                    content.append("|--------------------|--------------------------------------------------------|--------------------------|")
-                    for item in personal_items:
-                        content.append(f"| {item.get('title', 'Portfolio-item')} | {item.get('description', 'Beschrijving niet beschikbaar')} | [link naar {item.get('github_link', 'repository')}]({item.get('github_link', 'http://')}) |")
-                    content.append("")
-                    for item in personal_items:
-                        relevant_feedback = [feedback for feedback in item.get('feedback', []) 
-                                           if lo_num in feedback.get('learning_outcomes', [])]
-                        if relevant_feedback:
-                            content.append(f"**Feedback op {item.get('title')} voor Leeruitkomst {lo_num}:**")
-                            content.append('<div class="feedback-section">')
-                            for feedback in relevant_feedback:
-                                content.append(f'<div class="feedback-item">')
-                                content.append(f'<strong>{feedback.get("from", "Onbekend")}</strong> ({feedback.get("date", "Geen datum")}):')
-                                content.append(f'<p>{feedback.get("text", "")}</p>')
-                                content.append(f'</div>')
-                            content.append('</div>')
-                            content.append("")
-                if group_items:
-                    content.append(f"**Leeruitkomst {lo_num} Groepsopdrachten:**\n")
-                    content.append("| Portfolio-item     | Beschrijving                                           | Bewijslast               |")
-                    content.append("|--------------------|--------------------------------------------------------|--------------------------|")
-                    for item in group_items:
-                        content.append(f"| {item.get('title', 'Portfolio-item')} | {item.get('description', 'Beschrijving niet beschikbaar')} | [link naar {item.get('github_link', 'repository')}]({item.get('github_link', 'http://')}) |")
-                    content.append("")
-                    for item in group_items:
-                        relevant_feedback = [feedback for feedback in item.get('feedback', []) 
-                                           if lo_num in feedback.get('learning_outcomes', [])]
-                        if relevant_feedback:
-                            content.append(f"**Feedback op {item.get('title')} voor Leeruitkomst {lo_num}:**")
-                            content.append('<div class="feedback-section">')
-                            for feedback in relevant_feedback:
-                                content.append(f'<div class="feedback-item">')
-                                content.append(f'<strong>{feedback.get("from", "Onbekend")}</strong> ({feedback.get("date", "Geen datum")}):')
-                                content.append(f'<p>{feedback.get("text", "")}</p>')
-                                content.append(f'</div>')
-                            content.append('</div>')
-                            content.append("")
-            else:
-                content.append("<div class='no-portfolio-item'>Student heeft nog geen portfolio item ingeleverd voor deze leeruitkomst.</div>\n")
-            content.append("---\n")
         return "\n".join(content)
 
     def generate_pdf(self, markdown_filename):
         """Generate PDF from markdown using weasyprint (restored to main.py style)"""
+        # Imported here: WeasyPrint loads Pango, cffi and fontTools, which would dominate startup
+        import markdown
+        import weasyprint
+        
         with open(markdown_filename, 'r', encoding='utf-8') as f:
             markdown_content = f.read()
         html_content = markdown.markdown(markdown_content, extensions=['tables'])
@@ -1988,29 +4639,220 @@ class PortfolioManager:
         """Load data from JSON file"""
         if os.path.exists(self.data_file):
             try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with FileLock(self.data_file):
+                    with open(self.data_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    
+                    # Items need a stable id so external changes can be matched to them
+                    if ensure_item_ids(data.get("portfolio_items", [])):
+                        self.write_data_file(data)
+                    self._disk_signature = DataFileWatcher.file_signature(self.data_file)
                 
                 self.student_info = data.get("student_info", {})
                 self.portfolio_items = data.get("portfolio_items", [])
                 self.reflection_data = data.get("reflection_data", {})
                 self.current_language = data.get("language", "nl")  # Default to Dutch
+                self.track_items_reloaded()
+                self.remember_disk_state(data)
+                self.data_watcher.acknowledge()
             except Exception as e:
                 print(f"ERROR: Laden van data mislukt: {str(e)}")
 
     def save_data(self):
         """Save data to JSON file"""
-        try:
-            data = {
-                "student_info": self.student_info,
-                "portfolio_items": self.portfolio_items,
-                "reflection_data": self.reflection_data,
-                "language": self.current_language
-            }
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"ERROR: Opslaan van data mislukt: {str(e)}")
+        with self._data_lock:
+            try:
+                # Other app instances and batch jobs hold the same lock while they
+                # read-merge-write, so no edit can slip in between
+                with FileLock(self.data_file):
+                    # Never overwrite edits made by another program since our last read.
+                    # Every write replaces the file, so a file that another program wrote
+                    # has another inode even when its size and mtime match ours.
+                    if os.path.exists(self.data_file) and \
+                            DataFileWatcher.file_signature(self.data_file) != self._disk_signature:
+                        self.sync_external_changes(write_back=False)
+                    # The sort index lists item dicts, so it must know about the copies
+                    for item in stamp_item_versions(self.portfolio_items, self._disk_state["portfolio_items"]):
+                        self.sort_index.update_item(item)
+                    data = {
+                        "student_info": self.student_info,
+                        "portfolio_items": self.portfolio_items,
+                        "reflection_data": self.reflection_data,
+                        "language": self.current_language
+                    }
+                    self.write_data_file(data)
+                    self._disk_signature = DataFileWatcher.file_signature(self.data_file)
+                    self.remember_disk_state(data)
+                    self.data_watcher.acknowledge()
+            except Exception as e:
+                print(f"ERROR: Opslaan van data mislukt: {str(e)}")
+
+    def write_data_file(self, data):
+        """Atomically replace the data file; the caller holds the file lock"""
+        # Write to a temporary file first so readers never see a half-written file
+        temp_file = f"{self.data_file}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(temp_file, self.data_file)
+
+    def remember_disk_state(self, data):
+        """Keep what is on disk as the base for merging external changes.
+        
+        Records and items are never changed in place (see CommandLog), so the base
+        shares them with the live data instead of copying the whole portfolio.
+        """
+        self._disk_state = {
+            "student_info": data.get("student_info", {}),
+            "portfolio_items": {item.get("id"): item for item in data.get("portfolio_items", [])},
+            "reflection_data": data.get("reflection_data", {})
+        }
+
+    def sync_external_changes(self, write_back=True):
+        """Merge changes another program made to the data file into the running app"""
+        with self._data_lock:
+            try:
+                with open(self.data_file, 'r', encoding='utf-8') as f:
+                    remote = json.load(f)
+            except Exception as e:
+                # Half-written or removed file; wait for the next modification
+                print(f"ERROR: Lezen van extern gewijzigde data mislukt: {str(e)}")
+                self.data_watcher.acknowledge()
+                return
+            self.data_watcher.acknowledge()
+            
+            remote_items = remote.get("portfolio_items", [])
+            ids_added = ensure_item_ids(remote_items)
+            base = self._disk_state
+            local_items = self.portfolio_items
+            conflicts = []
+            
+            student_info, conflict = merge_record(base["student_info"], self.student_info,
+                                                  remote.get("student_info", {}))
+            if conflict:
+                conflicts.append(("student_info", self.student_info, student_info))
+            reflection_data, conflict = merge_record(base["reflection_data"], self.reflection_data,
+                                                     remote.get("reflection_data", {}))
+            if conflict:
+                conflicts.append(("reflection_data", self.reflection_data, reflection_data))
+            
+            base_by_id = base["portfolio_items"]
+            remote_by_id = {item["id"]: item for item in remote_items}
+            merged_items = []
+            # Local order is kept, so an undone delete stays where it was put back
+            for local_item in local_items:
+                item_id = local_item.get("id")
+                remote_item = remote_by_id.get(item_id)
+                merged, conflict = merge_record(base_by_id.get(item_id), local_item, remote_item)
+                if conflict:
+                    # Deleted externally but edited here: keep the edit visible for the user
+                    conflicts.append(("item", local_item, remote_item))
+                if merged is not None:
+                    merged_items.append(merged)
+            local_ids = {item.get("id") for item in local_items}
+            for remote_item in remote_items:
+                item_id = remote_item["id"]
+                if item_id in local_ids:
+                    continue
+                merged, conflict = merge_record(base_by_id.get(item_id), None, remote_item)
+                if conflict:
+                    conflicts.append(("item", None, remote_item))
+                if merged is not None:
+                    merged_items.append(merged)
+            
+            changed = merged_items != local_items or student_info != self.student_info or \
+                reflection_data != self.reflection_data
+            self.student_info = student_info
+            self.reflection_data = reflection_data
+            self.portfolio_items = merged_items
+            if changed:
+                self.track_items_reloaded()
+            self.remember_disk_state(remote)
+            self.data_conflicts.extend(conflicts)
+            
+            needs_write = ids_added or merged_items != remote_items or \
+                student_info != remote.get("student_info", {}) or \
+                reflection_data != remote.get("reflection_data", {})
+        
+        with self._data_lock, self.ui.tree_lock:
+            if changed:
+                self.apply_item_changes()
+            if conflicts:
+                self.show_data_conflicts()
+        if write_back and needs_write:
+            self.save_data()
+
+    def apply_item_changes(self):
+        """Patch only the table rows of items that changed"""
+        self.update_display_info()
+        if self.selected_item_ids:
+            # Items deleted elsewhere can no longer be selected
+            existing = {item.get('id') for item in self.portfolio_items}
+            if not self.selected_item_ids <= existing:
+                self.selected_item_ids &= existing
+                self.refresh_bulk_actions()
+        if self.current_view == "dashboard":
+            self.show_dashboard_view()
+        elif self.current_view == "submit_document":
+            self.schedule_preview()
+        if self.current_view != "main":
+            return
+        self.update_attention_card()
+        self.refresh_filter_counts()
+        self.reconcile_portfolio_rows()
+        self.request_update()
+
+    def show_data_conflicts(self):
+        """Show conflicting external changes and let the user pick a version"""
+        def describe(conflict):
+            kind, local, remote = conflict
+            if kind == "item":
+                return f"• {(local or remote or {}).get('title', self.get_text('no_title'))}"
+            return f"• {self.get_text('student_info') if kind == 'student_info' else self.get_text('reflection_questions')}"
+        
+        def resolve(keep_mine):
+            conflicts, self.data_conflicts = self.data_conflicts, []
+            dialog.open = False
+            if keep_mine:
+                with self._data_lock:
+                    changes = []
+                    records = {}
+                    added = 0
+                    for kind, local, remote in conflicts:
+                        if kind in ("student_info", "reflection_data"):
+                            records[kind] = local
+                        elif remote is None:
+                            changes.append((len(self.portfolio_items) + added, None, local))
+                            added += 1
+                        else:
+                            index = self.find_item_index(remote.get("id"))
+                            if index is not None:
+                                changes.append((index, self.portfolio_items[index], local))
+                    self.execute_command(changes, records)
+                self.apply_item_changes()
+            self.request_update()
+        
+        dialog = ft.AlertDialog(
+            modal=True,
+            title=ft.Text(self.get_text("data_conflict_title")),
+            content=ft.Container(
+                content=ft.Column([
+                    ft.Icon(ft.Icons.SYNC_PROBLEM, size=48, color=ft.Colors.ORANGE),
+                    ft.Text(self.get_text("data_conflict_msg"), size=14),
+                    ft.Column([ft.Text(describe(c), size=14, weight=ft.FontWeight.BOLD) for c in self.data_conflicts]),
+                    ft.Text(self.get_text("data_conflict_hint"), size=14, color=ft.Colors.GREY_600),
+                ], spacing=15, scroll=ft.ScrollMode.AUTO),
+                width=450,
+                height=300
+            ),
+            actions=[
+                ft.TextButton(self.get_text("keep_external_btn"), on_click=lambda e: resolve(False)),
+                ft.ElevatedButton(self.get_text("keep_mine_btn"), on_click=lambda e: resolve(True))
+            ]
+        )
+        
+        self.page.dialog = dialog
+        dialog.open = True
+        self.request_update()
 
     def export_data(self, e):
         """Export data to file"""
@@ -2020,7 +4862,7 @@ class PortfolioManager:
                 "portfolio_items": self.portfolio_items,
                 "reflection_data": self.reflection_data
             }
-            filename = f"portfolio_export_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            filename = os.path.join(self.data_dir, f"portfolio_export_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
             with open(filename, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             print(f"INFO: Data geëxporteerd naar {filename}")
@@ -2029,17 +4871,22 @@ class PortfolioManager:
 
     def import_data(self, e):
         """Import data from file"""
-        filename = "portfolio_data.json"
+        filename = os.path.join(self.data_dir, "portfolio_data.json")
         try:
             if os.path.exists(filename):
                 with open(filename, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                 
-                self.student_info = data.get("student_info", {})
-                self.portfolio_items = data.get("portfolio_items", [])
-                self.reflection_data = data.get("reflection_data", {})
-                
-                self.save_data()
+                imported_items = data.get("portfolio_items", [])
+                ensure_item_ids(imported_items)
+                with self._data_lock:
+                    # Replacing everything is one command as well, so an import can be undone
+                    changes = [(index, item, None) for index, item in enumerate(self.portfolio_items)]
+                    changes += [(index, None, item) for index, item in enumerate(imported_items)]
+                    self.execute_command(changes, records={
+                        "student_info": data.get("student_info", {}),
+                        "reflection_data": data.get("reflection_data", {})
+                    })
                 self.show_main_view()
                 print(f"INFO: Data geïmporteerd van {filename}")
             else:
@@ -2047,14 +4894,117 @@ class PortfolioManager:
         except Exception as e:
             print(f"ERROR: Importeren mislukt: {str(e)}")
 
+    def execute_command(self, changes=(), records=None):
+        """Apply and save a change to the data as one undoable command.
+        
+        changes are (index, before, after) item tuples, see patch_items; records maps
+        student_info / reflection_data to their new value.
+        """
+        if not changes and not records:
+            return
+        with self._data_lock:
+            command = {
+                "items": list(changes),
+                "records": {name: (getattr(self, name), value) for name, value in (records or {}).items()}
+            }
+            self.apply_command(command)
+            self.history.record(command)
+            self.save_data()
+        self.refresh_undo_buttons()
+
+    def apply_command(self, command):
+        """Put the after side of a command in the live data; the caller holds the data lock"""
+        for name, (before, after) in command["records"].items():
+            setattr(self, name, after)
+        if not command["items"]:
+            return
+        self.portfolio_items, applied = patch_items(self.portfolio_items, command["items"])
+        for index, before, after in applied:
+            if after is None:
+                self.track_item_removal(before.get('id'))
+            else:
+                feedback_changed = before is None or before.get('feedback') != after.get('feedback')
+                self.track_item_change(after, feedback_changed)
+
+    def feedback_change(self, index, feedback_entry):
+        """The change that adds feedback to an item; the stored item is left untouched"""
+        item = self.portfolio_items[index]
+        updated = dict(item)
+        updated['feedback'] = item.get('feedback', []) + [feedback_entry]
+        return index, item, updated
+
+    def undo(self, e=None):
+        """Revert the last change"""
+        self.step_history(self.history.undo)
+
+    def redo(self, e=None):
+        """Apply the last undone change again"""
+        self.step_history(self.history.redo)
+
+    def step_history(self, step):
+        """Apply the command returned by history.undo or history.redo"""
+        with self._data_lock:
+            command = step()
+            if command is None:
+                return
+            self.apply_command(command)
+            self.save_data()
+        self.refresh_undo_buttons()
+        self.apply_item_changes()
+
+    def refresh_undo_buttons(self):
+        """Enable the undo and redo buttons when there is something to undo or redo"""
+        self.undo_button.disabled = not self.history.undo_stack
+        self.redo_button.disabled = not self.history.redo_stack
+        self.request_update(self.undo_button, self.redo_button)
+
+    def on_keyboard(self, e):
+        """Ctrl+Z / Ctrl+Y (or Ctrl+Shift+Z) outside of forms, where text fields handle them"""
+        if not (e.ctrl or e.meta) or self.current_view not in ("main", "all_feedback", "dashboard", "learning_outcomes"):
+            return
+        if e.key == "Z" and not e.shift:
+            self.undo()
+        elif e.key == "Y" or (e.key == "Z" and e.shift):
+            self.redo()
+
+    def track_item_change(self, item, feedback_changed=False):
+        """Update the totals, the coverage matrix and the sort index for one added or changed item"""
+        self.aggregates.update_item(item)
+        self.coverage.update_item(item, feedback_changed)
+        self.sort_index.update_item(item)
+
+    def track_item_removal(self, item_id):
+        """Update the totals, the coverage matrix and the sort index for a deleted item"""
+        self.aggregates.remove_item(item_id)
+        self.coverage.remove_item(item_id)
+        self.sort_index.remove_item(item_id)
+
+    def track_items_reloaded(self):
+        """Bring the totals, the coverage matrix and the sort index in line after a bulk change"""
+        self.aggregates.refresh(self.portfolio_items)
+        self.coverage.refresh(self.portfolio_items)
+        self.sort_index.refresh(self.portfolio_items)
+
     def count_items_without_feedback(self):
         """Count portfolio items that have no feedback"""
-        count = 0
-        for item in self.portfolio_items:
-            # Check if item has any feedback
-            if not item.get('feedback') or len(item.get('feedback', [])) == 0:
-                count += 1
-        return count
+        return self.aggregates.without_feedback
+
+    def check_aggregates(self):
+        """Debug mode: compare the running totals with a full recount"""
+        with self._data_lock:
+            mismatches = self.aggregates.verify(self.portfolio_items)
+            expected = CoverageMatrix(self.learning_outcomes)
+            expected.refresh(self.portfolio_items)
+            mismatches += [f"LU{lo}" for lo in self.learning_outcomes
+                           if expected.counts(lo) != self.coverage.counts(lo) or
+                           expected.covered_indicators(lo) != self.coverage.covered_indicators(lo)]
+            mismatches += [f"sortering {name}" for name in self.sort_index.verify(self.portfolio_items)]
+            if mismatches:
+                print(f"ERROR: Totalen wijken af van de items: {', '.join(mismatches)}")
+                self.aggregates = PortfolioAggregates()
+                self.coverage = CoverageMatrix(self.learning_outcomes)
+                self.sort_index = SortIndex(self.sort_index.key_functions)
+                self.track_items_reloaded()
 
     def show_error_dialog(self, title, message):
         """Show error as inline message (simplified)"""
@@ -2087,59 +5037,96 @@ class PortfolioManager:
         
         self.page.dialog = dialog
         dialog.open = True
-        self.page.update()
+        self.request_update()
+
+    def check_links(self, e=None):
+        """Check the GitHub links of all items in the background and list the ones that fail"""
+        items = list(self.portfolio_items)
+        links = [(item.get('github_link') or '').strip() for item in items]
+        links = [link for link in links if link]
+        status_text = ft.Text(self.get_text("links_checking").format(len(set(links))))
+        results_column = ft.Column([ft.ProgressRing(width=24, height=24)], tight=True, scroll=ft.ScrollMode.AUTO)
+        dialog = ft.AlertDialog(
+            title=ft.Text(self.get_text("links_title")),
+            content=ft.Container(content=ft.Column([status_text, results_column], tight=True), width=600),
+            actions=[ft.ElevatedButton(self.get_text("ok_btn"), on_click=lambda e: self.close_dialog(dialog))]
+        )
+        self.page.dialog = dialog
+        dialog.open = True
+        self.request_update()
+        
+        def run():
+            try:
+                results = self.link_checker.check(links)
+            except Exception as ex:
+                print(f"ERROR: Links controleren mislukt: {str(ex)}")
+                results = {}
+                status_text.value = str(ex)
+            with self._data_lock, self.ui.tree_lock:
+                failing = []
+                for item in items:
+                    link = (item.get('github_link') or '').strip()
+                    result = results.get(link)
+                    if not link:
+                        failing.append((item, self.get_text("link_missing")))
+                    elif result is not None and not result["ok"]:
+                        failing.append((item, f"{link} ({result['status'] or result['error']})"))
+                if results:
+                    working = sum(1 for result in results.values() if result["ok"])
+                    status_text.value = self.get_text("links_summary").format(
+                        len(results), working, len(results) - working, len(items) - len(links))
+                results_column.controls = [
+                    ft.ListTile(
+                        leading=ft.Icon(ft.Icons.LINK_OFF, color=ft.Colors.RED),
+                        title=ft.Text(item.get('title', self.get_text('no_title'))),
+                        subtitle=ft.Text(reason, selectable=True),
+                        dense=True
+                    )
+                    for item, reason in failing
+                ] or [ft.Text(self.get_text("links_all_ok"), color=ft.Colors.GREEN)]
+                self.request_update(status_text, results_column)
+        
+        threading.Thread(target=run, name="link-check", daemon=True).start()
 
     def show_learning_outcomes_info(self, e):
         """Show learning outcomes info in the main content area"""
         self.current_view = "learning_outcomes"
         
+        view = self.views.show("learning_outcomes", self.build_learning_outcomes_view)
+        self.refresh_back_button(view.data["back_button"])
+        self.request_update()
+
+    def build_learning_outcomes_view(self):
+        """Build the learning outcomes overview; tab bodies are built when first selected"""
+        back_button = self.show_back_button()
+        
         # Create tabs for different learning outcomes
-        tabs = []
-        for lo_num, lo_data in self.learning_outcomes.items():
-            # Create content for this learning outcome
-            content = ft.Column([
-                ft.Text(f"Leeruitkomst {lo_num}: {lo_data['title']}", 
-                       size=18, weight=ft.FontWeight.BOLD),
-                ft.Divider(),
-                ft.Text(self.get_text("description_label_lo"), size=16, weight=ft.FontWeight.BOLD),
-                ft.Text(lo_data['description'], size=14),
-                ft.Divider(),
-                ft.Text(self.get_text("indicators_label"), size=16, weight=ft.FontWeight.BOLD),
-                ft.Column([
-                    ft.Text(f"• {indicator}", size=14) 
-                    for indicator in lo_data['indicators']
-                ]),
-                ft.Divider(),
-                ft.Text(self.get_text("examples_label"), size=16, weight=ft.FontWeight.BOLD),
-                ft.Column([
-                    ft.Text(f"• {example}", size=14)
-                    for example in lo_data['examples']
-                ])
-            ], spacing=10, scroll=ft.ScrollMode.AUTO)
-            
-            tab = ft.Tab(
-                text=f"LU{lo_num}",
-                content=ft.Container(
-                    content=content,
-                    padding=20
-                )
-            )
-            tabs.append(tab)
+        tabs = [
+            ft.Tab(text=f"LU{lo_num}", content=ft.Container(padding=20, data=lo_num))
+            for lo_num in self.learning_outcomes
+        ]
+        
+        def select_tab(e):
+            if self.fill_learning_outcome_tab(tabs[int(e.control.selected_index)]):
+                self.request_update(e.control)
+        
+        self.fill_learning_outcome_tab(tabs[0])
         
         # Create main content with tabs
         main_content = ft.Column([
-            self.show_back_button(),
+            back_button,
             ft.Card(
                 content=ft.Container(
                     content=ft.Column([
-                        ft.Text(self.get_text("learning_outcomes_title"), size=24, weight=ft.FontWeight.BOLD),
-                        ft.Text(self.get_text("learning_outcomes_subtitle"), 
+                        self.bound_text("learning_outcomes_title", size=24, weight=ft.FontWeight.BOLD),
+                        self.bound_text("learning_outcomes_subtitle", 
                                size=14, color=ft.Colors.GREY_600),
                         ft.Divider(),
                         ft.Container(
                             content=ft.Tabs(
                                 tabs=tabs,
-                                selected_index=0
+                                selected_index=0,
+                                on_change=select_tab
                             ),
                             height=500
                         )
@@ -2149,8 +5136,39 @@ class PortfolioManager:
             )
         ], scroll=ft.ScrollMode.AUTO)
         
-        self.content_container.content = self.center_content(main_content)
-        self.page.update()
+        view = self.center_content(main_content)
+        view.data = {"back_button": back_button}
+        return view
+
+    def fill_learning_outcome_tab(self, tab):
+        """Build the body of a learning outcome tab once; returns True if it was built now"""
+        container = tab.content
+        if container.content is not None:
+            return False
+        lo_num = container.data
+        lo_data = self.learning_outcomes[lo_num]
+        
+        # Create content for this learning outcome
+        container.content = ft.Column([
+            ft.Text(f"Leeruitkomst {lo_num}: {lo_data['title']}", 
+                   size=18, weight=ft.FontWeight.BOLD),
+            ft.Divider(),
+            self.bound_text("description_label_lo", size=16, weight=ft.FontWeight.BOLD),
+            ft.Text(lo_data['description'], size=14),
+            ft.Divider(),
+            self.bound_text("indicators_label", size=16, weight=ft.FontWeight.BOLD),
+            ft.Column([
+                ft.Text(f"• {indicator}", size=14) 
+                for indicator in lo_data['indicators']
+            ]),
+            ft.Divider(),
+            self.bound_text("examples_label", size=16, weight=ft.FontWeight.BOLD),
+            ft.Column([
+                ft.Text(f"• {example}", size=14)
+                for example in lo_data['examples']
+            ])
+        ], spacing=10, scroll=ft.ScrollMode.AUTO)
+        return True
 
     def show_about(self, e=None):
         """Show about information"""
@@ -2161,12 +5179,12 @@ class PortfolioManager:
             ft.Card(
                 content=ft.Container(
                     content=ft.Column([
-                        ft.Text(self.get_text("about_title"), size=24, weight=ft.FontWeight.BOLD),
+                        self.bound_text("about_title", size=24, weight=ft.FontWeight.BOLD),
                         ft.Divider(),
-                        ft.Text(self.get_text("version_label"), size=16, weight=ft.FontWeight.BOLD),
-                        ft.Text(self.get_text("about_description"), size=14),
+                        self.bound_text("version_label", size=16, weight=ft.FontWeight.BOLD),
+                        self.bound_text("about_description", size=14),
                         ft.Divider(),
-                        ft.Text(self.get_text("developed_by"), size=16, weight=ft.FontWeight.BOLD),
+                        self.bound_text("developed_by", size=16, weight=ft.FontWeight.BOLD),
                         ft.Text("• Rick van der Voort", size=14, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
                         ft.TextButton(
                             text="🔗 GitHub: @RickMageddon",
@@ -2177,15 +5195,15 @@ class PortfolioManager:
                             )
                         ),
                         ft.Divider(),
-                        ft.Text(self.get_text("copyright"), size=12, color=ft.Colors.GREY_600)
+                        self.bound_text("copyright", size=12, color=ft.Colors.GREY_600)
                     ], spacing=15),
                     padding=30
                 )
             )
         ], scroll=ft.ScrollMode.AUTO)
         
-        self.content_container.content = self.center_content(content)
-        self.page.update()
+        self.views.show_transient(self.center_content(content))
+        self.request_update()
 
     def show_feedback_info(self, e=None):
         """Show feedback about the app (for giving feedback on the app itself)"""
@@ -2201,37 +5219,36 @@ class PortfolioManager:
             ft.Card(
                 content=ft.Container(
                     content=ft.Column([
-                        ft.Text(self.get_text("feedback_info_title"), size=24, weight=ft.FontWeight.BOLD),
+                        self.bound_text("feedback_info_title", size=24, weight=ft.FontWeight.BOLD),
                         ft.Divider(),
-                        ft.Text(self.get_text("improve_app"), size=18, weight=ft.FontWeight.BOLD),
-                        ft.Text(self.get_text("feedback_help"), size=14),
+                        self.bound_text("improve_app", size=18, weight=ft.FontWeight.BOLD),
+                        self.bound_text("feedback_help", size=14),
                         ft.Divider(),
-                        ft.Text(self.get_text("how_to_give_feedback"), size=16, weight=ft.FontWeight.BOLD),
-                        ft.Text(self.get_text("share_experience"), size=14),
-                        ft.Text(self.get_text("report_bugs"), size=14),
-                        ft.Text(self.get_text("suggest_features"), size=14),
-                        ft.Text(self.get_text("ux_tips"), size=14),
+                        self.bound_text("how_to_give_feedback", size=16, weight=ft.FontWeight.BOLD),
+                        self.bound_text("share_experience", size=14),
+                        self.bound_text("report_bugs", size=14),
+                        self.bound_text("suggest_features", size=14),
+                        self.bound_text("ux_tips", size=14),
                         ft.Divider(),
-                        ft.Text(self.get_text("feedback_categories"), size=16, weight=ft.FontWeight.BOLD),
-                        ft.Text(self.get_text("bug_report"), size=14),
-                        ft.Text(self.get_text("feature_request"), size=14),
-                        ft.Text(self.get_text("documentation"), size=14),
-                        ft.Text(self.get_text("ui_ux"), size=14),
-                        ft.Text(self.get_text("performance"), size=14),
+                        self.bound_text("feedback_categories", size=16, weight=ft.FontWeight.BOLD),
+                        self.bound_text("bug_report", size=14),
+                        self.bound_text("feature_request", size=14),
+                        self.bound_text("documentation", size=14),
+                        self.bound_text("ui_ux", size=14),
+                        self.bound_text("performance", size=14),
                         ft.Divider(),
-                        ft.Text(self.get_text("give_feedback"), size=16, weight=ft.FontWeight.BOLD),
-                        ft.TextButton(
-                            text=self.get_text("feedback_github_link"),
+                        self.bound_text("give_feedback", size=16, weight=ft.FontWeight.BOLD),
+                        self.bind(ft.TextButton(
                             on_click=open_feedback_link,
                             style=ft.ButtonStyle(
                                 color=ft.Colors.BLUE_700,
                                 bgcolor=ft.Colors.BLUE_50
                             )
-                        ),
+                        ), text="feedback_github_link"),
                         ft.Divider(),
                         ft.Row([
                             ft.Icon(ft.Icons.FAVORITE, color=ft.Colors.RED),
-                            ft.Text(self.get_text("thanks_msg"), 
+                            self.bound_text("thanks_msg", 
                                    color=ft.Colors.RED, weight=ft.FontWeight.BOLD)
                         ])
                     ], spacing=15),
@@ -2240,33 +5257,136 @@ class PortfolioManager:
             )
         ], scroll=ft.ScrollMode.AUTO)
         
-        self.content_container.content = self.center_content(content)
-        self.page.update()
+        self.views.show_transient(self.center_content(content))
+        self.request_update()
+
+    def session_state(self):
+        """The state of this session that is not in the data file, for hibernation"""
+        return {
+            "view": self.current_view,
+            "feedback_page": self.feedback_page_index,
+            "table_page": self.table_page,
+            "sort": [self.sort_column, self.sort_ascending],
+            "filters": [self.filter_type.value, self.filter_learning_outcome.value, self.filter_without_feedback.value],
+            "search": self.search_field.value or "",
+            "selected": sorted(self.selected_item_ids),
+            "dark": self.page.theme_mode == ft.ThemeMode.DARK,
+            "history": {"undo": self.history.undo_stack, "redo": self.history.redo_stack}
+        }
+
+    def restore_session_state(self, state):
+        """Bring a freshly loaded session back to a hibernated session_state()"""
+        def command(stored):
+            return {"items": [tuple(change) for change in stored["items"]],
+                    "records": {name: tuple(change) for name, change in stored["records"].items()}}
+        
+        with self._data_lock, self.ui.tree_lock:
+            self.history.undo_stack = [command(stored) for stored in state["history"]["undo"]]
+            self.history.redo_stack = [command(stored) for stored in state["history"]["redo"]]
+            self.refresh_undo_buttons()
+            
+            self.filter_type.value, self.filter_learning_outcome.value, self.filter_without_feedback.value = state["filters"]
+            self.sort_column, self.sort_ascending = state["sort"]
+            if self.sort_column in self.sort_columns:
+                self.portfolio_data_table.sort_column_index = self.sort_columns.index(self.sort_column)
+                self.portfolio_data_table.sort_ascending = self.sort_ascending
+            self.search_field.value = state["search"]
+            if state["search"]:
+                self.search_index.refresh(self.portfolio_items)
+                self.search_results = self.search_index.search(state["search"])
+            existing = {item.get('id') for item in self.portfolio_items}
+            self.selected_item_ids = set(state["selected"]) & existing
+            self.refresh_bulk_actions()
+            if state["dark"]:
+                self.page.theme_mode = ft.ThemeMode.DARK
+                self.theme_button.icon = ft.Icons.LIGHT_MODE
+            
+            # Open forms were flushed to the drafts file; views for a single item go back to the overview
+            self.table_page = state["table_page"]
+            views = {
+                "all_feedback": lambda: self.show_all_feedback_view(page_index=state["feedback_page"]),
+                "dashboard": self.show_dashboard_view,
+                "learning_outcomes": lambda: self.show_learning_outcomes_info(None),
+                "student_info": self.show_student_info_view,
+                "submit_document": self.show_submit_document_view,
+                "add_feedback": self.show_add_feedback_view,
+                "about": self.show_about,
+                "feedback_info": self.show_feedback_info
+            }
+            views.get(state["view"], self.show_main_view)()
+            self.request_update()
 
     def toggle_theme_mode(self, e=None):
         """Toggle between light and dark theme"""
         if self.page.theme_mode == ft.ThemeMode.LIGHT:
             self.page.theme_mode = ft.ThemeMode.DARK
-            e.control.icon = ft.Icons.LIGHT_MODE
+            self.theme_button.icon = ft.Icons.LIGHT_MODE
         else:
             self.page.theme_mode = ft.ThemeMode.LIGHT
-            e.control.icon = ft.Icons.DARK_MODE
-        self.page.update()
+            self.theme_button.icon = ft.Icons.DARK_MODE
+        self.request_update()
 
     def get_text(self, key):
         """Get translated text for current language"""
         return self.translations.get(self.current_language, {}).get(key, key)
 
-    def refresh_table_headers(self):
-        """Refresh the data table headers with current language"""
-        self.portfolio_data_table.columns = [
-            ft.DataColumn(ft.Text(self.get_text("table_title"))),
-            ft.DataColumn(ft.Text(self.get_text("table_learning_outcomes"))),
-            ft.DataColumn(ft.Text(self.get_text("table_type"))),
-            ft.DataColumn(ft.Text(self.get_text("table_date"))),
-            ft.DataColumn(ft.Text(self.get_text("table_feedback"))),
-            ft.DataColumn(ft.Text(self.get_text("table_actions"))),
+    def bind(self, control, **attributes):
+        """Bind control attributes to translation keys and fill them in.
+        
+        Values are translation keys, or callables returning the text for texts
+        that combine a translation with data. A language switch then only has to
+        set these attributes again (see change_language).
+        """
+        self._translation_bindings.setdefault(control, {}).update(attributes)
+        self.apply_translation(control)
+        return control
+
+    def bound_text(self, key, **kwargs):
+        """Create a Text whose value follows the current language"""
+        return self.bind(ft.Text(**kwargs), value=key)
+
+    def apply_translation(self, control):
+        """Set the bound attributes of control in the current language"""
+        for attribute, key in self._translation_bindings.get(control, {}).items():
+            setattr(control, attribute, key() if callable(key) else self.get_text(key))
+
+    def build_table_columns(self):
+        """Build the data table headers in the current language"""
+        columns = [
+            ft.DataColumn(self.bound_text("table_title"), on_sort=self.sort_table),
+            ft.DataColumn(self.bound_text("table_learning_outcomes"), on_sort=self.sort_table),
+            ft.DataColumn(self.bound_text("table_type"), on_sort=self.sort_table),
+            ft.DataColumn(self.bound_text("table_date"), on_sort=self.sort_table),
+            ft.DataColumn(self.bound_text("table_feedback"), on_sort=self.sort_table),
+        ]
+        if self.git_scanner is not None:
+            columns.append(ft.DataColumn(self.bound_text("table_local_repo")))
+        return columns + [ft.DataColumn(self.bound_text("table_actions"))]
+
+    def refresh_filter_labels(self):
+        """Bind the texts of the table filter controls to their translations"""
+        self.bind(self.filter_type, label="table_type")
+        self.filter_type.options = [
+            self.bind(ft.dropdown.Option(key="all"), text="filter_all"),
+            self.bind(ft.dropdown.Option(key="personal"),
+                      text=lambda: f"{self.get_text('type_personal')} ({self.aggregates.personal_items})"),
+            self.bind(ft.dropdown.Option(key="group"),
+                      text=lambda: f"{self.get_text('type_group')} ({self.aggregates.group_items})"),
+        ]
+        self.bind(self.filter_learning_outcome, label="table_learning_outcomes")
+        self.filter_learning_outcome.options = [self.bind(ft.dropdown.Option(key="all"), text="filter_all")] + [
+            self.bind(ft.dropdown.Option(key=str(lo_num)),
+                      text=lambda lo_num=lo_num, title=lo_data['title']:
+                      f"LU{lo_num}: {title} ({self.aggregates.items_per_lo.get(lo_num, 0)})")
+            for lo_num, lo_data in self.learning_outcomes.items()
         ]
+        self.bind(self.filter_without_feedback,
+                  label=lambda: f"{self.get_text('filter_without_feedback')} ({self.aggregates.without_feedback})")
+
+    def refresh_filter_counts(self):
+        """Show the current totals in the filter options"""
+        for control in [self.filter_without_feedback] + self.filter_type.options + self.filter_learning_outcome.options:
+            self.apply_translation(control)
 
     def change_language(self, language_code):
         """Change language to specified language code"""
@@ -2279,65 +5399,21 @@ class PortfolioManager:
             # Save language preference
             self.save_data()
             
-            # Refresh table headers
-            self.refresh_table_headers()
-            
-            # Update only the appbar with new translations
-            self.page.appbar = ft.AppBar(
-                title=ft.Text(self.get_text("app_title")),
-                bgcolor=ft.Colors.BLUE_700,
-                color=ft.Colors.WHITE,
-                leading=ft.PopupMenuButton(
-                    items=[
-                        ft.PopupMenuItem(text=self.get_text("menu_main"), on_click=lambda e: self.show_main_view()),
-                        ft.PopupMenuItem(),  # Separator
-                        ft.PopupMenuItem(text=self.get_text("menu_about"), on_click=self.show_about),
-                        ft.PopupMenuItem(text=self.get_text("menu_feedback"), on_click=self.show_feedback_info),
-                        ft.PopupMenuItem(),  # Separator
-                        ft.PopupMenuItem(text=self.get_text("menu_student_info"), on_click=self.show_student_info_view),
-                        ft.PopupMenuItem(text=self.get_text("menu_github"), on_click=self.setup_github),
-                        ft.PopupMenuItem(),  # Separator
-                        ft.PopupMenuItem(text=self.get_text("menu_export"), on_click=self.export_data),
-                        ft.PopupMenuItem(text=self.get_text("menu_import"), on_click=self.import_data),
-                    ],
-                    icon=ft.Icons.MENU
-                ),
-                actions=[
-                    ft.TextButton(
-                        text=self.get_text("btn_learning_outcomes"),
-                        on_click=self.show_learning_outcomes_info,
-                        style=ft.ButtonStyle(color=ft.Colors.WHITE)
-                    ),
-                    ft.PopupMenuButton(
-                        items=[
-                            ft.PopupMenuItem(
-                                text="🇳🇱 Nederlands",
-                                on_click=lambda e: self.change_language("nl")
-                            ),
-                            ft.PopupMenuItem(
-                                text="🇬🇧 English", 
-                                on_click=lambda e: self.change_language("en")
-                            ),
-                        ],
-                        icon=ft.Icons.LANGUAGE,
-                        icon_color=ft.Colors.WHITE,
-                        tooltip=self.get_text("tooltip_language")
-                    ),
-                    ft.IconButton(
-                        icon=ft.Icons.LIGHT_MODE if self.page.theme_mode == ft.ThemeMode.DARK else ft.Icons.DARK_MODE,
-                        tooltip=self.get_text("tooltip_theme"),
-                        on_click=self.toggle_theme_mode,
-                        icon_color=ft.Colors.WHITE
-                    )
-                ]
-            )
-            
-            # Refresh the main view to show translated buttons only if we're on main view
-            if self.current_view == "main":
-                self.show_main_view()
-            
-            # Update the page
-            self.page.update()
+            self.apply_language()
+
+    def apply_language(self):
+        """Set every bound text in the current language and refresh the current view"""
+        # Only the bound texts change; every view keeps its controls
+        for control in list(self._translation_bindings.keys()):
+            self.apply_translation(control)
+        
+        # Texts built from data are refreshed by the view itself
+        if self.current_view == "main":
+            self.update_display()
+        elif self.current_view == "all_feedback":
+            self.show_all_feedback_view(page_index=self.feedback_page_index)
+        else:
+            self.request_update()
 
     def toggle_language(self, e=None):
         """Toggle between Dutch and English (kept for compatibility)"""
@@ -2347,6 +5423,7 @@ class PortfolioManager:
 
 def main(page: ft.Page):
     """Main entry point for the Flet application"""
+    mark_startup("flet_session_start")
     try:
         # Force window to be visible and properly configured
         page.window_visible = True
@@ -2411,14 +5488,22 @@ def main(page: ft.Page):
         def on_window_event(e):
             if e.data == "close":
                 print("Application closing...")
+                app.data_watcher.stop()
+                app.drafts.stop()
                 page.window_destroy()
         
         page.window_on_event = on_window_event
         
         # Force update to ensure window is visible
-        page.update()
+        app.request_update()
+        app.ui.flush()
+        mark_startup("first_page_update")
         
         print("Portfolio Manager initialized successfully!")
+        if "--profile-startup" in sys.argv:
+            # Data is loaded in the background; include it in the profile
+            app.data_loaded.wait(timeout=60)
+            write_startup_profile()
         
     except Exception as e:
         print(f"Error initializing app: {e}")
@@ -2482,9 +5567,369 @@ def check_environment():
     
     return True
 
+def process_start_time():
+    """Return when this process (and a PyInstaller bootloader parent) started, as epoch seconds.
+    
+    Only available on Linux, where /proc records the start time in clock ticks
+    since boot; elsewhere None is returned.
+    """
+    def start_of(pid):
+        try:
+            with open(f"/proc/{pid}/stat", "r") as f:
+                # The command name may contain spaces; fields after it are fixed
+                fields = f.read().rsplit(")", 1)[1].split()
+            with open("/proc/stat", "r") as f:
+                boot_time = next(int(line.split()[1]) for line in f if line.startswith("btime"))
+            return boot_time + int(fields[19]) / os.sysconf("SC_CLK_TCK")
+        except (OSError, ValueError, IndexError, StopIteration, AttributeError):
+            return None
+    
+    process_start = start_of(os.getpid())
+    # A one-file PyInstaller build unpacks itself in a parent bootloader process first
+    bootloader_start = start_of(os.getppid()) if getattr(sys, "frozen", False) else None
+    return process_start, bootloader_start
+
+
+def write_startup_profile():
+    """Write the startup timestamps to startup_profile.json and print a summary"""
+    now_epoch, now = time.time(), time.perf_counter()
+    module_start = STARTUP_MARKS[0][1]
+    process_start, bootloader_start = process_start_time()
+    module_start_epoch = now_epoch - (now - module_start)
+    
+    profile = {
+        "frozen": bool(getattr(sys, "frozen", False)),
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        # Time from process creation until main_flet started executing (interpreter + unpacking)
+        "interpreter_start_ms": round((module_start_epoch - process_start) * 1000, 1) if process_start else None,
+        "bootloader_start_ms": round((module_start_epoch - bootloader_start) * 1000, 1) if bootloader_start else None,
+        "marks": []
+    }
+    previous = module_start
+    for name, timestamp in STARTUP_MARKS:
+        profile["marks"].append({
+            "name": name,
+            "ms": round((timestamp - module_start) * 1000, 1),
+            "delta_ms": round((timestamp - previous) * 1000, 1)
+        })
+        previous = timestamp
+    
+    # Next to the executable when packaged; the working directory may not be writable there
+    directory = os.path.dirname(sys.executable) if profile["frozen"] else os.getcwd()
+    path = os.path.join(directory, "startup_profile.json")
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(profile, f, indent=2)
+    except OSError:
+        import tempfile
+        path = os.path.join(tempfile.gettempdir(), "startup_profile.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(profile, f, indent=2)
+    
+    print("=" * 50)
+    print("Startup profiel (ms sinds start van main_flet.py)")
+    if profile["bootloader_start_ms"] is not None:
+        print(f"  {-profile['bootloader_start_ms']:9.1f}  bootloader_start")
+    if profile["interpreter_start_ms"] is not None:
+        print(f"  {-profile['interpreter_start_ms']:9.1f}  interpreter_start")
+    for mark in profile["marks"]:
+        print(f"  {mark['ms']:9.1f}  {mark['name']:<24} (+{mark['delta_ms']:.1f})")
+    print(f"Opgeslagen in {path}")
+    print("=" * 50)
+
+
+class SessionHibernator:
+    """Offload server sessions that have been idle for a while.
+    
+    A hibernated session keeps only its Flet page: the UI state that is not in
+    the data file (view, filters, selection, undo history) goes to a gzipped
+    snapshot in the user's data directory, the controls are replaced by a single
+    "paused" message and the PortfolioManager is dropped. The next click or key
+    press builds a new PortfolioManager from the data file and the snapshot.
+    """
+
+    def __init__(self, idle_seconds, check_interval=None):
+        self.idle_seconds = idle_seconds
+        self.check_interval = check_interval or min(60.0, idle_seconds / 4)
+        self.stats = {"hibernated": 0, "restored": 0, "controls_released": 0, "snapshot_bytes": 0,
+                      "memory_released": 0}
+        self._lock = threading.Lock()
+        # session id -> {"page", "start", "app" (None unless resident), "snapshot", "message",
+        #                "state": "resident" | "hibernated" | "waking"}
+        self._sessions = {}
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def register(self, app, start):
+        """Watch a session; start(page, state) builds its PortfolioManager again"""
+        with self._lock:
+            self._sessions[app.page.session_id] = {
+                "page": app.page,
+                "start": start,
+                "app": app,
+                # Tabs of one browser share the data directory, so every session has its own snapshot
+                "snapshot": os.path.join(app.data_dir, f"session_snapshot_{re.sub(r'[^0-9A-Za-z_-]', '_', app.page.session_id)}.json.gz"),
+                "message": None,
+                "state": "resident"
+            }
+
+    def unregister(self, session_id):
+        """Forget a closed session"""
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+        if entry is None:
+            return
+        if entry["state"] == "resident":
+            entry["app"].data_watcher.stop()
+            entry["app"].drafts.stop()
+        if entry["state"] == "hibernated" and os.path.exists(entry["snapshot"]):
+            os.remove(entry["snapshot"])
+
+    def start(self):
+        """Start the background thread that looks for idle sessions"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="session-hibernator", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background thread"""
+        self._stop_event.set()
+
+    def sweep(self):
+        """Hibernate every session that has been idle for longer than idle_seconds"""
+        now = time.monotonic()
+        with self._lock:
+            idle = [entry for entry in self._sessions.values()
+                    if entry["state"] == "resident" and now - entry["app"].last_activity > self.idle_seconds]
+        if not idle:
+            return
+        memory_before = process_memory()
+        for entry in idle:
+            try:
+                self.hibernate(entry)
+            except Exception as e:
+                print(f"ERROR: Pauzeren van sessie mislukt: {str(e)}")
+        release_memory()
+        memory_after = process_memory()
+        if memory_before is not None and memory_after is not None:
+            self.stats["memory_released"] += max(0, memory_before - memory_after)
+        self.print_stats()
+
+    def hibernate(self, entry):
+        """Write the snapshot of a session and drop its controls and data"""
+        app = entry["app"]
+        page = app.page
+        with app._data_lock, app.ui.tree_lock:
+            with self._lock:
+                if entry["state"] != "resident" or time.monotonic() - app.last_activity <= self.idle_seconds:
+                    return
+            state = app.session_state()
+            with gzip.open(entry["snapshot"], "wt", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+            app.data_watcher.stop()
+            app.drafts.stop()
+            released = sum(ViewCache.count_controls(control) for control in page.controls)
+            if page.appbar is not None:
+                released += ViewCache.count_controls(page.appbar)
+            entry["message"] = TRANSLATIONS.get(app.current_language, TRANSLATIONS["nl"])["session_paused"]
+            with self._lock:
+                entry["app"] = None
+                entry["state"] = "hibernated"
+            app.ui.detach_events()
+            self.show_paused(entry)
+        self.stats["hibernated"] += 1
+        self.stats["controls_released"] += released
+        self.stats["snapshot_bytes"] += os.path.getsize(entry["snapshot"])
+
+    def show_paused(self, entry):
+        """Replace the controls of a hibernated page by the "paused" message"""
+        page = entry["page"]
+        page.controls.clear()
+        page.appbar = None
+        page.dialog = None
+        page.on_keyboard_event = lambda e: self.wake(page.session_id)
+        page.add(ft.Container(
+            content=ft.Column([
+                ft.Icon(ft.Icons.PAUSE_CIRCLE, size=48, color=ft.Colors.GREY_600),
+                ft.Text(entry["message"], size=16, text_align=ft.TextAlign.CENTER)
+            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, alignment=ft.MainAxisAlignment.CENTER),
+            alignment=ft.alignment.center,
+            expand=True,
+            on_click=lambda e: self.wake(page.session_id)
+        ))
+
+    def wake(self, session_id):
+        """Rebuild a hibernated session; called from its first event after hibernation"""
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None or entry["state"] != "hibernated":
+                return
+            entry["state"] = "waking"  # a second click while restoring must not restore twice
+        page = entry["page"]
+        try:
+            with gzip.open(entry["snapshot"], "rt", encoding="utf-8") as f:
+                state = json.load(f)
+            page.controls.clear()
+            page.on_keyboard_event = None
+            # start registers the new PortfolioManager, which replaces entry
+            entry["start"](page, state)
+        except Exception as e:
+            print(f"ERROR: Herstellen van sessie mislukt: {str(e)}")
+            with self._lock:
+                current = self._sessions.get(session_id)
+                self._sessions[session_id] = entry
+                entry["state"] = "hibernated"
+            if current is not entry and current is not None and current["app"] is not None:
+                current["app"].data_watcher.stop()
+                current["app"].drafts.stop()
+                current["app"].ui.detach_events()
+            self.show_paused(entry)
+            return
+        # Only a restored session can do without its snapshot
+        self.stats["snapshot_bytes"] -= os.path.getsize(entry["snapshot"])
+        os.remove(entry["snapshot"])
+        self.stats["restored"] += 1
+
+    def counts(self):
+        """(resident sessions, hibernated sessions)"""
+        with self._lock:
+            resident = sum(1 for entry in self._sessions.values() if entry["state"] == "resident")
+            return resident, len(self._sessions) - resident
+
+    def print_stats(self):
+        """Report how many sessions are in memory and what hibernation saved"""
+        resident, hibernated = self.counts()
+        print(f"SESSIONS: {resident} actief, {hibernated} gepauzeerd, "
+              f"{self.stats['controls_released']} controls vrijgegeven, "
+              f"{self.stats['hibernated']} keer gepauzeerd, {self.stats['restored']} keer hersteld, "
+              f"snapshots {self.stats['snapshot_bytes'] / 1024:.1f} KB, "
+              f"geheugen vrijgegeven {self.stats['memory_released'] / 1024 ** 2:.1f} MB")
+
+    def _run(self):
+        while not self._stop_event.wait(self.check_interval):
+            # One failing session must not stop hibernation for all others
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"ERROR: Zoeken naar inactieve sessies mislukt: {str(e)}")
+
+
+def process_memory():
+    """Resident memory of this process in bytes, or None where it cannot be read"""
+    try:
+        with open("/proc/self/statm", 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    if os.name == 'nt':
+        import ctypes
+        from ctypes import wintypes
+        
+        class Counters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                (name, ctypes.c_size_t) for name in (
+                    "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                    "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")]
+        
+        counters = Counters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+    return None
+
+
+def release_memory():
+    """Collect dropped sessions and hand freed heap pages back to the OS where the C library allows it"""
+    gc.collect()
+    try:
+        import ctypes
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
+def make_server_session(data_root, hibernator=None):
+    """Return the Flet target for server mode: one PortfolioManager per browser session.
+    
+    A browser is recognised by a random token in its local storage; that token
+    names the directory with the user's data (users/<token>/) and the one its
+    generated documents are served from (downloads/<token>/). The translations and learning
+    outcomes are shared by all sessions (see TRANSLATIONS / LEARNING_OUTCOMES),
+    and so are the link checker and the GitHub harvester with their caches.
+    """
+    link_checker = LinkChecker(os.path.join(data_root, "link_cache.json"))
+    repo_harvester = RepoHarvester(os.path.join(data_root, "github_cache.json"))
+    
+    def start(page, data_dir, token, state=None):
+        app = PortfolioManager(page, data_dir=data_dir, download_dir=os.path.join(data_root, "downloads", token),
+                               download_url=f"/{token}/", link_checker=link_checker,
+                               repo_harvester=repo_harvester, local_repos=False)
+        if hibernator is not None:
+            hibernator.register(app, lambda page, state: start(page, data_dir, token, state))
+            page.on_close = lambda e: hibernator.unregister(page.session_id)
+        else:
+            def on_close(e):
+                # The session expired; stop its background threads
+                app.data_watcher.stop()
+                app.drafts.stop()
+            page.on_close = on_close
+        if state is not None:
+            app.data_loaded.wait(timeout=60)
+            app.restore_session_state(state)
+        app.request_update()
+        app.ui.flush()
+        return app
+    
+    def server_session(page: ft.Page):
+        mark_startup("flet_session_start")
+        token = page.client_storage.get("portfolio_user")
+        # The browser controls this value, so it must never be used as a path as-is
+        if not (isinstance(token, str) and re.fullmatch(r"[0-9a-f]{32}", token)):
+            token = uuid.uuid4().hex
+            page.client_storage.set("portfolio_user", token)
+        data_dir = os.path.join(data_root, "users", token)
+        os.makedirs(data_dir, exist_ok=True)
+        os.makedirs(os.path.join(data_root, "downloads", token), exist_ok=True)
+        start(page, data_dir, token)
+        mark_startup("first_page_update")
+    
+    return server_session
+
+
+def cli_value(name, default):
+    """Return the value after a --name option on the command line, or default"""
+    if name in sys.argv[:-1]:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+def run_server():
+    """Serve the app to browsers (python main_flet.py --server [--port 8550] [--data-root DIR])"""
+    port = int(cli_value("--port", "8550"))
+    data_root = os.path.abspath(cli_value("--data-root", "portfolio_server_data"))
+    os.makedirs(os.path.join(data_root, "users"), exist_ok=True)
+    os.makedirs(os.path.join(data_root, "downloads"), exist_ok=True)
+    idle_minutes = float(os.environ.get("PORTFOLIO_IDLE_MINUTES", "30"))
+    hibernator = SessionHibernator(idle_minutes * 60)
+    hibernator.start()
+    print(f"Portfolio server op poort {port}, gegevens in {data_root}, "
+          f"sessies worden na {idle_minutes:g} minuten zonder activiteit gepauzeerd")
+    # Only generated documents are served, from /<token>/ (the token is the user's secret);
+    # data files, snapshots and the shared caches stay outside the served directory
+    safe_flet_app(
+        target=make_server_session(data_root, hibernator),
+        view=ft.AppView.WEB_BROWSER,
+        port=port,
+        assets_dir=os.path.join(data_root, "downloads")
+    )
+
+
 def safe_flet_app(target, view, **kwargs):
     """Safely start Flet app"""
     print("Starting Flet application...")
+    mark_startup("flet_app_start")
     return ft.app(target=target, view=view, **kwargs)
 
 if __name__ == "__main__":
@@ -2492,6 +5937,10 @@ if __name__ == "__main__":
     print("Starting Portfolio Document Manager...")
     print("=" * 50)
     
+    if "--server" in sys.argv:
+        run_server()
+        sys.exit(0)
+    
     # Check environment
     check_environment()
     
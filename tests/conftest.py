@@ -0,0 +1,128 @@
+import asyncio
+import http.server
+import itertools
+import json
+import os
+import sys
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft  # noqa: E402
+from flet.core.connection import Connection  # noqa: E402
+from flet.core.protocol import CommandEncoder  # noqa: E402
+
+
+def pytest_addoption(parser):
+    parser.addoption("--slow", action="store_true", help="also run the load tests marked slow")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: load test that takes minutes; run with --slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--slow"):
+        return
+    skip = pytest.mark.skip(reason="load test, run with --slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip)
+
+
+class FakeConnection(Connection):
+    """Answers the commands of a page like the Flet client would, without a client.
+    
+    sent_bytes counts the size of the batches as they would go over the wire.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._ids = itertools.count(1)
+        self.sent_bytes = 0
+
+    def send_commands(self, session_id, commands):
+        self.sent_bytes += len(json.dumps(commands, cls=CommandEncoder, separators=(",", ":")))
+        results = [" ".join(f"_{next(self._ids)}" for _ in command.commands)
+                   for command in commands if command.name == "add"]
+        return types.SimpleNamespace(results=results, error="")
+
+    def send_command(self, session_id, command):
+        return types.SimpleNamespace(result="", error="")
+
+
+@pytest.fixture
+def page():
+    """A page whose event loop runs on its own thread, so page.run_thread dispatches like Flet does"""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    executor = ThreadPoolExecutor(max_workers=8)
+    page = ft.Page(FakeConnection(), "test-session", loop, executor)
+    yield page
+    executor.shutdown(wait=True)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@pytest.fixture
+def app(page, tmp_path):
+    import main_flet
+    
+    app = main_flet.PortfolioManager(page, data_dir=str(tmp_path))
+    assert app.data_loaded.wait(timeout=30)
+    yield app
+    app.data_watcher.stop()
+    app.drafts.stop()
+
+
+class LocalServer:
+    """http.server on a free local port; routes map a path prefix to handler(method, path, headers)"""
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []  # (method, path, headers)
+        server = self
+        
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def respond(self):
+                headers = {name.lower(): value for name, value in self.headers.items()}
+                server.requests.append((self.command, self.path, headers))
+                route = next((handler for prefix, handler in server.routes.items()
+                              if self.path.startswith(prefix)), None)
+                status, response_headers, body = route(self.command, self.path, headers) if route else (404, {}, b"")
+                self.send_response(status)
+                for name, value in response_headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+            
+            do_GET = do_HEAD = respond
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self._server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def http_server():
+    server = LocalServer()
+    yield server
+    server.close()
@@ -0,0 +1,117 @@
+import gc
+import os
+import random
+import statistics
+import time
+import tracemalloc
+
+import pytest
+
+import main_flet
+
+
+def make_items(count):
+    return [{"id": main_flet.new_item_id(), "title": f"Item {i}", "feedback": []} for i in range(count)]
+
+
+def random_command(items, rng, size):
+    """An edit, delete or add command built the way the app builds them"""
+    kind = rng.choice(["edit", "delete", "add"])
+    if kind == "add" or not items:
+        new = make_items(size)
+        return {"items": [(len(items) + i, None, item) for i, item in enumerate(new)], "records": {}}
+    positions = sorted(rng.sample(range(len(items)), min(size, len(items))))
+    if kind == "edit":
+        changes = [(i, items[i], dict(items[i], title=items[i]["title"] + " bewerkt")) for i in positions]
+    else:
+        changes = [(i, items[i], None) for i in positions]
+    return {"items": changes, "records": {}}
+
+
+@pytest.mark.parametrize("size", [3, 150])  # the index fast path and the id-matching path
+def test_undo_and_redo_round_trip(size):
+    rng = random.Random(size)
+    history = main_flet.CommandLog()
+    items = make_items(300)
+    states = [list(items)]
+    for _ in range(20):
+        command = random_command(items, rng, size)
+        items, applied = main_flet.patch_items(items, command["items"])
+        assert len(applied) == len(command["items"])
+        history.record(command)
+        states.append(list(items))
+    
+    for state in reversed(states[:-1]):
+        items, _ = main_flet.patch_items(items, history.undo()["items"])
+        assert items == state
+    assert history.undo() is None
+    for state in states[1:]:
+        items, _ = main_flet.patch_items(items, history.redo()["items"])
+        assert items == state
+
+
+def test_undo_leaves_items_changed_elsewhere_alone():
+    items = make_items(5)
+    deleted = items[2]
+    items, _ = main_flet.patch_items(items, [(2, deleted, None)])
+    # Another program adds the item back before the undo
+    items.insert(0, deleted)
+    restored, applied = main_flet.patch_items(items, main_flet.invert_command(
+        {"items": [(2, deleted, None)], "records": {}})["items"])
+    assert restored == items
+    assert applied == []
+
+
+def large_portfolio_app(app, count):
+    app.execute_command(records={"student_info": {"name": "Student", "student_number": "1"}})
+    items = [{"id": main_flet.new_item_id(), "title": f"Item {i}", "description": "Beschrijving " * 20,
+              "learning_outcomes": [1 + i % 9], "feedback": [{"feedback_from": "Docent", "feedback_text": "Goed " * 20}]}
+             for i in range(count)]
+    app.execute_command([(i, None, item) for i, item in enumerate(items)])
+    return app
+
+
+def test_memory_per_edit_follows_the_change_not_the_portfolio(app, record_property):
+    edits = 20
+    large_portfolio_app(app, 2000)
+    portfolio_bytes = os.path.getsize(app.data_file)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        for position in range(edits):
+            item = app.portfolio_items[position]
+            app.execute_command([(position, item, dict(item, title=f"Bewerkt {position}"))])
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    retained_per_edit = (current - before) / edits
+    record_property("retained_bytes_per_edit", round(retained_per_edit))
+    record_property("peak_bytes_during_edits", peak - before)
+    print(f"2000 items ({portfolio_bytes // 1024} KB): {retained_per_edit:.0f} bytes per bewerking bewaard, "
+          f"piek {(peak - before) // 1024} KB")
+    # The history keeps one changed item per edit; the portfolio is neither copied nor re-read
+    assert retained_per_edit < 5000
+    assert peak - before < portfolio_bytes / 2
+
+
+def test_undo_latency_on_a_large_portfolio(app, record_property):
+    large_portfolio_app(app, 2000)
+    for position in range(0, 2000, 100):
+        item = app.portfolio_items[position]
+        app.execute_command([(position, item, dict(item, title="Bewerkt"))])
+    
+    timings = []
+    for _ in range(20):
+        started = time.perf_counter()
+        app.undo()
+        timings.append(time.perf_counter() - started)
+    assert all(item["title"] != "Bewerkt" for item in app.portfolio_items)
+    
+    median = statistics.median(timings)
+    record_property("undo_latency_ms", round(1000 * median, 1))
+    print(f"2000 items: ongedaan maken in {1000 * median:.1f} ms (mediaan)")
+    assert median < 0.5
@@ -0,0 +1,86 @@
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+
+import flet as ft
+
+import main_flet
+from conftest import FakeConnection
+
+WRITERS = 8
+ITEMS_PER_WRITER = 15
+
+
+def writer(data_dir, number, shared_id, ready, timings):
+    """One app instance adding its own items and editing an item all writers share"""
+    page = ft.Page(FakeConnection(), f"writer-{number}", asyncio.new_event_loop())
+    app = main_flet.PortfolioManager(page, data_dir=data_dir)
+    app.data_loaded.wait(timeout=30)
+    ready.wait(timeout=60)
+    started = time.time()
+    try:
+        for j in range(ITEMS_PER_WRITER):
+            with app._data_lock:
+                item = {"id": main_flet.new_item_id(), "title": f"writer {number} item {j}", "feedback": []}
+                app.execute_command([(len(app.portfolio_items), None, item)])
+        with app._data_lock:
+            index = app.find_item_index(shared_id)
+            shared = app.portfolio_items[index]
+            feedback = shared["feedback"] + [{"feedback_from": f"writer {number}"}]
+            app.execute_command([(index, shared, dict(shared, feedback=feedback))])
+        timings.put((started, time.time()))
+    finally:
+        app.data_watcher.stop()
+        app.drafts.stop()
+
+
+def test_concurrent_processes_lose_no_writes(tmp_path, record_property):
+    shared_id = main_flet.new_item_id()
+    data_file = tmp_path / "portfolio_data.json"
+    data_file.write_text(json.dumps({
+        "student_info": {"name": "Student"},
+        "portfolio_items": [{"id": shared_id, "title": "Gedeeld", "feedback": [], "version": 1}]
+    }), encoding="utf-8")
+    
+    context = multiprocessing.get_context("spawn")
+    # The writers start saving together, once every process has loaded the app
+    ready = context.Barrier(WRITERS)
+    timings = context.Queue()
+    processes = [context.Process(target=writer, args=(str(tmp_path), number, shared_id, ready, timings))
+                 for number in range(WRITERS)]
+    for process in processes:
+        process.start()
+    spans = [timings.get(timeout=120) for _ in processes]
+    for process in processes:
+        process.join(timeout=120)
+        assert process.exitcode == 0
+    elapsed = max(end for _, end in spans) - min(start for start, _ in spans)
+    saves_per_second = WRITERS * (ITEMS_PER_WRITER + 1) / elapsed
+    record_property("saves_per_second", round(saves_per_second))
+    print(f"{WRITERS} processen: {saves_per_second:.0f} opslagen per seconde")
+    
+    data = json.loads(data_file.read_text(encoding="utf-8"))
+    titles = [item["title"] for item in data["portfolio_items"]]
+    assert len(titles) == len(set(titles)) == WRITERS * ITEMS_PER_WRITER + 1
+    assert all(item["version"] >= 1 for item in data["portfolio_items"])
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+    # Feedback added to the same item by every writer is merged entry by entry
+    shared = next(item for item in data["portfolio_items"] if item["id"] == shared_id)
+    assert sorted(entry["feedback_from"] for entry in shared["feedback"]) == \
+        sorted(f"writer {number}" for number in range(WRITERS))
+
+
+def test_records_changed_on_both_sides_are_merged_by_field():
+    base = {"id": "a", "title": "Oud", "description": "Tekst", "feedback": [{"feedback_from": "docent"}]}
+    local = dict(base, title="Nieuw", feedback=base["feedback"] + [{"feedback_from": "hier"}])
+    remote = dict(base, description="Andere tekst", feedback=[{"feedback_from": "daar"}])
+    
+    merged, conflict = main_flet.merge_record(base, local, remote)
+    assert not conflict
+    assert merged == {"id": "a", "title": "Nieuw", "description": "Andere tekst",
+                      "feedback": [{"feedback_from": "daar"}, {"feedback_from": "hier"}]}
+    
+    merged, conflict = main_flet.merge_record(base, dict(base, title="Hier"), dict(base, title="Daar"))
+    assert conflict and merged["title"] == "Daar"
@@ -0,0 +1,46 @@
+import time
+import types
+
+import main_flet
+
+
+def test_settled_form_is_reported_once(tmp_path):
+    settled = []
+    store = main_flet.DraftStore(str(tmp_path / "drafts.json"), on_settled=settled.append)
+    field = types.SimpleNamespace(value="")
+    store.track("form", {"text": field})
+    store.snapshot()
+    store.snapshot()
+    assert settled == []  # nothing typed yet
+    
+    field.value = "Eerste"
+    store.snapshot()
+    assert settled == []  # still being typed in
+    field.value = "Eerste zin"
+    store.snapshot()
+    store.snapshot()
+    store.snapshot()
+    assert settled == ["form"]
+    assert store.drafts == {"form": {"text": "Eerste zin"}}
+
+
+def test_reflection_preview_follows_the_draft_tick(app):
+    app.execute_command(records={"student_info": {"name": "Student", "student_number": "1"}})
+    app.show_submit_document_view()
+    fields = app.preview["fields"]
+    # No handler runs per keystroke; typing only changes the value of the field
+    assert all(field.on_change is None and field.on_blur is not None for field in fields.values())
+    
+    def preview_shows(text):
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            if any(text in (control.data or "") for control in app.preview["sections"].values()):
+                return True
+            time.sleep(0.05)
+        return False
+    
+    assert preview_shows("Student")  # the first render when the view opens
+    fields["proud_of"].value = "Trots op de testomgeving"
+    app.drafts.snapshot()
+    app.drafts.snapshot()
+    assert preview_shows("Trots op de testomgeving")
@@ -0,0 +1,123 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import main_flet
+
+
+def test_server_sessions_do_not_scan_local_paths(page, tmp_path):
+    app = main_flet.PortfolioManager(page, data_dir=str(tmp_path), local_repos=False)
+    assert app.data_loaded.wait(timeout=30)
+    try:
+        item = {"id": main_flet.new_item_id(), "title": "Server", "local_repo": "/etc", "feedback": []}
+        app.execute_command([(0, None, item)])
+        app.scan_git_evidence()
+        assert app._git_scan_thread is None
+        assert app.git_evidence == {}
+        assert len(app.portfolio_row_values(app.portfolio_items[0])) == len(app.build_table_columns()) - 1
+    finally:
+        app.data_watcher.stop()
+        app.drafts.stop()
+
+
+def git(repo, *args, author="Alice"):
+    env = dict(os.environ, GIT_AUTHOR_NAME=author, GIT_AUTHOR_EMAIL=f"{author}@example.com",
+               GIT_COMMITTER_NAME=author, GIT_COMMITTER_EMAIL=f"{author}@example.com",
+               GIT_AUTHOR_DATE="2025-03-01T12:00:00", GIT_COMMITTER_DATE="2025-03-01T12:00:00")
+    return subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True, text=True, env=env).stdout.strip()
+
+
+def commit(repo, name, content, author="Alice"):
+    path = repo / name
+    if isinstance(content, bytes):
+        path.write_bytes(content)
+    else:
+        path.write_text(content)
+    git(repo, "add", name)
+    git(repo, "commit", "-q", "-m", f"Change {name}", author=author)
+    return git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    if shutil.which("git") is None:
+        pytest.skip("git is niet geïnstalleerd")
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git(repo, "init", "-q", "-b", "main")
+    return repo
+
+
+def head_from_git_dir(repo, monkeypatch):
+    """head_commit of repo, failing if it has to start git instead of reading the .git directory"""
+    with monkeypatch.context() as m:
+        m.setattr(main_flet.subprocess, "run", lambda *args, **kwargs: pytest.fail("git gestart"))
+        return main_flet.GitEvidenceScanner.head_commit(str(repo))
+
+
+def test_head_commit_reads_loose_packed_and_detached_refs(repo, monkeypatch):
+    assert main_flet.GitEvidenceScanner.head_commit(str(repo)) is None  # no commits yet
+    first = commit(repo, "a.txt", "a\n")
+    second = commit(repo, "b.txt", "b\n")
+    
+    assert head_from_git_dir(repo, monkeypatch) == second
+    
+    git(repo, "pack-refs", "--all")
+    assert not (repo / ".git" / "refs" / "heads" / "main").exists()
+    assert head_from_git_dir(repo, monkeypatch) == second
+    
+    git(repo, "checkout", "-q", "--detach", first)
+    assert head_from_git_dir(repo, monkeypatch) == first
+
+
+def test_head_commit_of_a_worktree(repo, tmp_path):
+    first = commit(repo, "a.txt", "a\n")
+    worktree = tmp_path / "worktree"
+    git(repo, "worktree", "add", "-q", "-b", "feature", str(worktree))
+    assert (worktree / ".git").is_file()
+    assert main_flet.GitEvidenceScanner.head_commit(str(worktree)) == first
+    
+    second = commit(worktree, "b.txt", "b\n")
+    assert main_flet.GitEvidenceScanner.head_commit(str(worktree)) == second
+    assert main_flet.GitEvidenceScanner.head_commit(str(repo)) == first
+
+
+def test_collect_parses_numstat(repo):
+    commit(repo, "a.txt", "one\ntwo\nthree\n", author="Alice")
+    commit(repo, "a.txt", "one\n2\nthree\nfour\n", author="Bob")
+    commit(repo, "b.txt", "b\n", author="Alice")
+    commit(repo, "image.bin", b"\x00\x01\x02", author="Alice")
+    
+    stats = main_flet.GitEvidenceScanner(str(repo / "cache.json")).collect(str(repo))
+    assert stats == {
+        "commits": 4,
+        "authors": ["Alice", "Bob"],
+        "first_commit": "2025-03-01",
+        "last_commit": "2025-03-01",
+        "files_changed": 3,
+        "insertions": 3 + 2 + 1,  # the binary file has no line counts
+        "deletions": 1
+    }
+
+
+def test_unchanged_head_is_not_scanned_again(repo, tmp_path, monkeypatch):
+    commit(repo, "a.txt", "a\n")
+    cache_path = str(tmp_path / "git_cache.json")
+    scanner = main_flet.GitEvidenceScanner(cache_path)
+    first = scanner.scan([str(repo)])
+    assert first[str(repo)]["commits"] == 1
+    assert scanner.stats == {"scanned": 1, "cached": 0}
+    
+    # A new scanner reads the cache from disk and does not run git log
+    scanner = main_flet.GitEvidenceScanner(cache_path)
+    monkeypatch.setattr(scanner, "collect", lambda path: pytest.fail("opnieuw gescand"))
+    assert scanner.scan([str(repo)]) == first
+    assert scanner.stats == {"scanned": 0, "cached": 1}
+    monkeypatch.undo()
+    
+    # A new commit moves HEAD, so the repository is scanned again
+    commit(repo, "b.txt", "b\n")
+    assert scanner.scan([str(repo)])[str(repo)]["commits"] == 2
+    assert scanner.stats == {"scanned": 1, "cached": 1}
@@ -0,0 +1,46 @@
+import copy
+
+import main_flet
+
+
+def make_item(title, version=None):
+    item = {"id": main_flet.new_item_id(), "title": title, "learning_outcomes": [1], "feedback": []}
+    if version is not None:
+        item["version"] = version
+    return item
+
+
+def test_stamp_replaces_changed_items_with_copies():
+    saved = make_item("Opgeslagen", version=3)
+    edited = dict(saved, title="Bewerkt")
+    unchanged = make_item("Gelijk", version=1)
+    new = make_item("Nieuw")
+    items = [edited, unchanged, new]
+    originals = copy.deepcopy(items)
+    
+    stamped = main_flet.stamp_item_versions(items, {saved["id"]: saved, unchanged["id"]: dict(unchanged)})
+    
+    assert [item.get("version") for item in items] == [4, 1, 1]
+    assert items[0] is not edited and items[2] is not new
+    assert items[1] is unchanged
+    assert stamped == [items[0], items[2]]
+    assert [edited, unchanged, new] == originals
+
+
+def test_saving_keeps_the_undo_history_intact(app):
+    item = make_item("Eerste versie")
+    app.execute_command([(0, None, item)])
+    app.execute_command([(0, app.portfolio_items[0], dict(app.portfolio_items[0], title="Tweede versie"))])
+    history = copy.deepcopy([command["items"] for command in app.history.undo_stack])
+    
+    app.save_data()
+    assert [command["items"] for command in app.history.undo_stack] == history
+    
+    app.undo()
+    assert app.portfolio_items[0]["title"] == "Eerste versie"
+    app.redo()
+    assert app.portfolio_items[0]["title"] == "Tweede versie"
+    versions = app.portfolio_items[0]["version"]
+    app.undo()
+    assert app.portfolio_items[0]["version"] > versions
+    assert [command["items"] for command in app.history.redo_stack] == history[1:]
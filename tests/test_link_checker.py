@@ -0,0 +1,66 @@
+import json
+
+import main_flet
+
+
+def pages(method, path, headers):
+    """A site with working, removed, HEAD-less and temporarily failing pages"""
+    if path.startswith("/gone"):
+        return 404, {}, b""
+    if path.startswith("/nohead") and method == "HEAD":
+        return 405, {}, b""
+    etag = f'"{path}"'
+    if headers.get("if-none-match") == etag:
+        return 304, {"ETag": etag}, b""
+    return 200, {"ETag": etag}, b"<html>repository</html>"
+
+
+def flaky(responses):
+    def handler(method, path, headers):
+        return responses.pop(0) if responses else (200, {}, b"")
+    return handler
+
+
+def make_checker(tmp_path, **kwargs):
+    return main_flet.LinkChecker(str(tmp_path / "link_cache.json"),
+                                 pool=main_flet.HttpPool(backoff=0.01), **kwargs)
+
+
+def test_links_are_checked_and_cached(http_server, tmp_path):
+    http_server.routes["/"] = pages
+    links = [f"{http_server.url}/repo/{i}" for i in range(30)]
+    links += [f"{http_server.url}/gone/1", f"{http_server.url}/nohead/1", "github.com/zonder/schema"]
+    
+    results = make_checker(tmp_path).check(links + links[:5])
+    assert len(results) == len(links)
+    assert all(results[link]["ok"] for link in links[:30])
+    assert results[f"{http_server.url}/gone/1"]["status"] == 404
+    assert results[f"{http_server.url}/nohead/1"]["ok"]
+    assert not results["github.com/zonder/schema"]["ok"]
+    assert len(http_server.requests) == 33  # one per link, plus the GET after the refused HEAD
+    
+    # A new checker reads the results from disk and sends nothing within the TTL
+    http_server.requests.clear()
+    assert make_checker(tmp_path).check(links) == results
+    assert http_server.requests == []
+    
+    # After the TTL an unchanged page costs a conditional request answered with 304
+    checker = make_checker(tmp_path, ttl=0)
+    again = checker.check(links[:30])
+    assert all(again[link]["ok"] for link in links[:30])
+    assert all(headers.get("if-none-match") for _, _, headers in http_server.requests)
+
+
+def test_failing_links_are_retried_and_not_cached(http_server, tmp_path):
+    http_server.routes["/flaky"] = flaky([(503, {}, b""), (503, {"Retry-After": "0"}, b"")])
+    http_server.routes["/down"] = lambda method, path, headers: (500, {}, b"")
+    checker = make_checker(tmp_path)
+    
+    results = checker.check([f"{http_server.url}/flaky", f"{http_server.url}/down"])
+    assert results[f"{http_server.url}/flaky"]["ok"]
+    assert results[f"{http_server.url}/down"]["status"] == 500
+    assert checker.pool.stats["retries"] == 4
+    
+    cache = json.loads((tmp_path / "link_cache.json").read_text(encoding="utf-8"))
+    assert f"{http_server.url}/flaky" in cache
+    assert f"{http_server.url}/down" not in cache
@@ -0,0 +1,83 @@
+import statistics
+import time
+
+import pytest
+
+import main_flet
+
+
+def test_rows_are_reused_by_item_id(app):
+    items = [{"id": main_flet.new_item_id(), "title": f"Item {i}", "learning_outcomes": [1], "feedback": []}
+             for i in range(5)]
+    app.execute_command([(i, None, item) for i, item in enumerate(items)])
+    app.show_main_view()
+    rows = {item["id"]: row for item, row in zip(app.portfolio_items, app.portfolio_data_table.rows)}
+    
+    first, second = app.portfolio_items[0], app.portfolio_items[1]
+    app.execute_command([(0, first, dict(first, title="Hernoemd")), (1, second, None)])
+    app.reconcile_portfolio_rows()
+    
+    table_rows = app.portfolio_data_table.rows
+    assert [row.cells[0].content.value for row in table_rows] == [item["title"] for item in app.portfolio_items]
+    assert all(row is rows[item["id"]] for item, row in zip(app.portfolio_items, table_rows))
+    assert second["id"] not in app._row_cache
+
+
+def test_editing_one_of_1000_items_sends_only_that_row(app, page, record_property):
+    app.execute_command(records={"student_info": {"name": "Student", "student_number": "1"}})
+    items = [{"id": main_flet.new_item_id(), "title": f"Item {i:04}", "description": "Beschrijving " * 10,
+              "learning_outcomes": [1 + i % 9], "is_group_work": i % 3 == 0, "feedback": []}
+             for i in range(1000)]
+    app.execute_command([(i, None, item) for i, item in enumerate(items)])
+    app.show_main_view()
+    app.ui.flush()
+    
+    timings = []
+    sent = []
+    for position in range(0, 25, 5):
+        item = app.portfolio_items[position]
+        page.connection.sent_bytes = 0
+        started = time.perf_counter()
+        # What saving the edit form does
+        app.execute_command([(position, item, dict(item, title=item["title"] + " (bewerkt)"))])
+        app.show_main_view()
+        app.ui.flush()
+        timings.append(time.perf_counter() - started)
+        sent.append(page.connection.sent_bytes)
+    
+    record_property("bytes_per_edit", max(sent))
+    record_property("edit_latency_ms", round(1000 * statistics.median(timings), 1))
+    print(f"1000 items: {max(sent)} bytes per bewerking, mediaan {1000 * statistics.median(timings):.1f} ms")
+    # The changed cell, not the page of rows or the attention card
+    assert max(sent) < 200
+
+
+def test_sort_index_follows_add_edit_and_delete(app, monkeypatch):
+    items = [{"id": main_flet.new_item_id(), "title": title, "learning_outcomes": [lo], "feedback": []}
+             for title, lo in (("Bravo", 3), ("alpha", 1), ("Delta", 2))]
+    app.execute_command([(i, None, item) for i, item in enumerate(items)])
+    app.sort_column = "title"
+    # Listing the table uses the index as it is, without going over all items
+    monkeypatch.setattr(app.sort_index, "refresh", lambda items: pytest.fail("volledige refresh"))
+    
+    def check():
+        rebuilt = main_flet.SortIndex(app.sort_index.key_functions)
+        rebuilt.refresh(app.portfolio_items)
+        for column in app.sort_columns:
+            for ascending in (True, False):
+                app.sort_column, app.sort_ascending = column, ascending
+                assert app.visible_portfolio_items() == rebuilt.ordered_items(column, ascending)
+        assert app.sort_index.verify(app.portfolio_items) == []
+    
+    check()
+    app.execute_command([(3, None, {"id": main_flet.new_item_id(), "title": "Charlie", "learning_outcomes": [9],
+                                    "is_group_work": True, "feedback": []})])
+    check()
+    first = app.portfolio_items[0]
+    app.execute_command([(0, first, dict(first, title="Zulu", feedback=[{"text": "Goed"}]))])
+    check()
+    app.execute_command([(1, app.portfolio_items[1], None)])
+    check()
+    app.undo()
+    check()
+    assert [item["title"] for item in app.sort_index.ordered_items("title")] == ["alpha", "Charlie", "Delta", "Zulu"]
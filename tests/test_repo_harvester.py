@@ -0,0 +1,77 @@
+import datetime
+import json
+import time
+
+import main_flet
+
+
+class FakeGitHub:
+    """The commits endpoint of the GitHub API with ETags and a rate limit"""
+
+    def __init__(self, remaining=5000):
+        self.remaining = remaining
+
+    def __call__(self, method, path, headers):
+        repo = "/".join(path.split("?")[0].split("/")[2:4])
+        limits = {"X-RateLimit-Remaining": str(max(0, self.remaining - 1)),
+                  "X-RateLimit-Reset": str(int(time.time()) + 3600)}
+        if self.remaining == 0:
+            return 403, limits, b'{"message": "API rate limit exceeded"}'
+        self.remaining -= 1
+        if repo.startswith("gone/"):
+            return 404, limits, b"{}"
+        etag = f'"{repo}"'
+        if headers.get("if-none-match") == etag:
+            return 304, dict(limits, ETag=etag), b""
+        today = datetime.date.today()
+        # One commit every three days: ten of them in the last four weeks
+        commits = [{"commit": {"committer": {"date": f"{today - datetime.timedelta(days=3 * k)}T10:00:00Z"}}}
+                   for k in range(40)]
+        return 200, dict(limits, ETag=etag), json.dumps(commits).encode()
+
+
+def make_harvester(http_server, tmp_path, name="github_cache.json", **kwargs):
+    return main_flet.RepoHarvester(str(tmp_path / name), api_url=http_server.url, token="geheim",
+                                   pool=main_flet.HttpPool(backoff=0.01), **kwargs)
+
+
+def test_github_repo_links():
+    assert main_flet.github_repo("https://github.com/a/b/tree/main/src") == "a/b"
+    assert main_flet.github_repo("https://www.github.com/a/b.git") == "a/b"
+    assert main_flet.github_repo("https://gitlab.com/a/b") is None
+    assert main_flet.github_repo(None) is None
+
+
+def test_activity_is_harvested_and_revalidated(http_server, tmp_path):
+    http_server.routes["/repos/"] = FakeGitHub()
+    repos = {f"student{i}/api" for i in range(25)} | {"gone/repo"}
+    
+    activity = make_harvester(http_server, tmp_path).harvest(repos)
+    assert activity["gone/repo"] == {"last_commit": None, "commits_4_weeks": 0}
+    assert activity["student1/api"] == {"last_commit": datetime.date.today().isoformat(), "commits_4_weeks": 10}
+    assert len(http_server.requests) == len(repos)
+    assert all(headers["authorization"] == "Bearer geheim" for _, _, headers in http_server.requests)
+    
+    http_server.requests.clear()
+    assert make_harvester(http_server, tmp_path).harvest(repos) == activity
+    assert http_server.requests == []
+    
+    harvester = make_harvester(http_server, tmp_path, ttl=0)
+    assert harvester.harvest(repos) == activity
+    assert harvester.stats["not_modified"] == len(repos) - 1  # the 404 has no ETag
+
+
+def test_harvest_stops_at_the_rate_limit(http_server, tmp_path):
+    http_server.routes["/repos/"] = FakeGitHub(remaining=5)
+    repos = {f"student{i}/web" for i in range(40)}
+    harvester = make_harvester(http_server, tmp_path)
+    
+    activity = harvester.harvest(repos)
+    answered = [repo for repo, stats in activity.items() if stats["last_commit"]]
+    assert len(answered) == 5
+    assert len(http_server.requests) < 5 + harvester.pool.per_host
+    
+    # Blocked until the reset time: the next harvest sends nothing
+    http_server.requests.clear()
+    harvester.harvest(repos - set(answered))
+    assert http_server.requests == []
@@ -0,0 +1,148 @@
+"""Load test of server mode: memory per session and event latency with many users.
+
+    python -m pytest tests/test_server_load.py --slow -s
+
+PORTFOLIO_LOAD_USERS (default 200) and PORTFOLIO_LOAD_ITEMS (default 200 per
+user) set the size of the run; every user clicks ACTIONS_PER_USER times at
+random moments, on average PORTFOLIO_LOAD_THINK seconds (default 5) apart. The numbers are printed and recorded as
+properties of the test (pytest --junitxml).
+"""
+import asyncio
+import os
+import random
+import statistics
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import flet as ft
+import pytest
+
+import main_flet
+from conftest import FakeConnection
+
+USERS = int(os.environ.get("PORTFOLIO_LOAD_USERS", "200"))
+ITEMS = int(os.environ.get("PORTFOLIO_LOAD_ITEMS", "200"))
+THINK_SECONDS = float(os.environ.get("PORTFOLIO_LOAD_THINK", "5"))
+ACTIONS_PER_USER = 5
+
+
+def portfolio(rng):
+    return [{
+        "id": main_flet.new_item_id(),
+        "title": f"Item {i}",
+        "description": "Requirements analyse " * 5,
+        "github_link": "https://github.com/student/project",
+        "learning_outcomes": rng.sample(range(1, 10), 2),
+        "is_group_work": rng.random() < 0.3,
+        "date_added": "2025-01-01",
+        "feedback": []
+    } for i in range(ITEMS)]
+
+
+def user_action(app, kind, rng):
+    """The handler of one click or key press"""
+    if kind == "filter":
+        app.filter_learning_outcome.value = str(rng.randint(1, 9))
+        app.apply_table_filters()
+    elif kind == "search":
+        app.search_field.value = "requirements"
+        app.run_search()
+    elif kind == "edit":
+        position = rng.randrange(len(app.portfolio_items))
+        item = app.portfolio_items[position]
+        app.execute_command([(position, item, dict(item, title=item["title"] + "!"))])
+        app.show_main_view()
+    else:
+        app.show_dashboard_view()
+        app.show_main_view()
+
+
+@pytest.mark.slow
+def test_many_concurrent_sessions(tmp_path, monkeypatch, record_property):
+    # One event loop and one handler pool for all sessions, like the Flet server
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4))
+    monkeypatch.setattr(ft.Page, "client_storage", property(
+        lambda self: types.SimpleNamespace(get=lambda key: None, set=lambda key, value: None)))
+    hibernator = main_flet.SessionHibernator(idle_seconds=3600)
+    server_session = main_flet.make_server_session(str(tmp_path), hibernator)
+    rng = random.Random(1)
+    
+    main_flet.release_memory()
+    memory_before = main_flet.process_memory()
+    started = time.perf_counter()
+    pages = []
+    for user in range(USERS):
+        page = ft.Page(FakeConnection(), f"user-{user}", loop, executor)
+        server_session(page)
+        pages.append(page)
+    apps = [hibernator._sessions[page.session_id]["app"] for page in pages]
+    for app in apps:
+        assert app.data_loaded.wait(timeout=60)
+    startup = time.perf_counter() - started
+    for thread in threading.enumerate():
+        if thread.name == "load-data":
+            thread.join()
+    for app in apps:
+        items = portfolio(rng)
+        app.execute_command([(i, None, item) for i, item in enumerate(items)],
+                            records={"student_info": {"name": "Student", "student_number": "1"}})
+        with app._data_lock, app.ui.tree_lock:
+            app.show_main_view()
+        app.ui.flush()
+    main_flet.release_memory()
+    memory_after = main_flet.process_memory()
+    
+    # Latency runs from the moment of the click to its flushed update
+    latencies = []
+    done = threading.Semaphore(0)
+    lock = threading.Lock()
+    
+    def handler(app, kind, queued):
+        def run(e):
+            try:
+                user_action(app, kind, random.Random(id(e)))
+            finally:
+                app.ui.flush()
+                with lock:
+                    latencies.append((kind, time.perf_counter() - queued))
+                done.release()
+        return run
+    
+    kinds = ["filter", "search", "edit", "dashboard"]
+    clicks = sorted((rng.uniform(0, ACTIONS_PER_USER * THINK_SECONDS), user, rng.choice(kinds))
+                    for user in range(USERS) for _ in range(ACTIONS_PER_USER))
+    started = time.perf_counter()
+    for at, user, kind in clicks:
+        delay = started + at - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        apps[user].page.run_thread(handler(apps[user], kind, started + at), object())
+    for _ in range(ACTIONS_PER_USER * USERS):
+        assert done.acquire(timeout=300)
+    wall = time.perf_counter() - started
+    executor.shutdown(wait=True)
+    loop.call_soon_threadsafe(loop.stop)
+    for page in pages:
+        hibernator.unregister(page.session_id)
+    
+    timings = sorted(latency for _, latency in latencies)
+    p50, p95, p99 = (timings[min(len(timings) - 1, int(q * len(timings)))] for q in (0.5, 0.95, 0.99))
+    print(f"\n{USERS} sessies met {ITEMS} items gestart in {startup:.1f} s")
+    if memory_before is not None and memory_after is not None:
+        per_session = (memory_after - memory_before) / USERS
+        record_property("memory_per_session_mb", round(per_session / 1024 ** 2, 2))
+        record_property("sessions_per_gb", round(1024 ** 3 / per_session))
+        print(f"geheugen per sessie {per_session / 1024 ** 2:.2f} MB -> {1024 ** 3 / per_session:.0f} sessies per GB")
+    print(f"{len(timings)} acties in {wall:.1f} s ({len(timings) / wall:.0f}/s): "
+          f"p50 {1000 * p50:.0f} ms, p95 {1000 * p95:.0f} ms, p99 {1000 * p99:.0f} ms")
+    for kind in kinds:
+        values = [latency for action, latency in latencies if action == kind]
+        print(f"  {kind:10s} mediaan {1000 * statistics.median(values):.0f} ms")
+    record_property("actions_per_second", round(len(timings) / wall))
+    record_property("latency_p95_ms", round(1000 * p95))
+    assert len(timings) == ACTIONS_PER_USER * USERS
+    assert p95 < 2.0
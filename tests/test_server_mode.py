@@ -0,0 +1,37 @@
+import os
+import types
+
+import main_flet
+
+
+def test_only_generated_documents_are_served(page, tmp_path, monkeypatch):
+    storage = {}
+    monkeypatch.setattr(type(page), "client_storage", property(
+        lambda self: types.SimpleNamespace(get=storage.get, set=storage.__setitem__)))
+    hibernator = main_flet.SessionHibernator(idle_seconds=3600)
+    main_flet.make_server_session(str(tmp_path), hibernator)(page)
+    app = hibernator._sessions[page.session_id]["app"]
+    try:
+        assert app.data_loaded.wait(timeout=30)
+        app.student_info = {"name": "Student"}
+        app.save_data()
+        
+        def generate_pdf(markdown_filename):
+            with open(markdown_filename.replace('.md', '.pdf'), 'wb') as f:
+                f.write(b"%PDF")
+        
+        launched = []
+        app.generate_pdf = generate_pdf
+        app.page.launch_url = launched.append
+        app.write_documents()
+        
+        token = storage["portfolio_user"]
+        served = os.path.join(str(tmp_path), "downloads")
+        served_files = [os.path.relpath(os.path.join(root, name), served)
+                        for root, _, names in os.walk(served) for name in names]
+        assert len(served_files) == 1
+        assert served_files[0].startswith(token + os.sep) and served_files[0].endswith(".pdf")
+        assert launched == ["/" + served_files[0].replace(os.sep, "/")]
+        assert os.path.exists(os.path.join(str(tmp_path), "users", token, "portfolio_data.json"))
+    finally:
+        hibernator.unregister(page.session_id)
@@ -0,0 +1,110 @@
+import asyncio
+import os
+import threading
+
+import flet as ft
+
+import main_flet
+from conftest import FakeConnection
+
+
+def wait_for_loaders():
+    """The loaders still open the first-time setup after the data is in, which counts as activity"""
+    for thread in threading.enumerate():
+        if thread.name == "load-data":
+            thread.join()
+
+
+def hibernated_session(app, start):
+    wait_for_loaders()
+    hibernator = main_flet.SessionHibernator(idle_seconds=60)
+    hibernator.register(app, start)
+    app.last_activity -= 3600
+    hibernator.sweep()
+    assert hibernator.counts() == (0, 1)
+    return hibernator
+
+
+def restart(page, data_dir):
+    def start(page, state):
+        app = main_flet.PortfolioManager(page, data_dir=data_dir)
+        start.hibernator.register(app, start)
+        app.data_loaded.wait(timeout=30)
+        app.restore_session_state(state)
+        start.apps.append(app)
+        return app
+    start.apps = []
+    return start
+
+
+def test_failed_restore_keeps_the_snapshot_and_can_be_retried(app, page):
+    start = restart(page, app.data_dir)
+    hibernator = start.hibernator = hibernated_session(app, start)
+    snapshot = hibernator._sessions[page.session_id]["snapshot"]
+    
+    def broken(page, state):
+        raise OSError("schijf vol")
+    
+    hibernator._sessions[page.session_id]["start"] = broken
+    hibernator.wake(page.session_id)
+    assert os.path.exists(snapshot)
+    assert hibernator.counts() == (0, 1)
+    assert len(page.controls) == 1  # the "paused" message is back
+    
+    hibernator._sessions[page.session_id]["start"] = start
+    page.controls[0].on_click(None)
+    assert not os.path.exists(snapshot)
+    assert hibernator.counts() == (1, 0)
+    assert hibernator._sessions[page.session_id]["app"] is start.apps[0]
+    start.apps[0].data_watcher.stop()
+    start.apps[0].drafts.stop()
+
+
+def test_sweep_during_restore_skips_the_waking_session(app, page):
+    start = restart(page, app.data_dir)
+    hibernator = start.hibernator = hibernated_session(app, start)
+    
+    def sweeping_start(page, state):
+        hibernator.sweep()
+        assert hibernator.counts() == (0, 1)
+        return start(page, state)
+    
+    hibernator._sessions[page.session_id]["start"] = sweeping_start
+    hibernator.wake(page.session_id)
+    hibernator.wake(page.session_id)  # a second click after the restore does nothing
+    assert hibernator.counts() == (1, 0)
+    assert len(start.apps) == 1
+    start.apps[0].data_watcher.stop()
+    start.apps[0].drafts.stop()
+
+
+def test_sessions_sharing_a_data_directory_keep_their_own_snapshot(app, page, capsys):
+    # With student info known, a restored session does not open the first-time setup
+    app.execute_command(records={"student_info": {"name": "Student", "student_number": "1"}})
+    other_page = ft.Page(FakeConnection(), "second-tab", asyncio.new_event_loop())
+    other = main_flet.PortfolioManager(other_page, data_dir=app.data_dir)
+    assert other.data_loaded.wait(timeout=30)
+    wait_for_loaders()
+    hibernator = main_flet.SessionHibernator(idle_seconds=60)
+    starts = {}
+    for session, view in ((app, app.show_dashboard_view), (other, other.show_student_info_view)):
+        view()
+        starts[session.page.session_id] = start = restart(session.page, app.data_dir)
+        start.hibernator = hibernator
+        hibernator.register(session, start)
+        session.last_activity -= 3600
+    
+    hibernator.sweep()
+    assert hibernator.counts() == (0, 2)
+    snapshots = {entry["snapshot"] for entry in hibernator._sessions.values()}
+    assert len(snapshots) == 2 and all(os.path.exists(snapshot) for snapshot in snapshots)
+    assert "geheugen vrijgegeven" in capsys.readouterr().out
+    
+    for session_id, view in ((page.session_id, "dashboard"), ("second-tab", "student_info")):
+        hibernator.wake(session_id)
+        assert starts[session_id].apps[0].current_view == view
+    assert hibernator.counts() == (2, 0)
+    assert not any(os.path.exists(snapshot) for snapshot in snapshots)
+    for start in starts.values():
+        start.apps[0].data_watcher.stop()
+        start.apps[0].drafts.stop()
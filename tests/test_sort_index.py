@@ -0,0 +1,62 @@
+import random
+
+import main_flet
+
+
+KEY_FUNCTIONS = {
+    "title": lambda item: item["title"].casefold(),
+    "score": lambda item: item["score"],
+}
+
+
+def expected_ids(items, name, ascending=True):
+    """The order a full sort gives; ties are broken by id, as in the index"""
+    key_function = KEY_FUNCTIONS[name]
+    ordered = [item["id"] for item in sorted(items, key=lambda item: (key_function(item), item["id"]))]
+    return ordered if ascending else ordered[::-1]
+
+
+def test_incremental_updates_match_sorted():
+    # Many rounds of random inserts, key edits, edits that keep the key and deletes
+    rng = random.Random(20250301)
+    for _ in range(50):
+        index = main_flet.SortIndex(KEY_FUNCTIONS)
+        items = {}
+        for step in range(200):
+            action = rng.random()
+            if action < 0.4 or not items:
+                item = {"id": f"{rng.randrange(10 ** 6):06}", "title": rng.choice("abcABC") * rng.randint(1, 3),
+                        "score": rng.randint(0, 5), "version": 1}
+                items[item["id"]] = item
+                index.update_item(item)
+            elif action < 0.8:
+                old = items[rng.choice(sorted(items))]
+                # A new dict, as the app never changes a stored item in place
+                new = dict(old, version=old["version"] + 1)
+                # Most edits change a sort key, the rest only the version
+                if rng.random() < 0.5:
+                    new["title"] = rng.choice("abcABC") * rng.randint(1, 3)
+                if rng.random() < 0.5:
+                    new["score"] = rng.randint(0, 5)
+                items[new["id"]] = new
+                index.update_item(new)
+            else:
+                index.remove_item(items.pop(rng.choice(sorted(items)))["id"])
+            for name in KEY_FUNCTIONS:
+                for ascending in (True, False):
+                    assert index.ordered_ids(name, ascending) == expected_ids(items.values(), name, ascending)
+            assert all(item is items[item["id"]] for item in index.ordered_items("score"))
+        assert index.verify(list(items.values())) == []
+
+
+def test_bulk_refresh_matches_sorted():
+    rng = random.Random(7)
+    items = [{"id": f"{i:04}", "title": rng.choice(["x", "Y", "z"]), "score": rng.randint(0, 3)} for i in range(600)]
+    index = main_flet.SortIndex(KEY_FUNCTIONS)
+    index.refresh(items)
+    for item in rng.sample(items, 50):
+        items[items.index(item)] = dict(item, score=item["score"] + 1)
+    del items[::7]
+    index.refresh(items)
+    for name in KEY_FUNCTIONS:
+        assert index.ordered_ids(name) == expected_ids(items, name)
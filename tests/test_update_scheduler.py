@@ -0,0 +1,126 @@
+import sys
+import threading
+import time
+
+import main_flet
+
+
+def record_update_errors(page):
+    """Wrap page.update so failures on any thread are collected instead of lost in a pool thread"""
+    errors = []
+    update = page.update
+    
+    def checked(*controls):
+        try:
+            update(*controls)
+        except Exception as e:
+            errors.append(e)
+            raise
+    
+    page.update = checked
+    return errors
+
+
+def test_handlers_and_background_flushes_do_not_race(app, page):
+    errors = record_update_errors(page)
+    views = [app.show_dashboard_view, app.show_all_feedback_view, app.show_student_info_view,
+             app.show_learning_outcomes_info, app.show_add_portfolio_item_view, app.show_submit_document_view]
+    handled = threading.Semaphore(0)
+    stop = threading.Event()
+    
+    def background():
+        # What the search timer and the data watcher do: request an update of the whole page
+        while not stop.is_set():
+            with app._data_lock, app.ui.tree_lock:
+                app.request_update()
+            app.ui.flush()
+    
+    def handler(view):
+        def run(e):
+            try:
+                view(e)
+            except Exception as ex:
+                errors.append(ex)
+            finally:
+                handled.release()
+        return run
+    
+    # Switch threads often so a walk of the tree and a handler overlap if they can
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    flusher = threading.Thread(target=background, daemon=True)
+    flusher.start()
+    rounds = 100
+    try:
+        for _ in range(rounds):
+            for view in views:
+                page.run_thread(handler(view), None)
+        for _ in range(rounds * len(views)):
+            assert handled.acquire(timeout=30)
+    finally:
+        stop.set()
+        flusher.join()
+        sys.setswitchinterval(interval)
+    assert errors == []
+
+
+def test_handler_updates_are_sent_before_it_returns(app, page):
+    sent = []
+    update = page.update
+    page.update = lambda *controls: (sent.append(controls), update(*controls))
+    done = threading.Event()
+    
+    def handler(e):
+        app.show_dashboard_view()
+        sent.clear()
+        app.request_update()
+        done.set()
+    
+    page.run_thread(handler, None)
+    assert done.wait(timeout=30)
+    # The flush happens on the handler thread, right after the handler
+    deadline = time.monotonic() + 5
+    while not sent and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sent
+    assert app.ui._timer is None
+
+
+def test_pdf_is_rendered_without_holding_the_locks(app, page):
+    rendering = threading.Event()
+    release = threading.Event()
+    finished = []
+    
+    def generate_pdf(markdown_filename):
+        rendering.set()
+        assert release.wait(timeout=30)
+        with open(markdown_filename.replace('.md', '.pdf'), 'wb') as f:
+            f.write(b"%PDF")
+    
+    app.generate_pdf = generate_pdf
+    done = threading.Event()
+    page.run_thread(lambda e: app.generate_documents(on_finished=lambda ok: (finished.append(ok), done.set())), None)
+    assert rendering.wait(timeout=30)
+    # Another handler of the session runs while the PDF is still being rendered
+    handled = threading.Event()
+    page.run_thread(lambda e: (app.show_dashboard_view(), handled.set()), None)
+    assert handled.wait(timeout=5)
+    release.set()
+    assert done.wait(timeout=30)
+    assert finished == [True]
+
+
+def test_connection_is_wrapped_once_for_all_schedulers(page):
+    send_commands = page.connection.send_commands
+    try:
+        schedulers = [main_flet.UpdateScheduler(page, stats=True) for _ in range(3)]
+        wrapped = page.connection.send_commands
+        assert wrapped is not send_commands
+        # A session that hibernates and wakes again does not add a layer
+        schedulers[-1].detach_events()
+        main_flet.UpdateScheduler(page, stats=True)
+        assert page.connection.send_commands is wrapped
+        assert list(page.connection.portfolio_byte_counters) == [page.session_id]
+    finally:
+        page.connection.send_commands = send_commands
+        del page.connection.portfolio_byte_counters